@@ -1,2 +1,9 @@
 # Calendar AI Game App
+from pathlib import Path as _Path
 
+# 로컬 개발용 .env 로드 (모든 app 모듈의 설정보다 먼저 실행)
+# 환경 변수를 직접 주입하는 배포 환경(Vercel 등)에는 .env가 없으므로 python-dotenv를 import하지 않습니다.
+_ENV_FILE = _Path(__file__).resolve().parent.parent / ".env"
+if _ENV_FILE.is_file():
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
@@ -1,23 +1,133 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Awaitable, Callable, TypeVar, AsyncIterator
+from contextlib import asynccontextmanager, AsyncExitStack
 from datetime import datetime
+import asyncio
 import random
-import json
-import os
+import time
 from app.models.game_models import (
     GameState, EncounterTarget, DiceRoll, DailyStoryContext, ActionType
 )
 from app.models.narrative_models import NarrativeMemory, EncounterSummary
 from app.services import game_logic
-from app.services import llm_service
 from app.services import storage_service
+from app.services import encounter_data
+from app.services import delta_protocol
+from app.services import session_store
+from app.services import campaign_index
+from app.services import campaign_statistics
+from app.services import json_codec
+from app.services.json_codec import FastJSONResponse
+from app.services import log_service
+from app.services import tracing
+from app.middleware import compression
+# llm_service(httpx 포함)는 서버리스 콜드 스타트를 줄이기 위해 LLM을 호출하는 함수 안에서 import
 
-router = APIRouter(prefix="/api/game", tags=["game"])
+router = APIRouter(prefix="/api/game", tags=["game"], route_class=tracing.TracedRoute)
+
+logger = log_service.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+async def _timed(timings: Dict[str, float], stage: str, awaitable: Awaitable[T]) -> T:
+    """awaitable을 실행하고 소요 시간(ms)을 timings[stage]에 기록"""
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def _format_server_timing(timings: Dict[str, float]) -> str:
+    """단계별 소요 시간을 Server-Timing 헤더 형식으로 변환"""
+    return ", ".join(f"{stage};dur={duration}" for stage, duration in timings.items())
+
+
+def _format_sse(event: str, payload: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 이벤트 문자열 생성"""
+    return f"event: {event}\ndata: {json_codec.dumps_str(payload)}\n\n"
+
+
+@tracing.traced("delta.start")
+def _start_delta(data: Dict[str, Any], base_revision: Optional[int]) -> delta_protocol.DeltaTracker:
+    """
+    game_data 변경 추적 시작 (game_data를 변경하기 전에 호출)
+    
+    통계 블록이 없는 기존 세이브는 추적을 시작한 뒤 백필하므로, 추가된 통계 블록도 응답(패치)에 포함됩니다.
+    """
+    try:
+        delta = delta_protocol.DeltaTracker(data, base_revision)
+    except delta_protocol.DeltaConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    try:
+        if campaign_statistics.ensure_statistics(data):
+            logger.info("통계 블록이 없는 세이브를 백필했습니다.")
+    except delta_protocol.DeltaSliceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return delta
+
+
+def _require_full_chapters(delta: delta_protocol.DeltaTracker, data: Dict[str, Any], *month_names: str) -> None:
+    """delta 모드에서 처리에 필요한 월 챕터가 슬라이스에 모두 포함되어 있는지 확인"""
+    if not delta.is_delta:
+        return
+    try:
+        delta_protocol.require_full_chapters(data, month_names)
+    except delta_protocol.DeltaSliceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@tracing.traced("campaign_index.get")
+def _campaign_index(campaign_id: Optional[str], data: Dict[str, Any]) -> campaign_index.CampaignIndex:
+    """
+    게임 데이터의 기록 인덱스
+    
+    서버 캠페인 저장소의 캠페인은 저장소에 보관된 인덱스를 증분 갱신하여 재사용하고,
+    클라이언트가 보낸 game_data는 요청마다 한 번 생성합니다.
+    """
+    if campaign_id:
+        return session_store.get_campaign_store().index(campaign_id, data)
+    return campaign_index.CampaignIndex.build(data)
+
+
+@asynccontextmanager
+async def _game_data_session(campaign_id: Optional[str], game_data: Optional[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    변경 요청에서 사용할 게임 데이터 준비
+    
+    - campaign_id가 있으면 서버 캠페인 저장소에서 로드하고, 처리하는 동안 캠페인 lock을 보유합니다.
+      정상 종료 시 직렬화한 데이터를 쓰기 대기열에 등록한 뒤 lock을 해제하고 기록을 기다리며,
+      오류 시 캐시된 (일부 변경되었을 수 있는) 데이터를 버립니다.
+    - 없으면 클라이언트가 보낸 game_data를 그대로 사용합니다.
+    """
+    if not campaign_id:
+        if not game_data:
+            raise HTTPException(status_code=400, detail="game_data가 필요합니다.")
+        yield game_data
+        return
+    
+    store = session_store.get_campaign_store()
+    async with store.lock(campaign_id):
+        try:
+            data = await store.get(campaign_id)
+        except session_store.CampaignNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        try:
+            yield data
+        except BaseException:
+            store.discard(campaign_id)
+            raise
+        written = await store.stage(campaign_id, data)
+    # 영구 저장소 기록은 lock 밖에서 기다림 (기다리는 동안 다음 요청의 저장과 병합될 수 있음)
+    await written
 
 
 class StartGameRequest(BaseModel):
     player_name: Optional[str] = "John Miller"
+    use_campaign_store: bool = False  # True이면 서버 캠페인 저장소에 저장하고 campaign_id 반환
     # campaign_year는 더 이상 사용하지 않음 (항상 1925)
 
 
@@ -30,27 +140,35 @@ class EncounterRequest(BaseModel):
     green_dice_symbols: List[str]  # ["COMBAT", "SEARCH"]
     cthulhu_symbol_count: int = 0  # 크툴루 기호 개수 (0~3)
     is_forced_failure: bool = False  # 강제 실패 플래그
-    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달
+    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달 (delta 모드에서는 슬라이스)
+    base_revision: Optional[int] = None  # 지정 시 전체 game_data 대신 변경 패치만 반환
+    campaign_id: Optional[str] = None  # 지정 시 game_data 대신 서버 캠페인 저장소의 데이터 사용
 
 
 class MonthEndRequest(BaseModel):
     new_rules_unlocked: List[str] = []
     story_revelation: str = ""
-    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달
+    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달 (delta 모드에서는 슬라이스)
+    base_revision: Optional[int] = None  # 지정 시 전체 game_data 대신 변경 패치만 반환
+    campaign_id: Optional[str] = None  # 지정 시 game_data 대신 서버 캠페인 저장소의 데이터 사용
 
 
 class MonthStartRequest(BaseModel):
     new_rules_unlocked: List[str] = []
     story_revelation: str = ""
-    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달
+    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달 (delta 모드에서는 슬라이스)
+    base_revision: Optional[int] = None  # 지정 시 전체 game_data 대신 변경 패치만 반환
+    campaign_id: Optional[str] = None  # 지정 시 game_data 대신 서버 캠페인 저장소의 데이터 사용
 
 
 class MonthConclusionRequest(BaseModel):
     month: str  # "January"
-    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달
+    game_data: Optional[Dict[str, Any]] = None  # 클라이언트에서 게임 데이터 전달 (delta 모드에서는 슬라이스)
+    base_revision: Optional[int] = None  # 지정 시 전체 game_data 대신 변경 패치만 반환
+    campaign_id: Optional[str] = None  # 지정 시 game_data 대신 서버 캠페인 저장소의 데이터 사용
 
 
-@router.post("/start")
+@router.post("/start", response_class=FastJSONResponse)
 async def start_game(request: StartGameRequest):
     """새 게임 시작 (프롤로그 반환) - 항상 1925년으로 생성"""
     # 연도는 항상 1925로 고정
@@ -71,14 +189,20 @@ async def start_game(request: StartGameRequest):
     data["campaign_history"]["prologue"]["date"] = prologue_date
     data["campaign_history"]["prologue"]["is_finalized"] = True  # LLM이 생성했으므로 완료 상태로 설정
     
+    # 서버 캠페인 저장소 사용 시 저장 후 campaign_id 반환
+    campaign_id = None
+    if request.use_campaign_store:
+        campaign_id = await session_store.get_campaign_store().create(data)
+    
     # 클라이언트에서 저장하도록 전체 게임 데이터 반환
-    return {
+    return FastJSONResponse({
         "success": True,
         "prologue": ai_prologue,
         "game_state": data["current_state"],
         "campaign_year": campaign_year,
+        "campaign_id": campaign_id,
         "game_data": data  # 클라이언트에서 저장할 전체 데이터 (프롤로그 포함)
-    }
+    })
 
 
 @router.get("/state")
@@ -101,8 +225,13 @@ async def get_game_state_get():
 @router.post("/state")
 async def get_game_state(request: Optional[Dict[str, Any]] = None):
     """현재 게임 상태 조회 (POST - 클라이언트에서 게임 데이터 전달)"""
-    # 요청에서 게임 데이터 받기 (없으면 빈 데이터)
-    if request and "game_data" in request:
+    # 요청에서 게임 데이터 받기 (서버 캠페인 저장소 또는 클라이언트 전달, 없으면 빈 데이터)
+    if request and request.get("campaign_id"):
+        try:
+            data = await session_store.get_campaign_store().get(request["campaign_id"])
+        except session_store.CampaignNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+    elif request and "game_data" in request:
         data = request["game_data"]
     else:
         # 호환성을 위해 빈 게임 데이터 반환
@@ -162,7 +291,7 @@ async def get_game_state(request: Optional[Dict[str, Any]] = None):
                 weekly_progress["completed_days_in_week"] = []
                 current_state["weekly_progress"] = weekly_progress
     except Exception as e:
-        print(f"현재 날짜 계산 실패: {e}")
+        logger.warning("현재 날짜 계산 실패: %s", e)
         current_state = data.get("current_state", {})
     
     return {
@@ -173,13 +302,22 @@ async def get_game_state(request: Optional[Dict[str, Any]] = None):
     }
 
 
-@router.post("/encounter")
-async def process_encounter(request: EncounterRequest):
-    """조우 처리 (주사위 결과 입력, 스토리 생성)"""
-    # 클라이언트에서 게임 데이터 받기
-    if not request.game_data:
-        raise HTTPException(status_code=400, detail="game_data가 필요합니다.")
-    data = request.game_data
+@tracing.traced("encounter.prepare")
+def _prepare_encounter(request: EncounterRequest, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    조우 처리의 LLM 호출 전 단계 (검증, 판정, 내러티브 메모리 구성)
+
+    /encounter와 /encounter/stream이 공유하며, 입력 오류는 HTTPException으로
+    스트리밍 응답이 시작되기 전에 발생합니다.
+
+    Args:
+        request: 조우 요청
+        data: 게임 데이터 (클라이언트 전달 또는 서버 캠페인 저장소)
+
+    Returns:
+        LLM 생성 및 결과 반영 단계에서 사용하는 값들의 딕셔너리
+    """
+    delta = _start_delta(data, request.base_revision)
     
     # 현재 상태 로드
     current_state = data.get("current_state", {})
@@ -194,6 +332,9 @@ async def process_encounter(request: EncounterRequest):
     except ValueError:
         raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다.")
     
+    # 대상 날짜 월(내러티브 메모리)과 오늘 날짜 월(일기 추가)의 챕터를 사용
+    _require_full_chapters(delta, data, target_date_obj.strftime("%B"), current_date_obj.strftime("%B"))
+    
     # 강제 실패가 아닌 경우에만 현재 주 확인
     if not request.is_forced_failure:
         # 현재 주에 속하는지 확인
@@ -239,7 +380,8 @@ async def process_encounter(request: EncounterRequest):
     )
     
     # 게임 로직 처리
-    outcome = game_logic.calculate_outcome(context)
+    with tracing.span("game_logic.calculate_outcome"):
+        outcome = game_logic.calculate_outcome(context)
     
     # 강제 실패인 경우 결과를 실패로 강제 설정
     if request.is_forced_failure:
@@ -259,6 +401,9 @@ async def process_encounter(request: EncounterRequest):
     if outcome["is_success"]:
         game_state = game_logic.update_weekly_success(game_state, True)
     
+    # 캠페인 기록 인덱스 (날짜 파싱/분류를 한 번만 수행)
+    index = _campaign_index(request.campaign_id, data)
+    
     # 내러티브 메모리 구성
     weekly_log = []
     last_entry_snippet = None
@@ -269,11 +414,10 @@ async def process_encounter(request: EncounterRequest):
         chapter = storage_service.get_current_month_chapter(data, month_name)
         daily_entries = chapter.get("daily_entries", [])
         
-        # 이번 주의 엔트리만 필터링
+        # 이번 주의 엔트리만 필터링 (대상 날짜 월의 챕터에 속한 엔트리)
         week_start = game_logic.get_week_start(current_date_obj)
-        for entry in daily_entries:
-            entry_date = datetime.strptime(entry["diary_write_date"], "%Y-%m-%d").date()
-            if week_start <= entry_date <= current_date_obj:
+        for entry_date, entry in index.entries_in_week(current_date_obj):
+            if week_start <= entry_date <= current_date_obj and entry_date.month == target_date_obj.month:
                 summary = EncounterSummary(
                     date=entry["diary_write_date"],
                     target_name=entry["game_logic_snapshot"]["target_name"],
@@ -292,36 +436,30 @@ async def process_encounter(request: EncounterRequest):
                 if sentences:
                     last_entry_snippet = sentences[-1].strip() + "."
     except Exception as e:
-        print(f"내러티브 메모리 구성 중 오류: {e}")
+        logger.warning("내러티브 메모리 구성 중 오류: %s", e)
     
     # 당월 주간 요약 추출
     current_month_weekly_summaries = []
     try:
-        weekly_records = data.get("legacy_inventory", {}).get("weekly_records", [])
-        for weekly_record in weekly_records:
-            week_end_date_str = weekly_record.get("week_end_date", "")
-            if week_end_date_str:
-                week_end_date_obj = datetime.strptime(week_end_date_str, "%Y-%m-%d").date()
-                # 현재 날짜와 같은 월/년도인지 확인
-                if week_end_date_obj.year == current_date_obj.year and week_end_date_obj.month == current_date_obj.month:
-                    # summary_line과 weekly_summary를 결합하여 추가
-                    sunday_encounter = weekly_record.get("sunday_encounter", {})
-                    summary_line = sunday_encounter.get("summary_line", "")
-                    weekly_summary = weekly_record.get("weekly_summary", "")
-                    
-                    # 두 정보를 결합하여 하나의 요약으로 생성
-                    if summary_line and weekly_summary:
-                        combined_summary = f"{weekly_summary} 일요일 조우: {summary_line}"
-                    elif summary_line:
-                        combined_summary = f"일요일 조우: {summary_line}"
-                    elif weekly_summary:
-                        combined_summary = weekly_summary
-                    else:
-                        combined_summary = f"주 {weekly_record.get('week_number', '?')} 기록"
-                    
-                    current_month_weekly_summaries.append(combined_summary)
+        for weekly_record in index.weekly_records_ending_in(current_date_obj.year, current_date_obj.month):
+            # summary_line과 weekly_summary를 결합하여 추가
+            sunday_encounter = weekly_record.get("sunday_encounter", {})
+            summary_line = sunday_encounter.get("summary_line", "")
+            weekly_summary = weekly_record.get("weekly_summary", "")
+            
+            # 두 정보를 결합하여 하나의 요약으로 생성
+            if summary_line and weekly_summary:
+                combined_summary = f"{weekly_summary} 일요일 조우: {summary_line}"
+            elif summary_line:
+                combined_summary = f"일요일 조우: {summary_line}"
+            elif weekly_summary:
+                combined_summary = weekly_summary
+            else:
+                combined_summary = f"주 {weekly_record.get('week_number', '?')} 기록"
+            
+            current_month_weekly_summaries.append(combined_summary)
     except Exception as e:
-        print(f"당월 주간 요약 추출 중 오류: {e}")
+        logger.warning("당월 주간 요약 추출 중 오류: %s", e)
     
     memory = NarrativeMemory(
         weekly_log=weekly_log,
@@ -335,69 +473,26 @@ async def process_encounter(request: EncounterRequest):
     # 캠페인 연도 가져오기
     campaign_year = data.get("save_file_info", {}).get("campaign_year", 1925)
     
-    # 성공률 계산 (해당 월 기준)
-    sunday_success_count = 0
-    sunday_total_count = 0
-    overall_success_count = 0
-    overall_total_count = 0
-    
-    try:
-        month_name = target_date_obj.strftime("%B")
-        chapter = storage_service.get_current_month_chapter(data, month_name)
-        daily_entries = chapter.get("daily_entries", [])
-        
-        # 전체 조우 성공률 계산
-        for entry in daily_entries:
-            entry_date = datetime.strptime(entry["diary_write_date"], "%Y-%m-%d").date()
-            if entry_date.year == current_date_obj.year and entry_date.month == current_date_obj.month:
-                overall_total_count += 1
-                if entry["game_logic_snapshot"].get("is_success", False):
-                    overall_success_count += 1
-                
-                # 일요일 조우 성공률 계산
-                if entry.get("day_of_week") == "Sunday":
-                    sunday_total_count += 1
-                    if entry["game_logic_snapshot"].get("is_success", False):
-                        sunday_success_count += 1
-        
-        # weekly_records에서도 일요일 조우 확인
-        weekly_records = data.get("legacy_inventory", {}).get("weekly_records", [])
-        for weekly_record in weekly_records:
-            week_end_date_str = weekly_record.get("week_end_date", "")
-            if week_end_date_str:
-                week_end_date_obj = datetime.strptime(week_end_date_str, "%Y-%m-%d").date()
-                if week_end_date_obj.year == current_date_obj.year and week_end_date_obj.month == current_date_obj.month:
-                    sunday_enc = weekly_record.get("sunday_encounter", {})
-                    if sunday_enc:
-                        # daily_entries에 이미 집계된 경우 중복 제거
-                        already_counted = False
-                        for entry in daily_entries:
-                            entry_date = datetime.strptime(entry["diary_write_date"], "%Y-%m-%d").date()
-                            if entry.get("day_of_week") == "Sunday" and entry_date == week_end_date_obj:
-                                already_counted = True
-                                break
-                        if not already_counted:
-                            sunday_total_count += 1
-                            if sunday_enc.get("is_success", False):
-                                sunday_success_count += 1
-    except Exception as e:
-        print(f"성공률 계산 중 오류: {e}")
+    # 성공률 계산 (현재 월 통계 기준)
+    # 대상 날짜가 다른 월이면 일일 엔트리는 제외하고 주간 기록의 일요일 조우만 집계
+    month_stats = campaign_statistics.get_month(
+        data, campaign_statistics.month_key(current_date_obj.year, current_date_obj.month)
+    )
+    if target_date_obj.month == current_date_obj.month:
+        sunday_success_count = month_stats["sunday_success_count"]
+        sunday_total_count = month_stats["sunday_total_count"]
+        overall_success_count = month_stats["success_count"]
+        overall_total_count = month_stats["total_entries"]
+    else:
+        sunday_success_count = month_stats["weekly_sunday_success_count"]
+        sunday_total_count = month_stats["weekly_sunday_total_count"]
+        overall_success_count = 0
+        overall_total_count = 0
     
     # 성공률 계산 (0으로 나누기 방지)
     sunday_success_rate = sunday_success_count / sunday_total_count if sunday_total_count > 0 else 0.0
     overall_success_rate = overall_success_count / overall_total_count if overall_total_count > 0 else 0.0
     
-    # 스토리 생성
-    narrative_text = await llm_service.generate_daily_story(
-        context, 
-        memory, 
-        campaign_year,
-        sunday_success_rate=sunday_success_rate,
-        overall_success_rate=overall_success_rate,
-        sunday_total_count=sunday_total_count
-    )
-    summary_line = await llm_service.generate_summary_line(narrative_text)
-    
     # 일기 작성 날짜 결정
     # today_date는 일기를 쓰지 않은 가장 최근 날짜이므로, 이를 일기 작성 날짜로 사용
     # target_date는 일기 작성 날짜 결정에 영향을 주지 않음
@@ -416,54 +511,117 @@ async def process_encounter(request: EncounterRequest):
     # 조우 실패 시, 이전에 해결하지 못한 조우의 target_name을 무작위로 선택
     if not outcome["is_success"]:
         try:
-            # weekly_records의 모든 주차에서 실패한 조우 수집
-            failed_encounters = []
-            weekly_records = data.get("legacy_inventory", {}).get("weekly_records", [])
-            
-            for weekly_record in weekly_records:
-                key_encounters = weekly_record.get("key_encounters", [])
-                for encounter in key_encounters:
-                    # outcome이 "실패"이고, target_name이 "선택되지 않은 조우"가 아닌 경우만 수집
-                    if (encounter.get("outcome") == "실패" and 
-                        encounter.get("target_name") and 
-                        encounter.get("target_name") != "선택되지 않은 조우"):
-                        failed_encounters.append(encounter.get("target_name"))
+            # weekly_records의 모든 주차에서 실패한 조우 (인덱스에 미리 수집됨)
+            failed_encounters = index.failed_target_names
             
             # 실패한 조우가 있으면 무작위로 하나 선택
             if failed_encounters:
                 visual_description = random.choice(failed_encounters)
-                print(f"실패 조우 무작위 선택: {visual_description} (후보 {len(failed_encounters)}개 중)")
+                logger.debug("실패 조우 무작위 선택: %s (후보 %d개 중)", visual_description, len(failed_encounters))
         except Exception as e:
-            print(f"실패 조우 선택 중 오류: {e}")
+            logger.warning("실패 조우 선택 중 오류: %s", e)
             # 오류 발생 시 기존 로직 유지
     
     # 일요일 조우인 경우, 실패하더라도 target_name이 올바르게 설정되도록 보장
     # 일요일 조우는 항상 target_date를 기반으로 daily_encounter_data에서 올바른 조우 정보를 가져옴
     if is_sunday_boss:
-        # 일요일 조우인 경우, target_date를 기반으로 조우 데이터에서 찾기
+        # 일요일 조우인 경우, target_date를 기반으로 조우 데이터 인덱스에서 찾기
         try:
-            game_data_path = os.path.join("data", "daily_encounter_data_1.json")
-            if os.path.exists(game_data_path):
-                with open(game_data_path, "r", encoding="utf-8") as f:
-                    encounter_data = json.load(f)
-                    # target_date에서 월일 추출 (MM-DD 형식)
-                    month_day = target_date_obj.strftime("%m-%d")
-                    encounter = encounter_data.get("encounters", {}).get(month_day)
-                    if encounter:
-                        # 일요일 조우는 항상 daily_encounter_data에서 가져온 값을 사용
-                        visual_description = encounter.get("visual_description", request.visual_description)
-                    elif not visual_description or visual_description == "선택되지 않은 조우":
-                        # 조우 데이터가 없고 visual_description도 없으면 원래 값 유지
-                        pass
-            elif not visual_description or visual_description == "선택되지 않은 조우":
-                # 파일이 없고 visual_description도 없으면 원래 값 유지
-                pass
-        except Exception as e:
-            print(f"일요일 조우 데이터 로드 실패: {e}")
-            # 실패 시 visual_description이 비어있거나 기본값이 아니면 원래 값 유지
-            if not visual_description or visual_description == "선택되지 않은 조우":
-                # 에러 발생 시에도 기본값이면 원래 값 유지
-                pass
+            encounter = encounter_data.get_dataset().get_for_date(target_date_obj)
+            if encounter:
+                # 일요일 조우는 항상 daily_encounter_data에서 가져온 값을 사용
+                visual_description = encounter.get("visual_description", request.visual_description)
+        except encounter_data.EncounterDataError as e:
+            # 실패 시 요청의 visual_description 유지
+            logger.warning("일요일 조우 데이터 로드 실패: %s", e.detail)
+    
+    # 주간 요약 입력 준비 (일요일 조우 결과와 주간 주요 조우는 스토리 생성 전에 이미 확정됨)
+    is_week_closing = game_logic.should_reset_weekly_progress(diary_write_date_obj)
+    key_encounters = []
+    if is_week_closing:
+        for log_entry in weekly_log:
+            key_encounters.append({
+                "date": log_entry.date,
+                "target_name": log_entry.target_name,
+                "outcome": log_entry.outcome,
+                "summary_line": log_entry.key_narrative
+            })
+
+    return {
+        "data": data,
+        "context": context,
+        "memory": memory,
+        "campaign_year": campaign_year,
+        "sunday_success_rate": sunday_success_rate,
+        "overall_success_rate": overall_success_rate,
+        "sunday_total_count": sunday_total_count,
+        "outcome": outcome,
+        "game_state": game_state,
+        "visual_description": visual_description,
+        "diary_write_date_obj": diary_write_date_obj,
+        "diary_write_date_str": diary_write_date_str,
+        "diary_write_day_of_week": diary_write_day_of_week,
+        "is_week_closing": is_week_closing,
+        "key_encounters": key_encounters,
+        "index": index,
+        "delta": delta
+    }
+
+
+async def _generate_weekly_summary(plan: Dict[str, Any], timings: Dict[str, float]) -> Optional[str]:
+    """
+    주간 요약 생성 (일요일에만)
+
+    일요일 조우 결과와 주간 주요 조우는 스토리 생성 전에 확정되므로
+    스토리 생성과 동시에 실행할 수 있습니다.
+    """
+    from app.services import llm_service
+    if not plan["is_week_closing"]:
+        return None
+    sunday_prompt_encounter = {
+        "date": plan["diary_write_date_str"],
+        "target_name": plan["visual_description"],
+        "is_success": plan["outcome"]["is_success"]
+    }
+    return await _timed(timings, "weekly_summary", llm_service.generate_weekly_summary(
+        sunday_prompt_encounter,
+        plan["key_encounters"],
+        plan["campaign_year"]
+    ))
+
+
+@tracing.traced("encounter.finalize")
+def _finalize_encounter(
+    request: EncounterRequest,
+    plan: Dict[str, Any],
+    narrative_text: str,
+    summary_line: str,
+    llm_weekly_summary: Optional[str],
+    timings: Dict[str, float]
+) -> Dict[str, Any]:
+    """
+    생성된 텍스트를 게임 데이터에 반영하고 응답 딕셔너리 생성
+
+    Args:
+        request: 조우 요청
+        plan: _prepare_encounter 결과
+        narrative_text: 생성된 스토리
+        summary_line: 1줄 요약
+        llm_weekly_summary: 주간 요약 (일요일이 아니면 None)
+        timings: LLM 단계별 소요 시간 (ms)
+
+    Returns:
+        /encounter 응답 딕셔너리
+    """
+    data = plan["data"]
+    outcome = plan["outcome"]
+    game_state = plan["game_state"]
+    visual_description = plan["visual_description"]
+    diary_write_date_obj = plan["diary_write_date_obj"]
+    diary_write_date_str = plan["diary_write_date_str"]
+    diary_write_day_of_week = plan["diary_write_day_of_week"]
+    is_week_closing = plan["is_week_closing"]
+    key_encounters = plan["key_encounters"]
     
     target_encounter_dict = {
         "visual_desc": visual_description,
@@ -490,13 +648,17 @@ async def process_encounter(request: EncounterRequest):
         narrative_text,
         summary_line
     )
+    index = plan["index"]
+    index.add_daily_entry(
+        storage_service.get_current_month_chapter(data, diary_write_date_obj.strftime("%B"))["daily_entries"][-1]
+    )
     
     # 현재 상태 업데이트
     data["current_state"]["madness_tracker"]["current_level"] = game_state.madness_level
     data["current_state"]["weekly_progress"]["success_count"] = game_state.weekly_success_count
     
     # 일요일 조우 완료 후 주간 초기화 및 주간 요약 저장
-    if game_logic.should_reset_weekly_progress(diary_write_date_obj):
+    if is_week_closing:
         # 주간 번호 가져오기 (증가 전)
         current_week_number = data["current_state"]["weekly_progress"].get("current_week_number", 1)
         
@@ -514,15 +676,7 @@ async def process_encounter(request: EncounterRequest):
             "main_text": narrative_text
         }
         
-        # 그 주의 주요 조우 내용 수집 (weekly_log 활용)
-        key_encounters = []
-        for log_entry in weekly_log:
-            key_encounters.append({
-                "date": log_entry.date,
-                "target_name": log_entry.target_name,
-                "outcome": log_entry.outcome,
-                "summary_line": log_entry.key_narrative
-            })
+        # 그 주의 주요 조우 내용은 LLM 호출 전에 weekly_log로부터 수집됨 (key_encounters)
         
         # 주간 요약 텍스트 생성 (간단한 요약)
         weekly_summary_text = f"{week_start.strftime('%Y년 %m월 %d일')}부터 {week_end.strftime('%m월 %d일')}까지의 주간 기록입니다. "
@@ -532,15 +686,7 @@ async def process_encounter(request: EncounterRequest):
             weekly_summary_text += f"일요일 조우에서 {sunday_target_name}을(를) 상대로 실패했습니다. "
         weekly_summary_text += f"이번 주 총 {len(key_encounters)}건의 조우가 있었습니다."
         
-        # LLM으로 주간 상세 요약 생성
-        campaign_year = data.get("save_file_info", {}).get("campaign_year", 1925)
-        llm_weekly_summary = await llm_service.generate_weekly_summary(
-            sunday_encounter,
-            key_encounters,
-            campaign_year
-        )
-        
-        # 기존 요약 텍스트에 LLM 요약 추가
+        # 기존 요약 텍스트에 LLM 요약 추가 (주간 요약은 스토리 생성과 동시에 생성됨)
         final_weekly_summary = f"{weekly_summary_text}\n\n{llm_weekly_summary}"
         
         # 주간 요약 저장
@@ -553,6 +699,7 @@ async def process_encounter(request: EncounterRequest):
             key_encounters,
             final_weekly_summary
         )
+        index.add_weekly_record(data["legacy_inventory"]["weekly_records"][-1])
         
         # 주간 번호 증가
         data["current_state"]["weekly_progress"]["current_week_number"] = current_week_number + 1
@@ -572,9 +719,9 @@ async def process_encounter(request: EncounterRequest):
     from datetime import timedelta
     next_date = diary_write_date_obj + timedelta(days=1)
     data["current_state"]["today_date"] = next_date.strftime("%Y-%m-%d")
-    
-    # 클라이언트에서 저장하도록 업데이트된 전체 게임 데이터 반환
-    return {
+
+    # 클라이언트에서 저장하도록 업데이트된 전체 게임 데이터 (delta 모드에서는 패치) 반환
+    response = plan["delta"].finish({
         "success": True,
         "outcome": outcome,
         "narrative": {
@@ -585,17 +732,176 @@ async def process_encounter(request: EncounterRequest):
             "madness_level": game_state.madness_level,
             "weekly_success_count": game_state.weekly_success_count
         },
+        "timings": timings,  # LLM 단계별 소요 시간 (ms)
         "game_data": data  # 클라이언트에서 저장할 전체 업데이트된 데이터
-    }
+    })
+    index.revision = response["revision"]
+    return response
+
+
+@router.post("/encounter", response_class=FastJSONResponse)
+async def process_encounter(request: EncounterRequest):
+    """조우 처리 (주사위 결과 입력, 스토리 생성)"""
+    from app.services import llm_service
+    async with _game_data_session(request.campaign_id, request.game_data) as data:
+        plan = _prepare_encounter(request, data)
 
+        # LLM 생성 단계 (실제 데이터 의존성만 순차 실행)
+        # - 스토리 -> 1줄 요약 (요약은 스토리에 의존)
+        # - 주간 요약 (일요일에만, 스토리와 독립적이므로 동시 실행)
+        timings: Dict[str, float] = {}
 
-@router.post("/month-end")
+        async def story_chain():
+            story = await _timed(timings, "story", llm_service.generate_daily_story(
+                plan["context"],
+                plan["memory"],
+                plan["campaign_year"],
+                sunday_success_rate=plan["sunday_success_rate"],
+                overall_success_rate=plan["overall_success_rate"],
+                sunday_total_count=plan["sunday_total_count"]
+            ))
+            summary = await _timed(timings, "summary_line", llm_service.generate_summary_line(story))
+            return story, summary
+
+        llm_started = time.perf_counter()
+        (narrative_text, summary_line), llm_weekly_summary = await asyncio.gather(
+            story_chain(),
+            _generate_weekly_summary(plan, timings)
+        )
+        timings["llm_total"] = round((time.perf_counter() - llm_started) * 1000, 1)
+
+        result = _finalize_encounter(request, plan, narrative_text, summary_line, llm_weekly_summary, timings)
+        return FastJSONResponse(result, headers={"Server-Timing": _format_server_timing(timings)})
+
+
+class _SessionStreamingResponse(StreamingResponse):
+    """
+    응답이 끝나면 항상 캠페인 세션을 해제하는 StreamingResponse
+
+    시작되지 않은 비동기 제너레이터는 수거될 때 finally를 실행하지 않으므로, 첫 조각을 보내기 전에
+    클라이언트 연결이 끊기거나 응답 전송이 실패하면 event_stream()의 finally만으로는 lock이 풀리지 않습니다.
+    """
+
+    def __init__(self, content, release: Callable[[], Awaitable[None]], **kwargs):
+        super().__init__(content, **kwargs)
+        self._release = release
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._release()
+
+
+@router.post("/encounter/stream")
+async def process_encounter_stream(request: EncounterRequest):
+    """
+    조우 처리 스트리밍 버전 (Server-Sent Events)
+
+    이벤트 순서:
+    - outcome: 주사위 판정 결과 (즉시 전송)
+    - story: 스토리 토큰 조각 ({"delta": "..."})
+    - summary: 1줄 요약
+    - done: /encounter와 동일한 형식의 최종 응답 (game_data 포함)
+    - error: 처리 중 오류
+    """
+    from app.services import llm_service
+    # 캠페인 lock은 스트림이 끝날 때까지 유지 (검증 오류는 스트림 시작 전에 HTTP 오류로 반환)
+    session = AsyncExitStack()
+    data = await session.enter_async_context(_game_data_session(request.campaign_id, request.game_data))
+    try:
+        plan = _prepare_encounter(request, data)
+    except BaseException as e:
+        await session.__aexit__(type(e), e, e.__traceback__)
+        raise
+
+    released = False
+
+    async def release_session(completed: bool = False) -> None:
+        """캠페인 저장(완료 시) 또는 변경 내용 폐기 후 lock 해제 (한 번만 실행)"""
+        nonlocal released
+        if released:
+            return
+        released = True
+        if completed:
+            await session.aclose()
+        else:
+            failure = RuntimeError("스트리밍 조우 처리가 완료되지 않았습니다.")
+            await session.__aexit__(type(failure), failure, None)
+
+    async def event_stream():
+        timings: Dict[str, float] = {}
+        llm_started = time.perf_counter()
+        weekly_task = asyncio.create_task(_generate_weekly_summary(plan, timings))
+        completed = False
+        try:
+            yield _format_sse("outcome", {
+                "outcome": plan["outcome"],
+                "updated_state": {
+                    "madness_level": plan["game_state"].madness_level,
+                    "weekly_success_count": plan["game_state"].weekly_success_count
+                }
+            })
+
+            story_started = time.perf_counter()
+            chunks = []
+            async for delta in llm_service.generate_daily_story_stream(
+                plan["context"],
+                plan["memory"],
+                plan["campaign_year"],
+                sunday_success_rate=plan["sunday_success_rate"],
+                overall_success_rate=plan["overall_success_rate"],
+                sunday_total_count=plan["sunday_total_count"]
+            ):
+                if "story_first_token" not in timings:
+                    timings["story_first_token"] = round((time.perf_counter() - story_started) * 1000, 1)
+                chunks.append(delta)
+                yield _format_sse("story", {"delta": delta})
+            timings["story"] = round((time.perf_counter() - story_started) * 1000, 1)
+            narrative_text = "".join(chunks).strip()
+
+            summary_line = await _timed(timings, "summary_line", llm_service.generate_summary_line(narrative_text))
+            yield _format_sse("summary", {"summary_line": summary_line})
+
+            llm_weekly_summary = await weekly_task
+            timings["llm_total"] = round((time.perf_counter() - llm_started) * 1000, 1)
+
+            result = _finalize_encounter(request, plan, narrative_text, summary_line, llm_weekly_summary, timings)
+            await release_session(completed=True)  # 캠페인 저장 및 lock 해제
+            completed = True
+            yield _format_sse("done", result)
+        except Exception as e:
+            logger.exception("스트리밍 조우 처리 중 오류")
+            yield _format_sse("error", {"detail": str(e)})
+        finally:
+            if not weekly_task.done():
+                weekly_task.cancel()
+            if not completed:
+                # 오류 또는 클라이언트 연결 종료: 변경된 캠페인 캐시를 버리고 lock 해제
+                await release_session()
+
+    return _SessionStreamingResponse(
+        event_stream(),
+        release=release_session,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # 프록시 버퍼링 방지
+        }
+    )
+
+
+@router.post("/month-end", response_class=FastJSONResponse)
 async def process_month_end(request: MonthEndRequest):
     """월말 처리 (점수 계산, 월간 요약 생성)"""
-    # 클라이언트에서 게임 데이터 받기
-    if not request.game_data:
-        raise HTTPException(status_code=400, detail="game_data가 필요합니다.")
-    data = request.game_data
+    async with _game_data_session(request.campaign_id, request.game_data) as data:
+        return FastJSONResponse(await _process_month_end(request, data))
+
+
+async def _process_month_end(request: MonthEndRequest, data: Dict[str, Any]) -> Dict[str, Any]:
+    """월말 처리 (점수 계산, 월간 요약 생성)의 게임 데이터 변경 단계"""
+    from app.services import llm_service
+    delta = _start_delta(data, request.base_revision)
     
     current_state = data.get("current_state", {})
     today_date_str = current_state.get("today_date", "1926-01-01")
@@ -606,38 +912,15 @@ async def process_month_end(request: MonthEndRequest):
     except ValueError:
         raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다.")
     
+    _require_full_chapters(delta, data, month_name)
     chapter = storage_service.get_current_month_chapter(data, month_name)
     
-    # 일요일 조우 성공 횟수 집계
-    # weekly_records에서도 확인하되, 기존 daily_entries 방식도 유지 (호환성)
-    sunday_success_count = 0
-    bosses_defeated = []
-    
-    # weekly_records에서 해당 월의 일요일 조우 집계
-    weekly_records = data.get("legacy_inventory", {}).get("weekly_records", [])
-    for weekly_record in weekly_records:
-        week_end_date = datetime.strptime(weekly_record["week_end_date"], "%Y-%m-%d").date()
-        # 해당 월에 속하는 주차인지 확인
-        if week_end_date.year == current_date_obj.year and week_end_date.month == current_date_obj.month:
-            sunday_enc = weekly_record.get("sunday_encounter", {})
-            if sunday_enc.get("is_success", False):
-                sunday_success_count += 1
-                bosses_defeated.append(sunday_enc.get("target_name", "알 수 없는 조우"))
-    
-    # 기존 방식도 유지 (weekly_records에 없는 경우를 대비)
-    for entry in chapter.get("daily_entries", []):
-        if entry.get("day_of_week") == "Sunday":
-            entry_date = datetime.strptime(entry["diary_write_date"], "%Y-%m-%d").date()
-            # weekly_records에 이미 집계된 경우 중복 제거
-            already_counted = False
-            for weekly_record in weekly_records:
-                week_end_date = datetime.strptime(weekly_record["week_end_date"], "%Y-%m-%d").date()
-                if week_end_date == entry_date and weekly_record.get("sunday_encounter", {}).get("is_success", False):
-                    already_counted = True
-                    break
-            if not already_counted and entry["game_logic_snapshot"]["is_success"]:
-                sunday_success_count += 1
-                bosses_defeated.append(entry["game_logic_snapshot"]["target_name"])
+    # 일요일 조우 성공 횟수 집계 (일일 엔트리와 주간 기록을 날짜별로 합친 통계 블록 기준)
+    month_stats = campaign_statistics.get_month(
+        data, campaign_statistics.month_key(current_date_obj.year, current_date_obj.month)
+    )
+    sunday_success_count = month_stats["sunday_success_count"]
+    bosses_defeated = campaign_statistics.bosses_defeated(month_stats)
     
     # 광기 게이지 만료 여부 확인
     madness_level = current_state.get("madness_tracker", {}).get("current_level", 0)
@@ -663,6 +946,7 @@ async def process_month_end(request: MonthEndRequest):
     # is_completed는 month-conclusion에서 설정됨
     chapter["monthly_score"] = monthly_score
     chapter["chapter_summary"] = chapter_summary
+    storage_service.touch_chapter(chapter)
     
     # 레거시 인벤토리 업데이트
     if request.new_rules_unlocked:
@@ -679,23 +963,26 @@ async def process_month_end(request: MonthEndRequest):
         data["legacy_inventory"] = legacy_inventory
     
     # 클라이언트에서 저장하도록 업데이트된 전체 게임 데이터 반환
-    return {
+    return delta.finish({
         "success": True,
         "monthly_score": monthly_score,
         "chapter_summary": chapter_summary,
         "bosses_defeated": bosses_defeated,
         "madness_state": chapter_data["madness_state"],
         "game_data": data  # 클라이언트에서 저장할 전체 업데이트된 데이터
-    }
+    })
 
 
-@router.post("/month-start")
+@router.post("/month-start", response_class=FastJSONResponse)
 async def process_month_start(request: MonthStartRequest):
     """새 달 시작 (레거시 업데이트 반영)"""
-    # 클라이언트에서 게임 데이터 받기
-    if not request.game_data:
-        raise HTTPException(status_code=400, detail="game_data가 필요합니다.")
-    data = request.game_data
+    async with _game_data_session(request.campaign_id, request.game_data) as data:
+        return FastJSONResponse(await _process_month_start(request, data))
+
+
+async def _process_month_start(request: MonthStartRequest, data: Dict[str, Any]) -> Dict[str, Any]:
+    """새 달 시작 (레거시 업데이트 반영)의 게임 데이터 변경 단계"""
+    delta = _start_delta(data, request.base_revision)
     
     current_state = data.get("current_state", {})
     
@@ -715,24 +1002,29 @@ async def process_month_start(request: MonthStartRequest):
         data["legacy_inventory"] = legacy_inventory
     
     # 클라이언트에서 저장하도록 업데이트된 전체 게임 데이터 반환
-    return {
+    return delta.finish({
         "success": True,
         "message": "새 달이 시작되었습니다.",
         "updated_state": current_state,
         "game_data": data  # 클라이언트에서 저장할 전체 업데이트된 데이터
-    }
+    })
 
 
-@router.post("/month-conclusion")
+@router.post("/month-conclusion", response_class=FastJSONResponse)
 async def process_month_conclusion(request: MonthConclusionRequest):
     """월별 결산 처리 (LLM으로 결말 생성)"""
-    # 클라이언트에서 게임 데이터 받기
-    if not request.game_data:
-        raise HTTPException(status_code=400, detail="game_data가 필요합니다.")
-    data = request.game_data
+    async with _game_data_session(request.campaign_id, request.game_data) as data:
+        return FastJSONResponse(await _process_month_conclusion(request, data))
+
+
+async def _process_month_conclusion(request: MonthConclusionRequest, data: Dict[str, Any]) -> Dict[str, Any]:
+    """월별 결산 처리 (LLM으로 결말 생성)의 게임 데이터 변경 단계"""
+    from app.services import llm_service
+    delta = _start_delta(data, request.base_revision)
     
     # 월 이름 정규화
     month_name = request.month.capitalize()
+    _require_full_chapters(delta, data, month_name)
     
     # 캠페인 연도 가져오기
     campaign_year = data.get("save_file_info", {}).get("campaign_year", 1925)
@@ -761,19 +1053,8 @@ async def process_month_conclusion(request: MonthConclusionRequest):
             except (ValueError, IndexError):
                 continue
     
-    # 통계 정보 계산
-    total_entries = len(daily_entries)
-    success_count = sum(1 for entry in daily_entries if entry.get("game_logic_snapshot", {}).get("is_success", False))
-    success_rate = (success_count / total_entries * 100) if total_entries > 0 else 0.0
-    
-    # 일요일 조우 통계
-    sunday_entries = [e for e in daily_entries if e.get("day_of_week") == "Sunday"]
-    sunday_success_count = sum(1 for entry in sunday_entries if entry.get("game_logic_snapshot", {}).get("is_success", False))
-    sunday_success_rate = (sunday_success_count / len(sunday_entries) * 100) if sunday_entries else 0.0
-    
-    # 광기 통계
-    total_madness = sum(entry.get("game_logic_snapshot", {}).get("cthulhu_symbol_count", 0) for entry in daily_entries)
-    madness_triggered_count = sum(1 for entry in daily_entries if entry.get("game_logic_snapshot", {}).get("madness_triggered", False))
+    # 통계 정보 (통계 블록의 해당 월 집계)
+    month_stats = campaign_statistics.get_month(data, campaign_statistics.month_key_for_name(campaign_year, month_name))
     
     # 월별 데이터 구성
     month_data = {
@@ -802,43 +1083,19 @@ async def process_month_conclusion(request: MonthConclusionRequest):
             for record in month_weekly_records
         ],
         "statistics": {
-            "total_entries": total_entries,
-            "success_count": success_count,
-            "success_rate": round(success_rate, 1),
-            "sunday_success_count": sunday_success_count,
-            "sunday_total_count": len(sunday_entries),
-            "sunday_success_rate": round(sunday_success_rate, 1),
-            "total_madness": total_madness,
-            "madness_triggered_count": madness_triggered_count
+            "total_entries": month_stats["total_entries"],
+            "success_count": month_stats["success_count"],
+            "success_rate": campaign_statistics.success_rate(month_stats["success_count"], month_stats["total_entries"]),
+            "sunday_success_count": month_stats["sunday_success_count"],
+            "sunday_total_count": month_stats["sunday_total_count"],
+            "sunday_success_rate": campaign_statistics.success_rate(month_stats["sunday_success_count"], month_stats["sunday_total_count"]),
+            "total_madness": month_stats["total_madness"],
+            "madness_triggered_count": month_stats["madness_triggered_count"]
         }
     }
     
-    # 일요일 조우 성공 횟수 집계 (점수 계산용)
-    sunday_success_count = 0
-    # weekly_records에서 해당 월의 일요일 조우 집계
-    for weekly_record in month_weekly_records:
-        sunday_enc = weekly_record.get("sunday_encounter", {})
-        if sunday_enc.get("is_success", False):
-            sunday_success_count += 1
-    
-    # daily_entries에서도 확인 (weekly_records에 없는 경우 대비)
-    for entry in daily_entries:
-        if entry.get("day_of_week") == "Sunday":
-            entry_date_str = entry.get("diary_write_date", "")
-            if entry_date_str:
-                try:
-                    entry_date = datetime.strptime(entry_date_str, "%Y-%m-%d").date()
-                    # weekly_records에 이미 집계된 경우 중복 제거
-                    already_counted = False
-                    for weekly_record in month_weekly_records:
-                        week_end_date = datetime.strptime(weekly_record["week_end_date"], "%Y-%m-%d").date()
-                        if week_end_date == entry_date and weekly_record.get("sunday_encounter", {}).get("is_success", False):
-                            already_counted = True
-                            break
-                    if not already_counted and entry.get("game_logic_snapshot", {}).get("is_success", False):
-                        sunday_success_count += 1
-                except ValueError:
-                    continue
+    # 일요일 조우 성공 횟수 (점수 계산용)
+    sunday_success_count = month_stats["sunday_success_count"]
     
     # 광기 게이지 만료 여부 확인
     current_state = data.get("current_state", {})
@@ -863,31 +1120,149 @@ async def process_month_conclusion(request: MonthConclusionRequest):
     chapter["chapter_summary"] = conclusion_text  # chapter_summary에 영구 저장
     chapter["monthly_score"] = monthly_score  # 점수 저장
     chapter["is_completed"] = True  # 월의 말일 보고서 작성 시 완료 처리
+    storage_service.touch_chapter(chapter)
     
     # 클라이언트에서 저장하도록 업데이트된 전체 게임 데이터 반환
-    return {
+    return delta.finish({
         "success": True,
         "month": month_name,
         "conclusion": conclusion_text,
         "monthly_score": monthly_score,
         "game_data": data  # 클라이언트에서 저장할 전체 업데이트된 데이터
+    })
+
+
+def _get_encounter_dataset() -> encounter_data.EncounterDataset:
+    """조우 데이터 조회 (로드 실패 시 HTTPException)"""
+    try:
+        return encounter_data.get_dataset()
+    except encounter_data.EncounterDataError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+def _precomputed_response(request: Request, precomputed: encounter_data.PrecomputedBody) -> Response:
+    """
+    미리 직렬화된 본문으로 응답 생성
+    
+    If-None-Match가 일치하면 본문 없이 304를 반환하고,
+    gzip 본문이 있으면 Accept-Encoding에 따라 압축 본문을 반환합니다.
+    압축 본문은 별도의 강한 ETag("<hash>-gzip")를 사용합니다.
+    """
+    headers = {
+        "Cache-Control": encounter_data.ENCOUNTER_DATA_CACHE_CONTROL,
+        "Vary": "Accept-Encoding"
     }
+    matched = encounter_data.matching_etag(
+        request.headers.get("if-none-match"), (precomputed.etag, precomputed.gzip_etag)
+    )
+    if matched is not None:
+        headers["ETag"] = matched
+        return Response(status_code=304, headers=headers)
+    
+    if precomputed.gzip_body is not None and compression.accepts_encoding(request.headers.get("accept-encoding"), "gzip"):
+        headers["ETag"] = precomputed.gzip_etag
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=precomputed.gzip_body, media_type="application/json", headers=headers)
+    headers["ETag"] = precomputed.etag
+    return Response(content=precomputed.body, media_type="application/json", headers=headers)
 
 
 @router.get("/encounter-data")
-async def get_encounter_data():
-    """daily_encounter_data.json 파일을 읽어서 조우 데이터 반환"""
-    game_data_path = os.path.join("data", "daily_encounter_data.json")
-    
+async def get_encounter_data(request: Request):
+    """
+    조우 데이터 반환 (daily_encounter_data.json)
+    
+    한 번 로드한 데이터의 미리 직렬화된 본문을 강한 ETag와 함께 반환하며,
+    If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+    """
+    return _precomputed_response(request, _get_encounter_dataset().full)
+
+
+@router.get("/encounter-data/week/{date}")
+async def get_week_encounter_data(date: str, request: Request):
+    """date(YYYY-MM-DD)가 속한 주(월~일)의 조우 데이터 반환 (일요일 보스 조우 포함)"""
     try:
-        with open(game_data_path, "r", encoding="utf-8") as f:
-            game_data = json.load(f)
-        return {
-            "success": True,
-            "data": game_data
-        }
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail="daily_encounter_data.json 파일을 찾을 수 없습니다.")
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=500, detail="daily_encounter_data.json 파일 파싱 오류")
+        target_date_obj = datetime.strptime(date, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+    dataset = _get_encounter_dataset()
+    try:
+        week_body = dataset.get_week_body(target_date_obj)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _precomputed_response(request, week_body)
+
+
+@router.get("/encounter-data/{month_day}")
+async def get_day_encounter_data(month_day: str, request: Request):
+    """월일(MM-DD)의 조우 데이터 반환"""
+    try:
+        datetime.strptime(f"2000-{month_day}", "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다. (MM-DD)")
+    precomputed = _get_encounter_dataset().day_bodies.get(month_day)
+    if precomputed is None:
+        raise HTTPException(status_code=404, detail=f"{month_day}의 조우 데이터가 없습니다.")
+    return _precomputed_response(request, precomputed)
+
+
+@router.get("/llm-stats")
+async def get_llm_stats():
+    """LLM 호출 통계 조회 (응답 캐시 히트/미스 등)"""
+    from app.services import llm_service
+    return {
+        "success": True,
+        "stats": llm_service.get_llm_stats()
+    }
+
+
+class CampaignImportRequest(BaseModel):
+    game_data: Dict[str, Any]
+
+
+@router.post("/campaigns")
+async def import_campaign(request: CampaignImportRequest):
+    """클라이언트 게임 데이터를 서버 캠페인 저장소로 가져오기 (이후 campaign_id로 요청 가능)"""
+    if not request.game_data.get("current_state"):
+        raise HTTPException(status_code=400, detail="올바른 game_data가 아닙니다.")
+    data = request.game_data
+    campaign_id = await session_store.get_campaign_store().create(data)
+    return {
+        "success": True,
+        "campaign_id": campaign_id,
+        "revision": delta_protocol.get_revision(data)
+    }
+
+
+@router.get("/campaigns/stats")
+async def get_campaign_store_stats():
+    """서버 캠페인 저장소 통계 조회 (캐시 히트/미스, 저장 횟수)"""
+    return {
+        "success": True,
+        "stats": session_store.get_campaign_store().stats()
+    }
+
+
+@router.get("/campaigns/{campaign_id}", response_class=FastJSONResponse)
+async def export_campaign(campaign_id: str):
+    """서버 캠페인 저장소의 전체 게임 데이터 내보내기"""
+    try:
+        data = await session_store.get_campaign_store().get(campaign_id)
+    except session_store.CampaignNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return FastJSONResponse({
+        "success": True,
+        "campaign_id": campaign_id,
+        "revision": delta_protocol.get_revision(data),
+        "game_data": data
+    })
+
 
+@router.delete("/campaigns/{campaign_id}")
+async def delete_campaign(campaign_id: str):
+    """서버 캠페인 저장소에서 캠페인 삭제"""
+    store = session_store.get_campaign_store()
+    async with store.lock(campaign_id):
+        if not await store.delete(campaign_id):
+            raise HTTPException(status_code=404, detail=f"캠페인을 찾을 수 없습니다: {campaign_id}")
+    return {"success": True, "campaign_id": campaign_id}
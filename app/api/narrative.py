@@ -1,28 +1,126 @@
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Request, Response
 from datetime import datetime
-import calendar
-from typing import Optional, Dict, Any
+import hashlib
+from typing import Optional, Dict, Any, Callable, Tuple
 from app.services import storage_service
+from app.services import session_store
+from app.services import campaign_statistics
+from app.services import json_codec
+from app.services import tracing
+from app.services.delta_protocol import DeltaSliceError
 
-router = APIRouter(prefix="/api/narrative", tags=["narrative"])
+router = APIRouter(prefix="/api/narrative", tags=["narrative"], route_class=tracing.TracedRoute)
 
 
-def get_game_data(request_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """게임 데이터 가져오기 (클라이언트에서 전달한 데이터 우선)"""
+@tracing.traced("narrative.get_game_data")
+async def get_game_data(request_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """게임 데이터 가져오기 (서버 캠페인 저장소, 클라이언트에서 전달한 데이터 순)"""
+    if request_data and request_data.get("campaign_id"):
+        campaign_id = request_data["campaign_id"]
+        store = session_store.get_campaign_store()
+        try:
+            stored = await store.get(campaign_id)
+            if not campaign_statistics.has_current_statistics(stored):
+                stored = await _backfill_statistics(store, campaign_id)
+        except session_store.CampaignNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        # 조회 중 챕터가 추가되어도 저장된 캠페인이 바뀌지 않도록 챕터 목록만 복사한 읽기용 사본 반환
+        history = dict(stored.get("campaign_history", {}))
+        history["monthly_chapters"] = list(history.get("monthly_chapters", []))
+        return {**stored, "campaign_history": history}
     if request_data and "game_data" in request_data:
         return request_data["game_data"]
     # 호환성을 위해 파일에서 로드 (점진적 마이그레이션)
     try:
-        return storage_service.load_game_data()
+        return await storage_service.load_game_data_async()
     except Exception:
         # 파일이 없으면 빈 게임 데이터 반환
         return storage_service.initialize_new_game(1925)
 
 
+async def _backfill_statistics(store: session_store.CampaignStore, campaign_id: str) -> Dict[str, Any]:
+    """
+    통계 블록이 없는 저장된 캠페인을 백필하고 저장 (캠페인마다 한 번만 수행)
+
+    조회 요청은 읽기용 사본을 사용하므로, 캠페인 lock을 잡고 저장된 캠페인 자체를 백필해야
+    다음 요청에서 다시 계산하지 않습니다.
+    """
+    async with store.lock(campaign_id):
+        stored = await store.get(campaign_id)
+        if not campaign_statistics.has_current_statistics(stored):
+            _ensure_statistics(stored)
+            await store.save(campaign_id, stored)
+    return stored
+
+
+def _parse_if_none_match(header: Optional[str]) -> set:
+    """If-None-Match 헤더의 ETag 목록 (약한 ETag 접두어 W/는 무시)"""
+    if not header:
+        return set()
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def _cached_json_response(
+    http_request: Request,
+    request_data: Optional[Dict[str, Any]],
+    memo_key: Tuple[Any, ...],
+    version: Tuple[Any, ...],
+    build: Callable[[], Dict[str, Any]]
+) -> Response:
+    """
+    조회 결과를 ETag와 함께 반환
+    
+    서버 캠페인 저장소의 캠페인은 memo_key별로 직렬화한 결과를 version(챕터 revision 등)과 함께
+    메모해 두고, version이 같으면 다시 계산하지 않습니다.
+    ETag는 응답 본문의 해시이므로 클라이언트가 보낸 game_data로 계산한 결과에도 붙으며,
+    If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+    
+    Args:
+        http_request: 요청 (If-None-Match 헤더)
+        request_data: 요청 본문 (campaign_id가 있으면 메모 사용)
+        memo_key: 엔드포인트와 월 등 결과 종류
+        version: 결과가 의존하는 값 (바뀌면 다시 계산)
+        build: 결과 딕셔너리 계산 함수
+    """
+    campaign_id = request_data.get("campaign_id") if request_data else None
+    memo = session_store.get_campaign_store().memo(campaign_id) if campaign_id else {}
+    cached = memo.get(memo_key)
+    if cached is not None and cached[0] == version:
+        _, etag, body = cached
+        tracing.set_attribute("memo.hit", True)
+    else:
+        with tracing.span("narrative.build"):
+            body = json_codec.dumps(build())
+        etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+        memo[memo_key] = (version, etag, body)
+    
+    if_none_match = _parse_if_none_match(http_request.headers.get("if-none-match"))
+    if etag in if_none_match or "*" in if_none_match:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+@tracing.traced("statistics.ensure")
+def _ensure_statistics(data: Dict[str, Any]) -> None:
+    """통계 블록이 없는 기존 세이브 백필"""
+    try:
+        campaign_statistics.ensure_statistics(data)
+    except DeltaSliceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _month_number(month_name: str) -> int:
+    """월 이름을 숫자로 변환 (January -> 1)"""
+    try:
+        return campaign_statistics.MONTH_NAMES.index(month_name) + 1
+    except ValueError:
+        raise HTTPException(status_code=400, detail="올바른 월 이름이 아닙니다.")
+
+
 @router.post("/diary/{date}")
 async def get_diary_entry(date: str, request: Optional[Dict[str, Any]] = Body(None)):
     """특정 날짜 일기 조회"""
-    data = get_game_data(request)
+    data = await get_game_data(request)
     
     try:
         date_obj = datetime.strptime(date, "%Y-%m-%d")
@@ -46,7 +144,7 @@ async def get_diary_entry(date: str, request: Optional[Dict[str, Any]] = Body(No
 @router.get("/month/{month}")
 async def get_month_diary_get(month: str):
     """월별 일기 목록 (GET)"""
-    data = get_game_data(None)
+    data = await get_game_data(None)
     
     # 월 이름 정규화 (예: "january" -> "January")
     month_name = month.capitalize()
@@ -82,7 +180,7 @@ async def get_month_diary_get(month: str):
 @router.post("/month/{month}")
 async def get_month_diary(month: str, request: Optional[Dict[str, Any]] = Body(None)):
     """월별 일기 목록 (POST)"""
-    data = get_game_data(request)
+    data = await get_game_data(request)
     
     # 월 이름 정규화 (예: "january" -> "January")
     month_name = month.capitalize()
@@ -118,7 +216,7 @@ async def get_month_diary(month: str, request: Optional[Dict[str, Any]] = Body(N
 @router.post("/chapter/{month}")
 async def get_chapter_summary(month: str, request: Optional[Dict[str, Any]] = Body(None)):
     """월간 챕터 요약 조회"""
-    data = get_game_data(request)
+    data = await get_game_data(request)
     
     month_name = month.capitalize()
     chapters = data.get("campaign_history", {}).get("monthly_chapters", [])
@@ -140,16 +238,26 @@ async def get_chapter_summary(month: str, request: Optional[Dict[str, Any]] = Bo
 
 
 @router.post("/all-chapters")
-async def get_all_chapters(request: Optional[Dict[str, Any]] = Body(None)):
+async def get_all_chapters(http_request: Request, request: Optional[Dict[str, Any]] = Body(None)):
     """모든 챕터 목록 조회 (프롤로그 포함)"""
-    data = get_game_data(request)
+    data = await get_game_data(request)
     
     chapters = data.get("campaign_history", {}).get("monthly_chapters", [])
+    prologue = data.get("campaign_history", {}).get("prologue", {})
     
+    version = (
+        tuple((chapter.get("month", ""), chapter.get("revision", 0)) for chapter in chapters),
+        bool(prologue.get("content")),
+        prologue.get("date", "")
+    )
+    return _cached_json_response(http_request, request, ("all-chapters",), version, lambda: _build_all_chapters(chapters, prologue))
+
+
+def _build_all_chapters(chapters: list, prologue: Dict[str, Any]) -> Dict[str, Any]:
+    """챕터 목록 응답 생성"""
     chapter_list = []
     
     # 프롤로그가 있으면 맨 앞에 추가
-    prologue = data.get("campaign_history", {}).get("prologue", {})
     if prologue.get("content"):
         chapter_list.append({
             "month": "Prologue",
@@ -178,7 +286,7 @@ async def get_all_chapters(request: Optional[Dict[str, Any]] = Body(None)):
 @router.post("/prologue")
 async def get_prologue(request: Optional[Dict[str, Any]] = Body(None)):
     """프롤로그 조회"""
-    data = get_game_data(request)
+    data = await get_game_data(request)
     
     prologue = data.get("campaign_history", {}).get("prologue", {})
     
@@ -196,93 +304,91 @@ async def get_prologue(request: Optional[Dict[str, Any]] = Body(None)):
 
 
 @router.post("/month/{month}/completion-status")
-async def get_month_completion_status(month: str, request: Optional[Dict[str, Any]] = Body(None)):
+async def get_month_completion_status(month: str, http_request: Request, request: Optional[Dict[str, Any]] = Body(None)):
     """월별 완료 상태 확인"""
-    data = get_game_data(request)
+    data = await get_game_data(request)
     
     # 월 이름 정규화
     month_name = month.capitalize()
+    month_number = _month_number(month_name)
     
     # 캠페인 연도 가져오기
     campaign_year = data.get("save_file_info", {}).get("campaign_year", 1925)
     
-    # 월 이름을 숫자로 변환 (January -> 1)
-    month_names = ["January", "February", "March", "April", "May", "June",
-                   "July", "August", "September", "October", "November", "December"]
-    try:
-        month_number = month_names.index(month_name) + 1
-    except ValueError:
-        raise HTTPException(status_code=400, detail="올바른 월 이름이 아닙니다.")
-    
-    # 해당 월의 전체 일수 계산
-    days_in_month = calendar.monthrange(campaign_year, month_number)[1]
-    
-    # 챕터 가져오기
     chapter = storage_service.get_current_month_chapter(data, month_name)
-    daily_entries = chapter.get("daily_entries", [])
-    
-    # 작성된 날짜 수집
-    written_dates = set()
-    for entry in daily_entries:
-        date_str = entry.get("diary_write_date", "")
-        if date_str:
-            try:
-                entry_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                # 해당 월에 속하는 날짜인지 확인
-                if entry_date.year == campaign_year and entry_date.month == month_number:
-                    written_dates.add(entry_date.day)
-            except ValueError:
-                continue
-    
-    # 완료 여부 확인
-    is_completed = len(written_dates) == days_in_month
+    version = (chapter.get("revision", 0), campaign_year)
+    
+    def build() -> Dict[str, Any]:
+        # 작성된 날짜 (통계 블록의 월별 날짜 비트맵)
+        _ensure_statistics(data)
+        month_stats = campaign_statistics.get_month(data, campaign_statistics.month_key(campaign_year, month_number))
+        written_dates = campaign_statistics.written_days(month_stats)
+        days_in_month = campaign_statistics.days_in_month(campaign_year, month_number)
+        
+        return {
+            "success": True,
+            "month": month_name,
+            "campaign_year": campaign_year,
+            "is_completed": len(written_dates) == days_in_month,
+            "days_in_month": days_in_month,
+            "written_days": len(written_dates),
+            "written_dates": written_dates
+        }
     
-    return {
-        "success": True,
-        "month": month_name,
-        "campaign_year": campaign_year,
-        "is_completed": is_completed,
-        "days_in_month": days_in_month,
-        "written_days": len(written_dates),
-        "written_dates": sorted(list(written_dates))
-    }
+    return _cached_json_response(http_request, request, ("completion-status", month_name), version, build)
 
 
 @router.post("/report/{month}")
-async def get_month_report(month: str, request: Optional[Dict[str, Any]] = Body(None)):
+async def get_month_report(month: str, http_request: Request, request: Optional[Dict[str, Any]] = Body(None)):
     """월별 보고서 조회 (프롬프트 정보 및 통계)"""
-    data = get_game_data(request)
+    data = await get_game_data(request)
     
     # 월 이름 정규화
     month_name = month.capitalize()
+    month_number = _month_number(month_name)
     
     # 캠페인 연도 가져오기
     campaign_year = data.get("save_file_info", {}).get("campaign_year", 1925)
     
     # 챕터 가져오기
     chapter = storage_service.get_current_month_chapter(data, month_name)
-    daily_entries = chapter.get("daily_entries", [])
     
-    # 월 이름을 숫자로 변환
-    month_names = ["January", "February", "March", "April", "May", "June",
-                   "July", "August", "September", "October", "November", "December"]
-    try:
-        month_number = month_names.index(month_name) + 1
-    except ValueError:
-        raise HTTPException(status_code=400, detail="올바른 월 이름이 아닙니다.")
+    # 광기 상태 텍스트는 현재 광기 수치를 사용하므로 챕터 revision과 함께 결과가 의존하는 값
+    current_madness = data.get("current_state", {}).get("madness_tracker", {}).get("current_level", 0)
+    version = (chapter.get("revision", 0), campaign_year, current_madness)
+    return _cached_json_response(
+        http_request, request, ("report", month_name), version,
+        lambda: _build_month_report(data, chapter, month_name, month_number, campaign_year, current_madness)
+    )
+
+
+def _build_month_report(
+    data: Dict[str, Any],
+    chapter: Dict[str, Any],
+    month_name: str,
+    month_number: int,
+    campaign_year: int,
+    current_madness: int
+) -> Dict[str, Any]:
+    """월별 보고서 응답 생성"""
+    daily_entries = chapter.get("daily_entries", [])
     
     # 해당 월의 전체 일수 계산
-    days_in_month = calendar.monthrange(campaign_year, month_number)[1]
-    
-    # 통계 계산
-    total_entries = len(daily_entries)
-    success_count = 0
-    failure_count = 0
-    sunday_success_count = 0
-    sunday_total_count = 0
-    total_madness = 0
-    madness_triggered_count = 0
-    action_type_counts = {"COMBAT": 0, "INVESTIGATION": 0, "SEARCH": 0}
+    days_in_month = campaign_statistics.days_in_month(campaign_year, month_number)
+    
+    # 통계 (통계 블록의 해당 월 집계, 블록이 없는 기존 세이브는 백필)
+    _ensure_statistics(data)
+    month_stats = campaign_statistics.get_month(data, campaign_statistics.month_key(campaign_year, month_number))
+    
+    # 광기 상태 텍스트 생성 (해당 시점의 광기 수치는 추정 불가하므로 현재 상태 사용)
+    if current_madness >= 7:
+        madness_state_text = f"심각한 정신 착란 (광기 수치: {current_madness}/10)"
+    elif current_madness >= 5:
+        madness_state_text = f"중간 광기 (광기 수치: {current_madness}/10)"
+    elif current_madness >= 3:
+        madness_state_text = f"약한 광기 (광기 수치: {current_madness}/10)"
+    else:
+        madness_state_text = f"정상 (광기 수치: {current_madness}/10)"
     
     # 일기별 상세 정보 수집
     report_entries = []
@@ -302,39 +408,8 @@ async def get_month_report(month: str, request: Optional[Dict[str, Any]] = Body(
             story_progress_text = f"{day}/{days_in_month} ({story_progress_percent}%)"
             
             is_success = game_snapshot.get("is_success", False)
-            if is_success:
-                success_count += 1
-            else:
-                failure_count += 1
-            
-            # 일요일 조우 통계
-            if day_of_week == "Sunday":
-                sunday_total_count += 1
-                if is_success:
-                    sunday_success_count += 1
-            
-            # 광기 통계
             cthulhu_count = game_snapshot.get("cthulhu_symbol_count", 0)
-            total_madness += cthulhu_count
-            if game_snapshot.get("madness_triggered", False):
-                madness_triggered_count += 1
-            
-            # 행동 유형 통계
             action_type = game_snapshot.get("action_type", "")
-            if action_type in action_type_counts:
-                action_type_counts[action_type] += 1
-            
-            # 광기 상태 텍스트 생성 (해당 시점의 광기 수치는 추정 불가하므로 현재 상태 사용)
-            current_madness = data.get("current_state", {}).get("madness_tracker", {}).get("current_level", 0)
-            madness_state_text = ""
-            if current_madness >= 7:
-                madness_state_text = f"심각한 정신 착란 (광기 수치: {current_madness}/10)"
-            elif current_madness >= 5:
-                madness_state_text = f"중간 광기 (광기 수치: {current_madness}/10)"
-            elif current_madness >= 3:
-                madness_state_text = f"약한 광기 (광기 수치: {current_madness}/10)"
-            else:
-                madness_state_text = f"정상 (광기 수치: {current_madness}/10)"
             
             # 프롬프트 정보 재구성
             prompt_info = {
@@ -369,26 +444,29 @@ async def get_month_report(month: str, request: Optional[Dict[str, Any]] = Body(
         except ValueError:
             continue
     
-    # 성공률 계산
-    success_rate = (success_count / total_entries * 100) if total_entries > 0 else 0.0
-    sunday_success_rate = (sunday_success_count / sunday_total_count * 100) if sunday_total_count > 0 else 0.0
-    
     # 월별 점수 가져오기
     monthly_score = chapter.get("monthly_score", 0)
     
     # 전체 통계
+    total_entries = month_stats["total_entries"]
+    success_count = month_stats["success_count"]
+    sunday_total_count = month_stats["sunday_total_count"]
+    sunday_success_count = month_stats["sunday_success_count"]
     statistics = {
         "monthly_score": monthly_score,
         "total_entries": total_entries,
         "success_count": success_count,
-        "failure_count": failure_count,
-        "success_rate": round(success_rate, 1),
+        "failure_count": total_entries - success_count,
+        "success_rate": campaign_statistics.success_rate(success_count, total_entries),
         "sunday_total_count": sunday_total_count,
         "sunday_success_count": sunday_success_count,
-        "sunday_success_rate": round(sunday_success_rate, 1),
-        "total_madness": total_madness,
-        "madness_triggered_count": madness_triggered_count,
-        "action_type_counts": action_type_counts,
+        "sunday_success_rate": campaign_statistics.success_rate(sunday_success_count, sunday_total_count),
+        "total_madness": month_stats["total_madness"],
+        "madness_triggered_count": month_stats["madness_triggered_count"],
+        "action_type_counts": {
+            action_type: month_stats["action_type_counts"].get(action_type, 0)
+            for action_type in campaign_statistics.REPORTED_ACTION_TYPES
+        },
         "days_in_month": days_in_month,
         "written_days": total_entries
     }
@@ -1,10 +1,25 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, Response, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import game, narrative
-import json
-from pathlib import Path
+from app.services import prompt_registry
+from app.services import encounter_data
+from app.services import storage_service
+from app.services import save_journal
+from app.services import metrics
+from app.services import log_service
+from app.services import tracing
+from app.services import static_assets
+from app.middleware.compression import CompressionMiddleware, RESPONSE_COMPRESSION_ENABLED
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.request_id import RequestIdMiddleware
+from app.middleware.tracing import TracingMiddleware
+import asyncio
+
+# 프로젝트 루트 (작업 디렉토리와 관계없이 정적 파일과 index.html을 찾기 위해 사용)
+PROJECT_ROOT = static_assets.PROJECT_ROOT
+STATIC_DIR = static_assets.STATIC_DIR
 
 app = FastAPI(
     title="365 어드벤처: 크툴루",
@@ -12,56 +27,38 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# CSS 변환 함수
-def convert_css_to_js():
-    """CSS 파일을 JavaScript로 변환"""
+logger = log_service.get_logger(__name__)
+
+def preload_encounter_data():
+    """조우 데이터를 미리 로드하여 첫 요청에서 파일을 읽지 않도록 함"""
     try:
-        css_path = Path('static/css/style.css')
-        js_path = Path('static/js/styles.js')
-        
-        if not css_path.exists():
-            return
-        
-        # CSS 파일 읽기
-        css_content = css_path.read_text(encoding='utf-8')
-        
-        # JavaScript 파일 생성
-        js_content = f"""// CSS 스타일을 동적으로 주입
-// 이 파일은 static/css/style.css에서 자동 생성되었습니다.
-(function() {{
-    // 이미 주입되었는지 확인
-    if (document.getElementById('injected-styles')) {{
-        return;
-    }}
-    
-    // <style> 태그 생성 및 CSS 주입
-    const style = document.createElement('style');
-    style.id = 'injected-styles';
-    style.textContent = {json.dumps(css_content)};
-    
-    // <head>에 추가 (가능한 한 빨리)
-    if (document.head) {{
-        document.head.appendChild(style);
-    }} else {{
-        // head가 아직 없으면 DOMContentLoaded 대기
-        document.addEventListener('DOMContentLoaded', function() {{
-            document.head.appendChild(style);
-        }});
-    }}
-}})();
-"""
-        
-        # JavaScript 파일 저장
-        js_path.parent.mkdir(parents=True, exist_ok=True)
-        js_path.write_text(js_content, encoding='utf-8')
-        print("✓ CSS가 JavaScript로 변환되었습니다: static/js/styles.js")
-    except Exception as e:
-        print(f"⚠ CSS 변환 중 오류: {e}")
-
-# Startup 이벤트: 서버 시작/리로드 시 CSS 변환
+        encounter_data.get_dataset()
+    except encounter_data.EncounterDataError as e:
+        logger.warning("조우 데이터 로드 실패: %s", e.detail)
+
+
+# Startup 이벤트: 서버 시작/리로드 시 프롬프트/조우 데이터 로드
 @app.on_event("startup")
 async def startup_event():
-    convert_css_to_js()
+    from app.services import llm_service
+    prompt_registry.registry.load()
+    preload_encounter_data()
+    await llm_service.init_http_client()
+    # 저장 시에도 기준을 넘으면 컴팩션하므로, 백그라운드 컴팩터는 저장 경로의 지연을 줄이는 최적화
+    if storage_service.STORAGE_BACKEND == "journal":
+        app.state.journal_compactor = asyncio.create_task(save_journal.run_compactor())
+
+
+# Shutdown 이벤트: 공유 HTTP 커넥션 풀 정리, 저널 컴팩션
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.services import llm_service
+    await llm_service.close_http_client()
+    compactor = getattr(app.state, "journal_compactor", None)
+    if compactor is not None:
+        compactor.cancel()
+        save_journal.compact_all(force=True)
+    log_service.shutdown()
 
 # CORS 설정
 
@@ -73,19 +70,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# JSON 응답 압축 (gzip, brotli 설치 시 br)
+if RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# 요청 지표 수집 (압축 미들웨어 바깥에서 압축 시간까지 포함하여 측정)
+# add_middleware는 나중에 추가한 미들웨어가 바깥을 감싸므로 아래의 트레이싱/요청 ID 미들웨어가 이보다 바깥
+if metrics.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 요청 트레이싱 (Server-Timing 헤더, TRACE_EXPORT_PATH 설정 시 OTLP JSON 기록)
+if tracing.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
+# 요청 ID (가장 바깥에서 설정하여 모든 로그와 트레이스에 포함)
+app.add_middleware(RequestIdMiddleware)
+
 # API 라우터 등록
 app.include_router(game.router)
 app.include_router(narrative.router)
 
-# 정적 파일 서빙
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# 빌드된 번들 (tools/build_assets.py): 내용 해시가 파일 이름에 있으므로 immutable 캐시,
+# Accept-Encoding에 따라 사전 압축본(br, gzip) 제공. /static 마운트보다 먼저 등록해야 함
+@app.get(static_assets.DIST_URL_PREFIX + "{filename}", include_in_schema=False)
+async def get_bundle(filename: str, request: Request):
+    """해시된 정적 번들"""
+    bundle = static_assets.assets.get_bundle(filename)
+    if bundle is None:
+        return PlainTextResponse("Not Found", status_code=404)
+    headers = {
+        "Cache-Control": static_assets.BUNDLE_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "X-Content-Type-Options": "nosniff",
+    }
+    # 인코딩별 ETag는 모두 같은 내용이므로 클라이언트가 가진 표현과 일치하면 그 ETag로 304
+    matched = encounter_data.matching_etag(request.headers.get("if-none-match"), bundle.etags.values())
+    if matched is not None:
+        headers["ETag"] = matched
+        return Response(status_code=304, headers=headers)
+    encoding, body, etag = bundle.select(request.headers.get("accept-encoding"))
+    headers["ETag"] = etag
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=bundle.media_type, headers=headers)
+
+
+# 정적 파일 서빙 (빌드하지 않은 원본 파일)
+app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+
+
+if metrics.METRICS_ENABLED:
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def get_metrics():
+        """Prometheus 텍스트 형식 지표"""
+        return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
 
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
-    """모든 경로를 SPA로 리다이렉트"""
+    """모든 경로를 SPA로 리다이렉트 (빌드된 index.html이 있으면 번들 사용)"""
     try:
-        with open("index.html", "r", encoding="utf-8") as f:
+        with open(static_assets.assets.index_html_path(), "r", encoding="utf-8") as f:
             content = f.read()
             return Response(
                 content=content,
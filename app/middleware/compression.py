@@ -0,0 +1,191 @@
+import os
+import gzip
+from typing import Optional, Dict, List, Tuple
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 사용
+    brotli = None
+
+
+# JSON 응답 압축 설정
+RESPONSE_COMPRESSION_ENABLED = os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+RESPONSE_GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+RESPONSE_BROTLI_QUALITY = int(os.getenv("RESPONSE_BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = ("application/json",)
+
+
+def _accept_encoding_qualities(header: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding 헤더의 인코딩별 q 값 (소문자, 잘못된 q 값은 0)"""
+    qualities: Dict[str, float] = {}
+    if not header:
+        return qualities
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if token:
+            qualities[token] = quality
+    return qualities
+
+
+def accepts_encoding(header: Optional[str], encoding: str) -> bool:
+    """
+    Accept-Encoding 헤더가 encoding을 허용하는지 확인
+
+    명시한 인코딩의 q 값이 "*"보다 우선합니다. (예: "gzip;q=0, *"는 gzip을 허용하지 않음)
+    """
+    qualities = _accept_encoding_qualities(header)
+    if encoding in qualities:
+        return qualities[encoding] > 0
+    return qualities.get("*", 0.0) > 0
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """사용할 압축 방식 (br 우선, brotli 미설치 시 gzip, 허용되지 않으면 None)"""
+    if brotli is not None and accepts_encoding(accept_encoding, "br"):
+        return "br"
+    if accepts_encoding(accept_encoding, "gzip"):
+        return "gzip"
+    return None
+
+
+def weaken_etag(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    """
+    강한 ETag를 약한 ETag로 변경 (압축으로 본문 바이트가 달라진 응답용)
+
+    엔드포인트가 원본 본문 기준으로 만든 강한 ETag를 압축 본문에 그대로 쓰면 캐시/프록시가
+    다른 인코딩의 본문으로 304를 처리할 수 있으므로, 내용만 같다는 의미의 W/ ETag로 바꿉니다.
+    """
+    return [
+        (name, b"W/" + value) if name == b"etag" and value.startswith(b'"') else (name, value)
+        for name, value in headers
+    ]
+
+
+def add_vary_accept_encoding(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    """Vary에 Accept-Encoding 추가 (이미 있으면 그대로)"""
+    for name, value in headers:
+        if name == b"vary" and (b"accept-encoding" in value.lower() or value.strip() == b"*"):
+            return headers
+    return headers + [(b"vary", b"Accept-Encoding")]
+
+
+class CompressionMiddleware:
+    """
+    JSON 응답 압축 ASGI 미들웨어 (gzip, brotli가 설치되어 있으면 br)
+
+    - Content-Type이 application/json이고 본문이 minimum_size 이상인 응답만 압축
+    - 이미 Content-Encoding이 있는 응답 (미리 압축된 조우 데이터 등)과
+      스트리밍 응답 (SSE)은 그대로 전달
+    - 압축한 응답의 강한 ETag는 약한 ETag(W/)로 바꾸고, 약한 ETag로 재검증한 304에도 W/를 붙임
+    - 압축 대상 응답과 304에는 압축 여부와 관계없이 Vary: Accept-Encoding 추가
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = RESPONSE_COMPRESSION_MIN_SIZE,
+        gzip_level: int = RESPONSE_GZIP_LEVEL,
+        brotli_quality: int = RESPONSE_BROTLI_QUALITY
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        if_none_match = b""
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+            elif name == b"if-none-match":
+                if_none_match = value
+        encoding = choose_encoding(accept_encoding)
+
+        start_message = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                if message["status"] == 304:
+                    # 304에도 200 응답과 같은 Vary를 보내고, 클라이언트가 압축 응답의 약한 ETag로
+                    # 재검증했으면 304에도 같은 ETag
+                    passthrough = True
+                    headers = add_vary_accept_encoding(headers)
+                    if b"W/" in if_none_match:
+                        headers = [
+                            (name, value) if name != b"etag" or b"W/" + value not in if_none_match
+                            else (name, b"W/" + value)
+                            for name, value in headers
+                        ]
+                    await send({**message, "headers": headers})
+                    return
+                content_type = b""
+                for name, value in headers:
+                    if name == b"content-encoding":
+                        passthrough = True
+                    elif name == b"content-type":
+                        content_type = value
+                if not content_type.decode("latin-1").startswith(COMPRESSIBLE_TYPES):
+                    passthrough = True
+                if passthrough:
+                    await send(message)
+                elif encoding is None:
+                    # 이 요청은 압축하지 않지만 다른 클라이언트에는 압축 본문을 보내므로 캐시가 구분하도록
+                    passthrough = True
+                    await send({**message, "headers": add_vary_accept_encoding(headers)})
+                else:
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            headers: List[Tuple[bytes, bytes]] = [
+                (name, value) for name, value in start_message.get("headers", [])
+                if name != b"content-length"
+            ]
+            if len(body) >= self.minimum_size:
+                body = self.compress(body, encoding)
+                headers = weaken_etag(headers)
+                headers.append((b"content-encoding", encoding.encode("latin-1")))
+            headers = add_vary_accept_encoding(headers)
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """본문 압축"""
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
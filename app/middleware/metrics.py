@@ -0,0 +1,71 @@
+import time
+from typing import Dict, Any, Optional
+
+from app.services import metrics
+
+
+# 라우트에 매칭되지 않은 요청의 route 레이블 (임의 경로로 레이블 수가 늘어나지 않도록 하나로 묶음)
+UNMATCHED_ROUTE = "unmatched"
+
+BODY_METHODS = ("POST", "PUT", "PATCH")
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 지표 수집 ASGI 미들웨어
+
+    - 라우터 경로 템플릿별 처리 시간 (응답 본문 전송 완료까지, SSE는 스트림 종료까지)
+    - 본문이 있는 요청의 본문 크기 (game_data 크기)
+
+    route 레이블은 라우팅 후 scope에 설정되는 endpoint로 찾은 경로 템플릿
+    (예: /api/narrative/report/{month})이므로 월 이름, 날짜 등으로 레이블이 늘어나지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: Optional[Dict[Any, str]] = None
+
+    def _route_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        if self._route_paths is None or endpoint not in self._route_paths:
+            # 첫 요청 (또는 라우트가 바뀐 뒤) 앱의 라우트 목록으로 endpoint -> 경로 템플릿 구성
+            paths = {}
+            for route in getattr(scope.get("app"), "routes", []):
+                route_endpoint = getattr(route, "endpoint", None) or getattr(route, "app", None)
+                if route_endpoint is not None and route_endpoint not in paths:
+                    paths[route_endpoint] = route.path
+            self._route_paths = paths
+        return self._route_paths.get(endpoint, UNMATCHED_ROUTE)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        method = scope.get("method", "GET")
+        status = 500
+        body_bytes = 0
+
+        async def receive_counted():
+            nonlocal body_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                body_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_counted, send_with_status)
+        finally:
+            route = self._route_label(scope)
+            metrics.http_request_duration_seconds.observe(time.perf_counter() - started, method, route, str(status))
+            if method in BODY_METHODS:
+                metrics.http_request_body_bytes.observe(body_bytes, method, route)
@@ -0,0 +1,52 @@
+import re
+import uuid
+
+from app.services import log_service
+
+
+REQUEST_ID_HEADER = "x-request-id"
+
+# 클라이언트가 보낸 요청 ID를 그대로 쓸 수 있는 형식 (로그 주입 방지)
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestIdMiddleware:
+    """
+    요청 ID ASGI 미들웨어
+
+    X-Request-ID 헤더가 있으면 그 값을, 없으면 새 ID를 요청 ID로 사용합니다.
+    요청 ID는 처리하는 동안 log_service.request_id_var에 설정되어
+    한 조우의 스토리, 요약 줄, 주간 요약 LLM 호출 로그를 하나로 묶고,
+    응답의 X-Request-ID 헤더로 클라이언트에 돌려줍니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER.encode("latin-1"):
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                headers = [(name, value) for name, value in message.get("headers", []) if name.lower() != REQUEST_ID_HEADER.encode("latin-1")]
+                headers.append((REQUEST_ID_HEADER.encode("latin-1"), request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = log_service.request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            log_service.request_id_var.reset(token)
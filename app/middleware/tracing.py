@@ -0,0 +1,57 @@
+from app.services import tracing
+from app.services import log_service
+
+
+SERVER_TIMING_HEADER = b"server-timing"
+
+
+class TracingMiddleware:
+    """
+    요청 트레이싱 ASGI 미들웨어
+
+    요청마다 트레이스를 시작하고 (루트 span "request"), 응답 시작 시점까지 종료된 span을
+    이름별로 합산해 Server-Timing 헤더에 추가합니다. 엔드포인트가 이미 Server-Timing을
+    설정했으면 (예: /encounter의 LLM 단계별 시간) 그 뒤에 이어 붙입니다.
+    SSE처럼 본문을 나눠 보내는 응답은 헤더 이후의 span이 트레이스 파일에만 기록됩니다.
+
+    RequestIdMiddleware 안쪽에 두어 트레이스에 요청 ID를 함께 기록합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = None
+
+        async def send_with_server_timing(message):
+            if message["type"] == "http.response.start":
+                trace.root.attributes["http.status_code"] = message["status"]
+                summary = tracing.server_timing(trace)
+                if summary:
+                    headers = []
+                    existing = None
+                    for name, value in message.get("headers", []):
+                        if name.lower() == SERVER_TIMING_HEADER:
+                            existing = value.decode("latin-1")
+                        else:
+                            headers.append((name, value))
+                    value = f"{existing}, {summary}" if existing else summary
+                    headers.append((SERVER_TIMING_HEADER, value.encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            with tracing.start_trace(
+                "request",
+                request_id=log_service.request_id_var.get(),
+                **{"http.method": scope.get("method", "GET"), "http.target": scope.get("path", "")}
+            ) as trace:
+                await self.app(scope, receive, send_with_server_timing)
+        finally:
+            # 루트 span까지 종료된 뒤 기록
+            if trace is not None:
+                tracing.export(trace)
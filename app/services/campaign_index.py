@@ -0,0 +1,96 @@
+from datetime import date, datetime
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.services import log_service
+
+
+YearMonth = Tuple[int, int]
+IsoWeek = Tuple[int, int]
+
+logger = log_service.get_logger(__name__)
+
+# 실패 조우 후보에서 제외하는 target_name
+UNSELECTED_TARGET_NAME = "선택되지 않은 조우"
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """YYYY-MM-DD 문자열을 date로 변환 (형식이 다르면 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+class CampaignIndex:
+    """
+    캠페인 기록 조회 인덱스
+
+    조우 처리 시 필요한 조회를 일일 엔트리/주간 기록 전체를 매번 훑지 않고 처리합니다.
+    - 날짜는 한 번만 파싱
+    - 일일 엔트리: ISO 주별, 연-월별 목록
+    - 주간 기록: 종료일의 연-월별 목록, 일요일 조우 결과
+    - 실패한 주요 조우의 target_name 목록
+
+    build()로 한 번 만든 뒤 add_daily_entry()/add_weekly_record()로 증분 갱신할 수 있습니다.
+    revision은 인덱스가 반영한 게임 데이터의 revision입니다.
+    (성공/일요일 조우 집계는 세이브의 통계 블록(campaign_statistics)에 있습니다.)
+    """
+
+    def __init__(self, revision: int = 0):
+        self.revision = revision
+        self._entries_by_week: Dict[IsoWeek, List[Tuple[date, Dict[str, Any]]]] = {}
+        self._entries_by_month: Dict[YearMonth, List[Tuple[date, Dict[str, Any]]]] = {}
+        self._weekly_records_by_month: Dict[YearMonth, List[Tuple[date, Dict[str, Any]]]] = {}
+        self.failed_target_names: List[str] = []
+
+    @classmethod
+    def build(cls, data: Dict[str, Any]) -> "CampaignIndex":
+        """게임 데이터로부터 인덱스 생성"""
+        revision = int(data.get("save_file_info", {}).get("revision", 0))
+        index = cls(revision)
+        for chapter in data.get("campaign_history", {}).get("monthly_chapters", []):
+            for entry in chapter.get("daily_entries", []):
+                index.add_daily_entry(entry)
+        for record in data.get("legacy_inventory", {}).get("weekly_records", []):
+            index.add_weekly_record(record)
+        return index
+
+    def is_current(self, data: Dict[str, Any]) -> bool:
+        """인덱스가 게임 데이터의 현재 revision을 반영하고 있는지 확인"""
+        return self.revision == int(data.get("save_file_info", {}).get("revision", 0))
+
+    def add_daily_entry(self, entry: Dict[str, Any]) -> None:
+        """일일 엔트리 추가 반영"""
+        entry_date = _parse_date(entry.get("diary_write_date"))
+        if entry_date is None:
+            logger.warning("인덱스에서 날짜 형식이 잘못된 엔트리를 건너뜁니다: %s", entry.get("diary_write_date"))
+            return
+        item = (entry_date, entry)
+        self._entries_by_week.setdefault(tuple(entry_date.isocalendar()[:2]), []).append(item)
+        self._entries_by_month.setdefault((entry_date.year, entry_date.month), []).append(item)
+
+    def add_weekly_record(self, record: Dict[str, Any]) -> None:
+        """주간 기록 추가 반영"""
+        for encounter in record.get("key_encounters", []):
+            target_name = encounter.get("target_name")
+            if encounter.get("outcome") == "실패" and target_name and target_name != UNSELECTED_TARGET_NAME:
+                self.failed_target_names.append(target_name)
+
+        week_end_date = _parse_date(record.get("week_end_date"))
+        if week_end_date is not None:
+            year_month = (week_end_date.year, week_end_date.month)
+            self._weekly_records_by_month.setdefault(year_month, []).append((week_end_date, record))
+
+    def entries_in_week(self, day: date) -> List[Tuple[date, Dict[str, Any]]]:
+        """day가 속한 ISO 주(월~일)의 일일 엔트리 (추가된 순서)"""
+        return self._entries_by_week.get(tuple(day.isocalendar()[:2]), [])
+
+    def entries_in_month(self, year: int, month: int) -> List[Tuple[date, Dict[str, Any]]]:
+        """연-월의 일일 엔트리 (추가된 순서)"""
+        return self._entries_by_month.get((year, month), [])
+
+    def weekly_records_ending_in(self, year: int, month: int) -> List[Dict[str, Any]]:
+        """종료일이 연-월에 속하는 주간 기록 (추가된 순서)"""
+        return [record for _, record in self._weekly_records_by_month.get((year, month), [])]
@@ -0,0 +1,209 @@
+import calendar
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
+
+from app.services.delta_protocol import DeltaSliceError
+
+
+# 통계 블록 스키마 버전 (집계 항목이 바뀌면 올려서 기존 세이브를 다시 백필, static/js/delta_sync.js의 값도 함께 변경)
+STATISTICS_VERSION = 2
+
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December"]
+
+# 월별 보고서에 항상 표시하는 행동 유형
+REPORTED_ACTION_TYPES = ("COMBAT", "INVESTIGATION", "SEARCH")
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """YYYY-MM-DD 문자열을 date로 변환 (형식이 다르면 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def month_key(year: int, month: int) -> str:
+    """월별 통계 키 (예: "1925-01")"""
+    return f"{year:04d}-{month:02d}"
+
+
+def month_key_for_name(campaign_year: int, month_name: str) -> Optional[str]:
+    """캠페인 연도와 월 이름(예: "January")의 월별 통계 키 (올바른 월 이름이 아니면 None)"""
+    try:
+        return month_key(campaign_year, MONTH_NAMES.index(month_name) + 1)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def days_in_month(year: int, month: int) -> int:
+    """연-월의 일수"""
+    return calendar.monthrange(year, month)[1]
+
+
+def new_statistics() -> Dict[str, Any]:
+    """빈 통계 블록"""
+    return {
+        "description": "일일 엔트리/주간 기록이 추가될 때마다 갱신되는 월별 집계 (연-월 키)",
+        "version": STATISTICS_VERSION,
+        "months": {}
+    }
+
+
+def _new_month() -> Dict[str, Any]:
+    return {
+        "total_entries": 0,
+        "success_count": 0,
+        "written_day_mask": 0,
+        "total_madness": 0,
+        "madness_triggered_count": 0,
+        "action_type_counts": {},
+        "sunday_total_count": 0,
+        "sunday_success_count": 0,
+        "weekly_sunday_total_count": 0,
+        "weekly_sunday_success_count": 0,
+        "sunday_encounters": {}
+    }
+
+
+def _month_for(statistics: Dict[str, Any], day: date) -> Dict[str, Any]:
+    months = statistics["months"]
+    key = month_key(day.year, day.month)
+    month = months.get(key)
+    if month is None:
+        month = months[key] = _new_month()
+    return month
+
+
+def _record_sunday(month: Dict[str, Any], day: date, target_name: str, is_success: bool) -> None:
+    """
+    일요일 조우 결과 반영 (날짜별로 한 번만 집계)
+
+    같은 날짜의 일요일 조우가 일일 엔트리와 주간 기록 양쪽에서 들어오면 하나로 합치고,
+    어느 한쪽이라도 성공이면 성공으로 집계합니다.
+    """
+    sundays = month["sunday_encounters"]
+    key = day.isoformat()
+    existing = sundays.get(key)
+    if existing is None:
+        sundays[key] = {"target_name": target_name, "is_success": is_success}
+        month["sunday_total_count"] += 1
+        month["sunday_success_count"] += is_success
+    elif is_success and not existing["is_success"]:
+        existing["target_name"] = target_name
+        existing["is_success"] = True
+        month["sunday_success_count"] += 1
+
+
+def record_daily_entry(data: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """
+    일일 엔트리 추가를 통계 블록에 반영 (O(1))
+
+    통계 블록이 없는 (백필 전) 세이브는 그대로 둡니다. 이후 ensure_statistics()의 백필에 포함됩니다.
+    """
+    statistics = data.get("statistics")
+    entry_date = _parse_date(entry.get("diary_write_date"))
+    if statistics is None or entry_date is None:
+        return
+    month = _month_for(statistics, entry_date)
+    snapshot = entry.get("game_logic_snapshot", {})
+    is_success = bool(snapshot.get("is_success", False))
+
+    month["total_entries"] += 1
+    month["success_count"] += is_success
+    month["written_day_mask"] |= 1 << entry_date.day
+    month["total_madness"] += snapshot.get("cthulhu_symbol_count", 0)
+    month["madness_triggered_count"] += bool(snapshot.get("madness_triggered", False))
+    action_type = snapshot.get("action_type", "")
+    if action_type:
+        action_type_counts = month["action_type_counts"]
+        action_type_counts[action_type] = action_type_counts.get(action_type, 0) + 1
+    if entry.get("day_of_week") == "Sunday":
+        _record_sunday(month, entry_date, snapshot.get("target_name", ""), is_success)
+
+
+def record_weekly_record(data: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """
+    주간 기록 추가를 통계 블록에 반영 (O(1), 주 종료일의 월에 집계)
+
+    통계 블록이 없는 (백필 전) 세이브는 그대로 둡니다.
+    """
+    statistics = data.get("statistics")
+    week_end_date = _parse_date(record.get("week_end_date"))
+    sunday_encounter = record.get("sunday_encounter", {})
+    if statistics is None or week_end_date is None or not sunday_encounter:
+        return
+    month = _month_for(statistics, week_end_date)
+    is_success = bool(sunday_encounter.get("is_success", False))
+    month["weekly_sunday_total_count"] += 1
+    month["weekly_sunday_success_count"] += is_success
+    _record_sunday(month, week_end_date, sunday_encounter.get("target_name", "알 수 없는 조우"), is_success)
+
+
+def build_statistics(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    게임 데이터 전체를 훑어 통계 블록 생성 (기존 세이브 백필용)
+
+    Raises:
+        DeltaSliceError: 축약본 챕터가 있어 일일 엔트리를 모두 볼 수 없는 경우
+    """
+    chapters = data.get("campaign_history", {}).get("monthly_chapters", [])
+    for chapter in chapters:
+        if chapter.get("is_stub"):
+            raise DeltaSliceError("통계 블록이 없는 세이브는 모든 챕터 전체가 필요합니다.")
+
+    view = {"statistics": new_statistics()}
+    for chapter in chapters:
+        for entry in chapter.get("daily_entries", []):
+            record_daily_entry(view, entry)
+    for record in data.get("legacy_inventory", {}).get("weekly_records", []):
+        record_weekly_record(view, record)
+    return view["statistics"]
+
+
+def has_current_statistics(data: Dict[str, Any]) -> bool:
+    """현재 버전의 통계 블록이 있는지 확인 (백필 불필요)"""
+    statistics = data.get("statistics")
+    return isinstance(statistics, dict) and statistics.get("version") == STATISTICS_VERSION
+
+
+def ensure_statistics(data: Dict[str, Any]) -> bool:
+    """
+    통계 블록이 없거나 버전이 다른 세이브 백필 (한 번만 수행)
+
+    Returns:
+        백필 수행 여부
+
+    Raises:
+        DeltaSliceError: 백필이 필요한데 축약본 챕터가 있는 경우
+    """
+    if has_current_statistics(data):
+        return False
+    data["statistics"] = build_statistics(data)
+    return True
+
+
+def get_month(data: Dict[str, Any], key: Optional[str]) -> Dict[str, Any]:
+    """월별 통계 (기록이 없으면 0으로 채운 빈 집계, 호출자가 변경하면 안 됨)"""
+    month = data.get("statistics", {}).get("months", {}).get(key) if key else None
+    return month if month is not None else _new_month()
+
+
+def bosses_defeated(month: Dict[str, Any]) -> List[str]:
+    """성공한 일요일 조우의 target_name (날짜가 기록된 순서)"""
+    return [sunday["target_name"] for sunday in month["sunday_encounters"].values() if sunday["is_success"]]
+
+
+def written_days(month: Dict[str, Any]) -> List[int]:
+    """일기를 작성한 날짜(일) 목록 (written_day_mask의 비트 i가 i일)"""
+    mask = month["written_day_mask"]
+    return [day for day in range(1, mask.bit_length()) if mask >> day & 1]
+
+
+def success_rate(success: int, total: int) -> float:
+    """성공률 (%, 소수점 한 자리, 기록이 없으면 0.0)"""
+    return round(success / total * 100, 1) if total > 0 else 0.0
@@ -0,0 +1,206 @@
+from typing import Optional, Dict, Any, List, Iterable
+
+
+class DeltaConflictError(Exception):
+    """클라이언트가 보낸 base_revision이 game_data의 revision과 다름"""
+
+
+class DeltaSliceError(Exception):
+    """엔드포인트가 읽어야 하는 데이터가 클라이언트 슬라이스에서 빠져 있음"""
+
+
+# 뒤에 추가만 되는 기록 리스트 (챕터의 daily_entries, legacy_inventory.weekly_records)
+APPEND_ONLY_KEYS = frozenset({"daily_entries", "weekly_records"})
+
+
+class _ListTail:
+    """스냅샷에서 뒤에 추가만 되는 리스트 대신 보관하는 길이 (기존 항목은 비교하지 않음)"""
+
+    __slots__ = ("length",)
+
+    def __init__(self, length: int):
+        self.length = length
+
+
+def snapshot(value: Any) -> Any:
+    """
+    패치 계산용 스냅샷 (make_patch의 before로 사용)
+
+    APPEND_ONLY_KEYS 리스트는 항목을 복사하지 않고 길이만 기록하므로, 스냅샷과 이후의 make_patch 비용은
+    누적 기록의 양이 아니라 챕터 헤더와 상태 블록의 크기에 비례합니다.
+    JSON 스칼라는 변경할 수 없으므로 그대로 공유합니다.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _ListTail(len(item)) if key in APPEND_ONLY_KEYS and isinstance(item, list) else snapshot(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [snapshot(item) for item in value]
+    return value
+
+
+def get_revision(game_data: Dict[str, Any]) -> int:
+    """게임 데이터의 revision (없으면 0)"""
+    return int(game_data.get("save_file_info", {}).get("revision", 0))
+
+
+def _escape_pointer_token(token: str) -> str:
+    """JSON Pointer 토큰 이스케이프 (RFC 6901)"""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def make_patch(before: Any, after: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    두 JSON 문서의 차이를 JSON Patch (RFC 6902) 연산 목록으로 계산
+
+    리스트는 인덱스 단위로 비교하며, 뒤에 추가된 항목은 add, 줄어든 항목은 뒤에서부터 remove로
+    표현합니다. (게임 데이터의 리스트는 대부분 뒤에 추가만 되므로 이 방식이 가장 작은 패치를 만듭니다.)
+
+    Args:
+        before: 변경 전 문서 (또는 snapshot() 결과)
+        after: 변경 후 문서
+        path: 비교 시작 위치의 JSON Pointer
+
+    Returns:
+        패치 연산 목록 (예: [{"op": "add", "path": "/a/0", "value": 1}])
+    """
+    ops: List[Dict[str, Any]] = []
+    _diff(before, after, path, ops)
+    return ops
+
+
+def _diff(before: Any, after: Any, path: str, ops: List[Dict[str, Any]]) -> None:
+    if isinstance(before, _ListTail):
+        if not isinstance(after, list):
+            ops.append({"op": "replace", "path": path, "value": after})
+            return
+        # snapshot()의 append-only 리스트: 추가된 항목만 비교
+        for index in range(before.length, len(after)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": after[index]})
+        for index in range(before.length - 1, len(after) - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+    elif isinstance(before, dict) and isinstance(after, dict):
+        for key in before:
+            if key not in after:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer_token(key)}"})
+        for key, value in after.items():
+            child_path = f"{path}/{_escape_pointer_token(key)}"
+            if key not in before:
+                ops.append({"op": "add", "path": child_path, "value": value})
+            else:
+                _diff(before[key], value, child_path, ops)
+    elif isinstance(before, list) and isinstance(after, list):
+        common = min(len(before), len(after))
+        for index in range(common):
+            _diff(before[index], after[index], f"{path}/{index}", ops)
+        for index in range(common, len(after)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": after[index]})
+        for index in range(len(before) - 1, len(after) - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+    elif type(before) is not type(after) or before != after:
+        ops.append({"op": "replace", "path": path, "value": after})
+
+
+def _parse_pointer(path: str) -> List[str]:
+    """JSON Pointer 파싱 (RFC 6901)"""
+    if path == "":
+        return []
+    return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
+
+
+def apply_patch(doc: Any, ops: Iterable[Dict[str, Any]]) -> Any:
+    """
+    make_patch가 만든 패치(add/remove/replace)를 문서에 적용 (doc을 직접 변경)
+
+    Args:
+        doc: 대상 문서
+        ops: 패치 연산 목록
+
+    Returns:
+        패치가 적용된 문서 (루트를 교체하는 연산이 있으면 새 문서)
+    """
+    for op in ops:
+        tokens = _parse_pointer(op["path"])
+        if not tokens:
+            doc = op.get("value")
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return doc
+
+
+def require_full_chapters(game_data: Dict[str, Any], month_names: Iterable[str]) -> None:
+    """
+    슬라이스에서 필요한 월의 챕터가 축약본({"month": ..., "is_stub": true})이 아닌지 확인
+
+    클라이언트는 인덱스를 유지하기 위해 읽지 않는 월의 챕터를 축약본으로 보냅니다.
+
+    Raises:
+        DeltaSliceError: 필요한 챕터가 축약본인 경우
+    """
+    needed = set(month_names)
+    for chapter in game_data.get("campaign_history", {}).get("monthly_chapters", []):
+        if chapter.get("month") in needed and chapter.get("is_stub"):
+            raise DeltaSliceError(f"{chapter.get('month')} 챕터 전체가 필요합니다.")
+
+
+class DeltaTracker:
+    """
+    요청 하나의 game_data 변경을 추적하여 응답을 만드는 헬퍼
+
+    - base_revision이 없으면 (기존 방식) 전체 game_data를 그대로 반환
+    - base_revision이 있으면 처리 전 스냅샷(snapshot())과 비교한 패치만 반환
+      (누적 기록은 길이만 기록하므로 서버 캠페인 저장소의 전체 데이터에서도 기록 양과 관계없이 빠름)
+
+    두 방식 모두 save_file_info.revision을 1 증가시킵니다.
+    """
+
+    def __init__(self, game_data: Dict[str, Any], base_revision: Optional[int] = None):
+        self.game_data = game_data
+        self.base_revision = base_revision
+        current_revision = get_revision(game_data)
+        if base_revision is not None and base_revision != current_revision:
+            raise DeltaConflictError(
+                f"revision이 일치하지 않습니다. (base_revision={base_revision}, game_data={current_revision})"
+            )
+        self.revision = current_revision
+        # 패치 계산용 스냅샷 (delta 모드에서만, 누적 기록 리스트는 길이만 보관)
+        self._before = snapshot(game_data) if base_revision is not None else None
+
+    @property
+    def is_delta(self) -> bool:
+        return self.base_revision is not None
+
+    def finish(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        revision을 증가시키고 응답의 game_data를 (delta 모드에서) 패치로 교체
+
+        Args:
+            response: "game_data" 키를 포함한 응답 딕셔너리
+
+        Returns:
+            revision (delta 모드에서는 base_revision, patch 포함)이 추가된 응답 딕셔너리
+        """
+        new_revision = self.revision + 1
+        self.game_data.setdefault("save_file_info", {})["revision"] = new_revision
+        response["revision"] = new_revision
+        if self.is_delta:
+            response.pop("game_data", None)
+            response["base_revision"] = self.base_revision
+            response["patch"] = make_patch(self._before, self.game_data)
+        return response
@@ -0,0 +1,247 @@
+import os
+import gzip
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Iterable, Tuple
+
+from app.services import json_codec
+
+
+# 작업 디렉토리와 관계없이 프로젝트 루트의 data 디렉토리 사용
+ENCOUNTER_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "daily_encounter_data.json")
+
+# 클라이언트는 매번 ETag로 재검증 (변경 없으면 304, 본문 전송 없음)
+ENCOUNTER_DATA_CACHE_CONTROL = os.getenv("ENCOUNTER_DATA_CACHE_CONTROL", "public, no-cache")
+
+# 시작 시 주간 인덱스를 미리 조립할 캠페인 연도
+ENCOUNTER_INDEX_YEARS = [
+    int(year) for year in os.getenv("ENCOUNTER_INDEX_YEARS", "1925,1931").split(",") if year.strip()
+]
+
+# 인덱스 연도 외의 주간 응답은 요청 시 조립하고 최근 사용한 주만 보관
+ENCOUNTER_WEEK_CACHE_SIZE = int(os.getenv("ENCOUNTER_WEEK_CACHE_SIZE", "64"))
+
+# 주간 조회를 허용하는 연도 범위 (date.min/max 부근에서는 주 계산이 범위를 벗어남)
+ENCOUNTER_MIN_YEAR = int(os.getenv("ENCOUNTER_MIN_YEAR", "1800"))
+ENCOUNTER_MAX_YEAR = int(os.getenv("ENCOUNTER_MAX_YEAR", "2200"))
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+class EncounterDataError(Exception):
+    """조우 데이터 파일 로드 실패"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class PrecomputedBody:
+    """미리 직렬화된 JSON 응답 본문 (강한 ETag, 선택적 gzip 본문 포함)"""
+
+    def __init__(self, payload: Dict[str, Any], compress: bool = False):
+        self.body: bytes = json_codec.dumps(payload)
+        self.gzip_body: Optional[bytes] = gzip.compress(self.body, compresslevel=9, mtime=0) if compress else None
+        # 강한 ETag (응답 본문 바이트 기준, 압축 본문은 표현이 다르므로 별도 ETag)
+        self.etag: str = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.gzip_etag: Optional[str] = encoding_etag(self.etag, "gzip") if compress else None
+
+
+class EncounterDataset:
+    """
+    daily_encounter_data.json의 불변 메모리 표현 및 조회 인덱스
+
+    - 전체 데이터: /encounter-data 응답 본문을 미리 직렬화/압축
+    - 월일(MM-DD) 인덱스: 날짜별 조우 정보와 응답 본문
+    - 주간(ISO 주) 인덱스: 월~일 7일의 조우 정보와 일요일 보스 조우를 미리 조립
+      (index_years()로 조립한 연도만 보관하고, 그 외의 주는 작은 LRU 캐시에 보관)
+
+    요청마다 JSON 파싱이나 직렬화를 하지 않습니다.
+    """
+
+    def __init__(self, raw: Dict[str, Any]):
+        encounters = raw.get("encounters", {})
+        self.description: str = raw.get("description", "")
+        self.encounters: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+            month_day: MappingProxyType(dict(entry))
+            for month_day, entry in encounters.items()
+        })
+
+        self.full = PrecomputedBody({"success": True, "data": raw}, compress=True)
+        self.day_bodies: Mapping[str, PrecomputedBody] = MappingProxyType({
+            month_day: PrecomputedBody({"success": True, "month_day": month_day, "encounter": entry})
+            for month_day, entry in encounters.items()
+        })
+        self._indexed_weeks: Dict[Tuple[int, int], PrecomputedBody] = {}
+        self._recent_weeks: "OrderedDict[Tuple[int, int], PrecomputedBody]" = OrderedDict()
+        self._week_lock = threading.Lock()
+
+    @property
+    def etag(self) -> str:
+        """전체 데이터 응답의 ETag"""
+        return self.full.etag
+
+    def get(self, month_day: str) -> Optional[Mapping[str, Any]]:
+        """MM-DD 키로 조우 정보 조회"""
+        return self.encounters.get(month_day)
+
+    def get_for_date(self, target_date: date) -> Optional[Mapping[str, Any]]:
+        """날짜의 조우 정보 조회 (연도 무관, 월일 기준)"""
+        return self.encounters.get(target_date.strftime("%m-%d"))
+
+    def build_week(self, target_date: date) -> Dict[str, Any]:
+        """target_date가 속한 ISO 주(월~일)의 조우 정보 조립"""
+        week_start = target_date - timedelta(days=target_date.weekday())
+        iso_year, iso_week, _ = week_start.isocalendar()
+        days = []
+        sunday_boss = None
+        for offset in range(7):
+            day = week_start + timedelta(days=offset)
+            month_day = day.strftime("%m-%d")
+            encounter = self.encounters.get(month_day)
+            entry = {
+                "date": day.strftime("%Y-%m-%d"),
+                "month_day": month_day,
+                "day_of_week": DAY_NAMES[day.weekday()],
+                "is_sunday": day.weekday() == 6,
+                "encounter": dict(encounter) if encounter is not None else None
+            }
+            days.append(entry)
+            if entry["is_sunday"] and encounter is not None:
+                sunday_boss = entry
+        return {
+            "iso_year": iso_year,
+            "iso_week": iso_week,
+            "week_start": week_start.strftime("%Y-%m-%d"),
+            "week_end": (week_start + timedelta(days=6)).strftime("%Y-%m-%d"),
+            "days": days,
+            "sunday_boss": sunday_boss
+        }
+
+    def get_week_body(self, target_date: date) -> PrecomputedBody:
+        """
+        target_date가 속한 주의 응답 본문
+
+        인덱스 연도의 주는 미리 조립한 본문을, 그 외의 주는 최근 사용한 ENCOUNTER_WEEK_CACHE_SIZE개만
+        보관하는 캐시의 본문을 반환합니다.
+
+        Raises:
+            ValueError: 허용 범위(ENCOUNTER_MIN_YEAR~ENCOUNTER_MAX_YEAR) 밖의 연도
+        """
+        if not ENCOUNTER_MIN_YEAR <= target_date.year <= ENCOUNTER_MAX_YEAR:
+            raise ValueError(f"{ENCOUNTER_MIN_YEAR}~{ENCOUNTER_MAX_YEAR}년 범위의 날짜만 조회할 수 있습니다.")
+        key = tuple(target_date.isocalendar()[:2])
+        body = self._indexed_weeks.get(key)
+        if body is not None:
+            return body
+        with self._week_lock:
+            body = self._recent_weeks.get(key)
+            if body is not None:
+                self._recent_weeks.move_to_end(key)
+                return body
+        body = PrecomputedBody({"success": True, "week": self.build_week(target_date)})
+        with self._week_lock:
+            self._recent_weeks[key] = body
+            self._recent_weeks.move_to_end(key)
+            while len(self._recent_weeks) > ENCOUNTER_WEEK_CACHE_SIZE:
+                self._recent_weeks.popitem(last=False)
+        return body
+
+    def index_years(self, years: Iterable[int]) -> None:
+        """지정한 연도의 모든 주를 미리 조립 (캐시 크기와 관계없이 계속 보관)"""
+        for year in years:
+            day = date(year, 1, 1)
+            day -= timedelta(days=day.weekday())
+            while day.year <= year:
+                key = tuple(day.isocalendar()[:2])
+                if key not in self._indexed_weeks:
+                    self._indexed_weeks[key] = PrecomputedBody({"success": True, "week": self.build_week(day)})
+                day += timedelta(days=7)
+
+_dataset: Optional[EncounterDataset] = None
+_dataset_lock = threading.Lock()
+
+
+def load_dataset(path: str = ENCOUNTER_DATA_PATH) -> EncounterDataset:
+    """
+    조우 데이터 파일을 읽어 EncounterDataset 생성
+
+    Raises:
+        EncounterDataError: 파일이 없거나 파싱할 수 없는 경우
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        raise EncounterDataError(404, "daily_encounter_data.json 파일을 찾을 수 없습니다.")
+    except json.JSONDecodeError:
+        raise EncounterDataError(500, "daily_encounter_data.json 파일 파싱 오류")
+    return EncounterDataset(raw)
+
+
+def get_dataset() -> EncounterDataset:
+    """
+    프로세스 전역 조우 데이터 (최초 호출 시 한 번만 로드)
+
+    Raises:
+        EncounterDataError: 파일이 없거나 파싱할 수 없는 경우 (다음 호출에서 다시 시도)
+    """
+    global _dataset
+    if _dataset is None:
+        with _dataset_lock:
+            if _dataset is None:
+                dataset = load_dataset()
+                dataset.index_years(ENCOUNTER_INDEX_YEARS)
+                _dataset = dataset
+    return _dataset
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 현재 ETag와 일치하는지 확인
+
+    여러 개의 ETag, 약한 비교(W/ 접두사), "*"를 지원합니다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def encoding_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    Content-Encoding별 강한 ETag
+
+    같은 내용이라도 압축 여부에 따라 바이트가 다른 표현이므로 강한 ETag도 달라야
+    캐시/프록시가 다른 인코딩의 본문으로 304를 처리하지 않습니다.
+    예: "abc" -> "abc-gzip"
+    """
+    if not encoding:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def matching_etag(if_none_match: Optional[str], etags: Iterable[Optional[str]]) -> Optional[str]:
+    """
+    If-None-Match와 일치하는 ETag 반환 (없으면 None)
+
+    인코딩별 ETag는 모두 같은 내용을 가리키므로 어느 표현이든 일치하면 304로 응답할 수 있으며,
+    304에는 클라이언트가 가진 표현의 ETag를 그대로 돌려줍니다.
+    """
+    for etag in etags:
+        if etag is not None and etag_matches(if_none_match, etag):
+            return etag
+    return None
+
@@ -0,0 +1,79 @@
+import os
+import json
+import time
+from typing import Any, Union
+
+from fastapi.responses import JSONResponse
+
+from app.services import metrics
+from app.services import log_service
+from app.services import tracing
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+
+# JSON 코덱 선택 (auto: orjson이 설치되어 있으면 사용, orjson, stdlib)
+JSON_CODEC = os.getenv("JSON_CODEC", "auto").lower()
+
+_use_orjson = orjson is not None and JSON_CODEC in ("auto", "orjson")
+if JSON_CODEC == "orjson" and orjson is None:
+    log_service.get_logger(__name__).warning("JSON_CODEC=orjson이지만 orjson이 설치되어 있지 않아 표준 json을 사용합니다.")
+
+# 표준 json의 dict 키 변환(int 키 -> 문자열)과 동일하게 동작하도록 설정
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def codec_name() -> str:
+    """현재 사용하는 JSON 코덱 이름"""
+    return "orjson" if _use_orjson else "stdlib"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    JSON 직렬화 (공백 없는 UTF-8 바이트)
+
+    orjson이 처리하지 못하는 값(예: 64비트를 넘는 정수)은 표준 json으로 다시 시도합니다.
+    """
+    if _use_orjson:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj)
+
+
+def dumps_str(obj: Any) -> str:
+    """JSON 직렬화 (문자열)"""
+    return dumps(obj).decode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """JSON 역직렬화"""
+    if _use_orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON 코덱으로 직렬화하는 응답 (game_data 전체를 돌려주는 무거운 엔드포인트용)
+
+    엔드포인트에서 이 응답을 직접 반환하면 FastAPI의 jsonable_encoder 변환도 건너뜁니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        with tracing.span("json.render") as render_span:
+            body = dumps(content)
+            if render_span is not None:
+                render_span.attributes["json.bytes"] = len(body)
+        metrics.json_render_duration_seconds.observe(time.perf_counter() - started)
+        metrics.json_render_bytes.observe(len(body))
+        return body
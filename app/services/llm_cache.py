@@ -0,0 +1,348 @@
+import os
+import abc
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, Awaitable, TypeVar
+
+from app.services import log_service
+
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "256"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))  # 초 단위 (기본 24시간)
+LLM_CACHE_DISK = os.getenv("LLM_CACHE_DISK", "false").lower() in ("1", "true", "yes")
+LLM_CACHE_DISK_MAX_ENTRIES = int(os.getenv("LLM_CACHE_DISK_MAX_ENTRIES", "2000"))
+LLM_CACHE_DIR = Path(os.getenv("LLM_CACHE_DIR", str(DATA_DIR / "llm_cache")))
+LLM_COALESCE_ENABLED = os.getenv("LLM_COALESCE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+T = TypeVar("T")
+
+
+def make_cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    temperature: float
+) -> str:
+    """
+    프롬프트 내용 기반 캐시 키 생성
+
+    Args:
+        model: 모델 이름
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        max_tokens: 최대 토큰 수
+        temperature: 샘플링 온도
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    material = json.dumps(
+        [model, system_prompt, user_prompt, max_tokens, temperature],
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(abc.ABC):
+    """캐시 계층 인터페이스 (다른 저장소를 연결하려면 이 클래스를 상속)"""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 값 (없거나 만료되었으면 None)"""
+
+    @abc.abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """값 저장"""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """저장된 항목 수"""
+
+
+class MemoryLRUCache(CacheBackend):
+    """프로세스 메모리 LRU 캐시 (항목 수 제한 + TTL)"""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, ttl: float = LLM_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if self.ttl > 0 and time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """
+    디스크 캐시 (키별 JSON 파일, 항목 수 제한 + TTL)
+
+    가장 오래된 파일(수정 시각 기준)부터 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        directory: Path = LLM_CACHE_DIR,
+        max_entries: int = LLM_CACHE_DISK_MAX_ENTRIES,
+        ttl: float = LLM_CACHE_TTL
+    ):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._count: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _ensure_dir(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                item = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, IOError):
+            return None
+
+        if self.ttl > 0 and time.time() - item.get("stored_at", 0) > self.ttl:
+            try:
+                path.unlink()
+                with self._lock:
+                    if self._count is not None:
+                        self._count -= 1
+            except OSError:
+                pass
+            return None
+        return item.get("value")
+
+    def set(self, key: str, value: str) -> None:
+        self._ensure_dir()
+        path = self._path(key)
+        is_new = not path.exists()
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": time.time(), "value": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except IOError as e:
+            log_service.get_logger(__name__).warning("LLM 디스크 캐시 저장 실패: %s", e)
+            return
+
+        with self._lock:
+            if self._count is None:
+                self._count = len(list(self.directory.glob("*.json")))
+            elif is_new:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """오래된 항목을 삭제하여 max_entries 이하로 유지 (lock 보유 상태에서 호출)"""
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        excess = len(files) - self.max_entries
+        for path in files[:max(0, excess)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._count = min(len(files), self.max_entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._count = 0
+
+    def __len__(self) -> int:
+        if self._count is None:
+            if not self.directory.exists():
+                return 0
+            self._count = len(list(self.directory.glob("*.json")))
+        return self._count
+
+
+class LLMResponseCache:
+    """
+    계층형 LLM 응답 캐시 (메모리 LRU -> 선택적 디스크)
+
+    디스크 계층에서 찾은 항목은 메모리 계층으로 승격됩니다.
+    """
+
+    def __init__(self, memory: CacheBackend, disk: Optional[CacheBackend] = None):
+        self.memory = memory
+        self.disk = disk
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @property
+    def has_disk(self) -> bool:
+        """디스크 계층 사용 여부 (블로킹 I/O가 발생하는지 판단용)"""
+        return self.disk is not None
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits += 1
+            self.memory_hits += 1
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+        self.stores += 1
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """히트/미스 카운터 및 계층별 항목 수"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "disk_entries": len(self.disk) if self.disk is not None else 0
+        }
+
+
+def create_default_cache() -> Optional[LLMResponseCache]:
+    """환경 변수 설정에 따라 기본 캐시 생성 (비활성화 시 None)"""
+    if not LLM_CACHE_ENABLED:
+        return None
+    disk = DiskCache() if LLM_CACHE_DISK else None
+    return LLMResponseCache(MemoryLRUCache(), disk)
+
+
+class LeaderCancelled(Exception):
+    """SingleFlight의 leader 호출이 취소됨 (대기 중인 호출은 직접 다시 실행)"""
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 호출을 하나로 합치는 in-flight 레지스트리
+
+    먼저 들어온 호출(leader)만 실제로 실행되고, 같은 키로 진행 중인 호출이 있는 동안
+    들어온 호출은 leader의 결과(또는 예외)를 함께 받습니다.
+    leader가 취소되면 (SSE 연결 종료, 단계별 마감 시간 등) 대기 중인 호출은 취소되지 않고
+    그중 하나가 새 leader가 되어 자신의 fn을 실행합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.leader_cancellations = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn을 실행
+
+        Args:
+            key: 요청 식별 키 (프롬프트 fingerprint)
+            fn: 실제 호출을 수행하는 코루틴 함수
+
+        Returns:
+            fn의 결과
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        while future is not None:
+            try:
+                # 대기 중인 호출이 취소되어도 공유 future는 취소되지 않도록 보호
+                return await asyncio.shield(future)
+            except LeaderCancelled:
+                # leader의 finally가 이미 키를 제거했으므로 먼저 깨어난 대기자가 새 leader가 됨
+                future = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        # 대기자가 없을 때 예외가 "never retrieved" 경고로 남지 않도록 처리
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        self.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # 공유 future를 취소하면 대기자까지 CancelledError를 받으므로 재실행 신호로 완료
+            self.leader_cancellations += 1
+            future.set_exception(LeaderCancelled())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """실제 실행/합쳐진 호출 수 및 진행 중인 호출 수"""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "leader_cancellations": self.leader_cancellations,
+            "in_flight": len(self._inflight)
+        }
@@ -1,20 +1,161 @@
 import os
+import json
+import time
+import asyncio
 import httpx
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Optional, Dict, Any, AsyncIterator
 from app.models.game_models import DailyStoryContext
 from app.models.narrative_models import NarrativeMemory
+from app.services import llm_cache
+from app.services import resilience
+from app.services import prompt_registry
+from app.services import metrics
+from app.services import log_service
+from app.services import tracing
 
-load_dotenv()
+logger = log_service.get_logger(__name__)
 
 MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY")
-MISTRAL_API_URL = "https://api.mistral.ai/v1/chat/completions"
+MISTRAL_API_URL = os.getenv("MISTRAL_API_URL", "https://api.mistral.ai/v1/chat/completions")  # 로컬 대역 서버 사용 시 변경
 MISTRAL_MODEL = "mistral-large-latest"  # 또는 "mistral-small", "mistral-large"
+MISTRAL_TEMPERATURE = 1.0
+DAILY_STORY_MAX_TOKENS = 1000
+
+# HTTP 커넥션 풀 설정 (프로세스 전체에서 하나의 클라이언트를 재사용)
+MISTRAL_HTTP_TIMEOUT = float(os.getenv("MISTRAL_HTTP_TIMEOUT", "30.0"))
+MISTRAL_HTTP_MAX_CONNECTIONS = int(os.getenv("MISTRAL_HTTP_MAX_CONNECTIONS", "20"))
+MISTRAL_HTTP_MAX_KEEPALIVE = int(os.getenv("MISTRAL_HTTP_MAX_KEEPALIVE", "10"))
+MISTRAL_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("MISTRAL_HTTP_KEEPALIVE_EXPIRY", "60.0"))
+MISTRAL_HTTP2 = os.getenv("MISTRAL_HTTP2", "false").lower() in ("1", "true", "yes")
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# 동일 프롬프트 재요청(재시도, 중복 제출, 월 결산 재실행)에 대한 응답 캐시
+_llm_cache: Optional[llm_cache.LLMResponseCache] = llm_cache.create_default_cache()
+
+# 진행 중인 동일 프롬프트 요청 합치기 (클라이언트 재시도 시 중복 생성 방지)
+_single_flight = llm_cache.SingleFlight()
+
+# upstream 장애 대응 (재시도/백오프, 서킷 브레이커)
+_retry_policy = resilience.RetryPolicy()
+_circuit_breaker = resilience.CircuitBreaker()
+_resilience_counters = {"retries": 0, "deadline_exceeded": 0}
+
+
+def _http2_available() -> bool:
+    """HTTP/2 사용에 필요한 h2 패키지 설치 여부 확인"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """설정값으로 커넥션 풀을 가진 AsyncClient 생성"""
+    http2 = MISTRAL_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("MISTRAL_HTTP2가 설정되었지만 h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install httpx[http2])")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=MISTRAL_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=MISTRAL_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=MISTRAL_HTTP_KEEPALIVE_EXPIRY
+    )
+    return httpx.AsyncClient(
+        timeout=MISTRAL_HTTP_TIMEOUT,
+        limits=limits,
+        http2=http2
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트 반환 (없으면 생성)
+    
+    Mangum(lifespan="off")처럼 startup 이벤트가 실행되지 않는 환경에서도
+    첫 호출 시점에 클라이언트를 만들어 재사용합니다.
+    커넥션은 이벤트 루프에 묶여 있으므로 루프가 바뀌면 새로 생성합니다.
+    
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    global _http_client, _http_client_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = _create_http_client()
+        _http_client_loop = loop
+    return _http_client
+
+
+async def init_http_client() -> None:
+    """앱 시작 시 공유 HTTP 클라이언트 생성"""
+    get_http_client()
+
+
+async def close_http_client() -> None:
+    """앱 종료 시 공유 HTTP 클라이언트 정리"""
+    global _http_client, _http_client_loop
+
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+def get_llm_cache() -> Optional[llm_cache.LLMResponseCache]:
+    """현재 LLM 응답 캐시 반환 (비활성화 시 None)"""
+    return _llm_cache
+
+
+def set_llm_cache(cache: Optional[llm_cache.LLMResponseCache]) -> None:
+    """LLM 응답 캐시 교체 (None이면 캐시 비활성화)"""
+    global _llm_cache
+    _llm_cache = cache
+
+
+async def _cache_get(key: str) -> Optional[str]:
+    """캐시 조회 (디스크 계층이 있으면 스레드 풀에서 실행)"""
+    cache = _llm_cache
+    if cache is None:
+        return None
+    if cache.has_disk:
+        return await asyncio.to_thread(cache.get, key)
+    return cache.get(key)
+
+
+async def _cache_set(key: str, value: str) -> None:
+    """캐시 저장 (디스크 계층이 있으면 스레드 풀에서 실행)"""
+    cache = _llm_cache
+    if cache is None:
+        return
+    if cache.has_disk:
+        await asyncio.to_thread(cache.set, key, value)
+    else:
+        cache.set(key, value)
+
+
+def get_llm_stats() -> Dict[str, Any]:
+    """LLM 호출 관련 통계 (캐시 히트/미스 등)"""
+    return {
+        "cache": _llm_cache.stats() if _llm_cache is not None else None,
+        "coalescing": _single_flight.stats(),
+        "circuit_breaker": _circuit_breaker.stats(),
+        "retries": _resilience_counters["retries"],
+        "deadline_exceeded": _resilience_counters["deadline_exceeded"]
+    }
 
 
 def load_system_prompt(campaign_year: int = 1925) -> str:
     """
-    시스템 프롬프트 파일 로드 (연도별)
+    시스템 프롬프트 로드 (연도별, 메모리 캐시 사용)
     
     Args:
         campaign_year: 캠페인 연도 (1925 또는 1931)
@@ -22,47 +163,12 @@ def load_system_prompt(campaign_year: int = 1925) -> str:
     Returns:
         시스템 프롬프트 텍스트
     """
-    prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "system_prompt.txt")
-    
-    # 기본 프롬프트 로드
-    base_prompt = ""
-    try:
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            base_prompt = f.read()
-    except FileNotFoundError:
-        base_prompt = """당신은 아컴의 탐정 존 밀러입니다. 러브크래프트 스타일의 호러 느와르 소설을 작성하세요."""
-    
-    # 연도별 배경 설명 추가
-    if campaign_year == 1925:
-        year_context = """
-# 배경 설정 (1925년)
-이 이야기는 크툴루의 부름(The Call of Cthulhu)의 세계관을 배경으로 합니다.
-- 항구에서 들려오는 기이한 소문들, 어두운 골목에서 벌어지는 의문의 사건들
-- 남태평양의 외딴 섬에서 돌아온 선원들의 정신 이상 사례
-- 위대한 옛것을 숭배하는 광신도들의 음모
-- 구스타프 요한센의 일기와 같은 선원들의 기록들이 중요한 단서가 될 수 있음
-- 해양과 항구, 외딴 섬과 관련된 공포가 주요 테마
-"""
-    elif campaign_year == 1931:
-        year_context = """
-# 배경 설정 (1931년)
-이 이야기는 인스머스의 그림자(The Shadow over Innsmouth)의 세계관을 배경으로 합니다.
-- 해안가 마을 인스머스에서 들려오는 기이한 소문들
-- 사람들이 사라지는 해안 도시의 비밀
-- 딥 원스(Deep Ones)와 인간의 잡종에 대한 공포
-- 해안가와 바다, 물속의 존재들이 주요 테마
-- 인스머스의 주민들이 가진 기괴한 특징들
-- 밤이 되면 해안가에서 벌어지는 의식들
-"""
-    else:
-        year_context = ""
-    
-    return base_prompt + year_context
+    return prompt_registry.registry.get_system_prompt(campaign_year)
 
 
 def load_monthly_conclusion_prompt(month_name: str) -> Optional[str]:
     """
-    월별 결산 결말 프롬프트 파일 로드
+    월별 결산 결말 프롬프트 로드 (메모리 캐시 사용)
     
     Args:
         month_name: 월 이름 (예: "January", "February")
@@ -70,48 +176,20 @@ def load_monthly_conclusion_prompt(month_name: str) -> Optional[str]:
     Returns:
         해당 월의 결산 결말 지시사항 또는 None (없는 경우)
     """
-    prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "monthly_conclusion_prompts.txt")
-    
-    try:
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            
-        # 주석과 빈 줄 제거
-        for line in lines:
-            line = line.strip()
-            # 주석 건너뛰기
-            if line.startswith("#") or not line:
-                continue
-            
-            # "월이름: 내용" 형식 파싱
-            if ":" in line:
-                parts = line.split(":", 1)
-                if len(parts) == 2:
-                    month = parts[0].strip()
-                    content = parts[1].strip()
-                    if month == month_name:
-                        return content
-        
-        return None
-    except FileNotFoundError:
-        return None
+    return prompt_registry.registry.get_monthly_conclusion_prompt(month_name)
 
 
-async def call_mistral_api(
+def _build_request(
     system_prompt: str,
     user_prompt: str,
-    max_tokens: int = 8192
-) -> Optional[str]:
+    max_tokens: int,
+    stream: bool = False
+) -> tuple[Dict[str, str], Dict[str, Any]]:
     """
-    Mistral API 호출
+    Mistral API 요청 헤더와 페이로드 생성
     
-    Args:
-        system_prompt: 시스템 프롬프트
-        user_prompt: 사용자 프롬프트
-        max_tokens: 최대 토큰 수
-        
-    Returns:
-        생성된 텍스트 또는 None (실패 시)
+    Raises:
+        ValueError: MISTRAL_API_KEY가 설정되지 않은 경우
     """
     if not MISTRAL_API_KEY:
         raise ValueError("MISTRAL_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.")
@@ -128,25 +206,296 @@ async def call_mistral_api(
             {"role": "user", "content": user_prompt}
         ],
         "max_tokens": max_tokens,
-        "temperature": 1.0
+        "temperature": MISTRAL_TEMPERATURE
     }
+    if stream:
+        payload["stream"] = True
+    return headers, payload
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(MISTRAL_API_URL, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            
-            if "choices" in data and len(data["choices"]) > 0:
-                return data["choices"][0]["message"]["content"]
+
+async def call_mistral_api(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 8192,
+    use_cache: bool = True,
+    stage: str = "default"
+) -> Optional[str]:
+    """
+    Mistral API 호출
+    
+    Args:
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        max_tokens: 최대 토큰 수
+        use_cache: 동일 프롬프트의 캐시된 응답 사용 여부
+        stage: 생성 단계 이름 (단계별 마감 시간 결정용, 예: "summary_line")
+        
+    Returns:
+        생성된 텍스트 또는 None (실패 시)
+    """
+    with tracing.span(f"llm.{stage}", **{"llm.stage": stage, "llm.max_tokens": max_tokens}):
+        return await _call_mistral_api(system_prompt, user_prompt, max_tokens, use_cache, stage)
+
+
+async def _call_mistral_api(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    use_cache: bool,
+    stage: str
+) -> Optional[str]:
+    """call_mistral_api의 캐시 조회, 요청 합치기, 지표 기록 단계"""
+    headers, payload = _build_request(system_prompt, user_prompt, max_tokens)
+    fingerprint = llm_cache.make_cache_key(
+        payload["model"], system_prompt, user_prompt, max_tokens, payload["temperature"]
+    )
+    cache_key = fingerprint if use_cache and _llm_cache is not None else None
+    metrics.llm_calls_total.inc(stage)
+
+    if cache_key:
+        cached = await _cache_get(cache_key)
+        if cached is not None:
+            metrics.llm_cache_hits_total.inc(stage)
+            tracing.set_attribute("llm.cache_hit", True)
+            return cached
+
+    async def post_completion() -> Optional[str]:
+        return await _post_completion(headers, payload, cache_key, stage)
+
+    started = time.perf_counter()
+    if llm_cache.LLM_COALESCE_ENABLED:
+        result = await _single_flight.do(fingerprint, post_completion)
+    else:
+        result = await post_completion()
+    metrics.llm_request_duration_seconds.observe(time.perf_counter() - started, stage)
+    if not result:
+        metrics.llm_fallbacks_total.inc(stage)
+    return result
+
+
+async def _post_completion(
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Optional[str],
+    stage: str = "default"
+) -> Optional[str]:
+    """
+    Mistral API에 실제 요청을 보내고 성공한 응답을 캐시에 저장
+    
+    일시적 오류(429/5xx/타임아웃/연결 오류)는 단계별 마감 시간 안에서 재시도하고,
+    서킷 브레이커가 열려 있으면 즉시 None을 반환하여 폴백 텍스트를 사용하게 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    deadline_at = loop.time() + resilience.get_stage_deadline(stage)
+    attempt = 0
+
+    while True:
+        remaining = deadline_at - loop.time()
+        if remaining <= 0:
+            _resilience_counters["deadline_exceeded"] += 1
+            logger.warning("Mistral API 마감 시간 초과: %s", stage)
+            return None
+        if not _circuit_breaker.allow_request():
+            logger.warning("Mistral API 차단 중 (서킷 브레이커 open): %s 단계는 폴백을 사용합니다.", stage)
+            return None
+
+        # 이 시도가 half_open의 probe이면 어떤 경로로 끝나든 (취소 포함) finally에서 해제
+        probe = _circuit_breaker.probing
+        retry_after = None
+        try:
+            client = get_http_client()
+            response = await asyncio.wait_for(
+                client.post(MISTRAL_API_URL, headers=headers, json=payload, timeout=remaining),
+                timeout=remaining
+            )
+            if response.status_code in resilience.RETRYABLE_STATUS_CODES:
+                # 429는 요청 한도 초과일 뿐 upstream 장애가 아니므로 probe가 아니면 브레이커에 반영하지 않음
+                if response.status_code == 429:
+                    _circuit_breaker.record_rate_limited()
+                else:
+                    _circuit_breaker.record_failure()
+                retry_after = resilience.parse_retry_after(response.headers.get("Retry-After"))
+                logger.warning("Mistral API 일시 오류 (%s): %s, 시도 %d", response.status_code, stage, attempt + 1)
             else:
-                return None
-    except httpx.HTTPError as e:
-        print(f"Mistral API 호출 실패: {e}")
-        return None
-    except Exception as e:
-        print(f"예상치 못한 오류: {e}")
-        return None
+                # 4xx 등 재시도하지 않는 오류는 raise_for_status()에서 HTTPError로 끝나며 성공으로 기록하지 않음
+                response.raise_for_status()
+                _circuit_breaker.record_success()
+                data = response.json()
+                metrics.record_llm_usage(stage, data.get("usage"))
+                
+                if "choices" in data and len(data["choices"]) > 0:
+                    content = data["choices"][0]["message"]["content"]
+                    if cache_key and content:
+                        await _cache_set(cache_key, content)
+                    return content
+                else:
+                    return None
+        except (asyncio.TimeoutError, httpx.TimeoutException, httpx.TransportError) as e:
+            _circuit_breaker.record_failure()
+            logger.warning("Mistral API 호출 실패 (%s): %s, 시도 %d", type(e).__name__, stage, attempt + 1)
+        except httpx.HTTPError as e:
+            logger.error("Mistral API 호출 실패 (%s): %s", stage, e)
+            return None
+        except Exception as e:
+            logger.exception("예상치 못한 오류 (%s)", stage)
+            return None
+        finally:
+            if probe:
+                _circuit_breaker.release_probe()
+
+        if not await _wait_before_retry(attempt, retry_after, deadline_at):
+            return None
+        attempt += 1
+
+
+async def _wait_before_retry(attempt: int, retry_after: Optional[float], deadline_at: float) -> bool:
+    """
+    재시도 전 백오프 대기
+    
+    Returns:
+        재시도 가능 여부 (재시도 횟수 초과 또는 대기 후 마감 시간을 넘기면 False)
+    """
+    if attempt >= _retry_policy.max_retries:
+        return False
+    delay = _retry_policy.compute_delay(attempt, retry_after)
+    loop = asyncio.get_running_loop()
+    if loop.time() + delay >= deadline_at:
+        _resilience_counters["deadline_exceeded"] += 1
+        return False
+    _resilience_counters["retries"] += 1
+    await asyncio.sleep(delay)
+    return True
+
+
+async def stream_mistral_api(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 8192,
+    stage: str = "default"
+) -> AsyncIterator[str]:
+    """
+    Mistral API 스트리밍 호출 (stream: true)
+    
+    Args:
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        max_tokens: 최대 토큰 수
+        stage: 생성 단계 이름 (마감 시간 결정용)
+        
+    Yields:
+        생성된 텍스트 조각 (실패 시 아무것도 반환하지 않고 종료)
+    """
+    headers, payload = _build_request(system_prompt, user_prompt, max_tokens, stream=True)
+
+    # 스트리밍도 비스트리밍 호출과 같은 캐시를 공유 (히트 시 전체 텍스트를 한 번에 전달)
+    metrics.llm_calls_total.inc(stage)
+    cache_key = None
+    if _llm_cache is not None:
+        cache_key = llm_cache.make_cache_key(
+            payload["model"], system_prompt, user_prompt, max_tokens, payload["temperature"]
+        )
+        cached = await _cache_get(cache_key)
+        if cached is not None:
+            metrics.llm_cache_hits_total.inc(stage)
+            yield cached
+            return
+
+    chunks = []
+    started = time.perf_counter()
+    started_ns = time.time_ns()
+    try:
+        async for delta in _stream_completion(headers, payload, cache_key, stage, chunks):
+            yield delta
+    finally:
+        metrics.llm_request_duration_seconds.observe(time.perf_counter() - started, stage)
+        # 제너레이터는 yield마다 호출자 컨텍스트에서 실행되므로 span 대신 끝난 구간을 기록
+        tracing.record_span(f"llm.{stage}", started_ns, time.time_ns(), **{"llm.stage": stage, "llm.stream": True, "llm.chunks": len(chunks)})
+        if not chunks:
+            metrics.llm_fallbacks_total.inc(stage)
+
+
+async def _stream_completion(
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Optional[str],
+    stage: str,
+    chunks: list
+) -> AsyncIterator[str]:
+    """
+    Mistral API 스트리밍 요청 (재시도, 서킷 브레이커 포함)
+    
+    받은 텍스트 조각은 yield하면서 chunks에도 추가하고, 완료되면 전체 텍스트를 캐시에 저장합니다.
+    """
+    loop = asyncio.get_running_loop()
+    deadline_at = loop.time() + resilience.get_stage_deadline(stage)
+    attempt = 0
+
+    # 첫 토큰을 받기 전까지만 재시도 (이미 전달한 토큰은 되돌릴 수 없음)
+    while True:
+        remaining = deadline_at - loop.time()
+        if remaining <= 0:
+            _resilience_counters["deadline_exceeded"] += 1
+            logger.warning("Mistral API 마감 시간 초과: %s", stage)
+            return
+        if not _circuit_breaker.allow_request():
+            logger.warning("Mistral API 차단 중 (서킷 브레이커 open): %s 단계는 폴백을 사용합니다.", stage)
+            return
+
+        probe = _circuit_breaker.probing
+        retry_after = None
+        try:
+            client = get_http_client()
+            async with client.stream(
+                "POST", MISTRAL_API_URL, headers=headers, json=payload, timeout=remaining
+            ) as response:
+                if response.status_code in resilience.RETRYABLE_STATUS_CODES:
+                    if response.status_code == 429:
+                        _circuit_breaker.record_rate_limited()
+                    else:
+                        _circuit_breaker.record_failure()
+                    retry_after = resilience.parse_retry_after(response.headers.get("Retry-After"))
+                    logger.warning("Mistral API 일시 오류 (%s): %s, 시도 %d", response.status_code, stage, attempt + 1)
+                else:
+                    response.raise_for_status()
+                    _circuit_breaker.record_success()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        chunk_data = line[len("data:"):].strip()
+                        if chunk_data == "[DONE]":
+                            break
+                        chunk = json.loads(chunk_data)
+                        # 마지막 조각에 usage가 포함됨
+                        metrics.record_llm_usage(stage, chunk.get("usage"))
+                        choices = chunk.get("choices") or []
+                        if not choices:
+                            continue
+                        delta = (choices[0].get("delta") or {}).get("content")
+                        if delta:
+                            chunks.append(delta)
+                            yield delta
+                    if cache_key and chunks:
+                        await _cache_set(cache_key, "".join(chunks))
+                    return
+        except (httpx.TimeoutException, httpx.TransportError) as e:
+            _circuit_breaker.record_failure()
+            logger.warning("Mistral API 스트리밍 호출 실패 (%s): %s, 시도 %d", type(e).__name__, stage, attempt + 1)
+            if chunks:
+                return
+        except httpx.HTTPError as e:
+            logger.error("Mistral API 스트리밍 호출 실패 (%s): %s", stage, e)
+            return
+        except Exception as e:
+            logger.exception("예상치 못한 오류 (%s)", stage)
+            return
+        finally:
+            # 클라이언트 연결 종료로 제너레이터가 닫혀도 probe 해제
+            if probe:
+                _circuit_breaker.release_probe()
+
+        if not await _wait_before_retry(attempt, retry_after, deadline_at):
+            return
+        attempt += 1
 
 
 async def generate_daily_story(
@@ -171,6 +520,72 @@ async def generate_daily_story(
     Returns:
         생성된 스토리 텍스트
     """
+    system_prompt, user_prompt = _build_daily_story_prompts(
+        context,
+        memory,
+        campaign_year,
+        sunday_success_rate,
+        overall_success_rate,
+        sunday_total_count
+    )
+    
+    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=DAILY_STORY_MAX_TOKENS, stage="daily_story")
+    
+    if result:
+        result_text = result.strip()
+        _log_daily_story(context, result_text)
+        return result_text
+    else:
+        return _daily_story_fallback(context)
+
+
+async def generate_daily_story_stream(
+    context: DailyStoryContext,
+    memory: NarrativeMemory,
+    campaign_year: int = 1925,
+    sunday_success_rate: float = 0.0,
+    overall_success_rate: float = 0.0,
+    sunday_total_count: int = 0
+) -> AsyncIterator[str]:
+    """
+    일일 스토리 스트리밍 생성 (generate_daily_story와 동일한 프롬프트 사용)
+    
+    Args:
+        generate_daily_story와 동일
+    
+    Yields:
+        생성된 스토리 텍스트 조각 (실패 시 폴백 메시지 한 번)
+    """
+    system_prompt, user_prompt = _build_daily_story_prompts(
+        context,
+        memory,
+        campaign_year,
+        sunday_success_rate,
+        overall_success_rate,
+        sunday_total_count
+    )
+    
+    chunks = []
+    async for delta in stream_mistral_api(system_prompt, user_prompt, max_tokens=DAILY_STORY_MAX_TOKENS, stage="daily_story"):
+        chunks.append(delta)
+        yield delta
+    
+    result_text = "".join(chunks).strip()
+    if result_text:
+        _log_daily_story(context, result_text)
+    else:
+        yield _daily_story_fallback(context)
+
+
+def _build_daily_story_prompts(
+    context: DailyStoryContext,
+    memory: NarrativeMemory,
+    campaign_year: int,
+    sunday_success_rate: float,
+    overall_success_rate: float,
+    sunday_total_count: int
+) -> tuple[str, str]:
+    """일일 스토리용 (시스템 프롬프트, 사용자 프롬프트) 생성"""
     system_prompt = load_system_prompt(campaign_year)
     
     # 컨텍스트 프롬프트 생성
@@ -186,24 +601,24 @@ async def generate_daily_story(
 
 {narrative_prompt}
 """
-    
-    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=1000)
-    
-    if result:
-        result_text = result.strip()
-        print("\n" + "="*80)
-        print("[LLM 생성 데이터] 일일 스토리")
-        print("="*80)
-        print(f"날짜: {context.state.current_date}")
-        print(f"대상: {context.target.visual_description}")
-        print(f"결과: {'성공' if context.is_success else '실패'}")
-        print(f"\n생성된 스토리:\n{result_text}")
-        print("="*80 + "\n")
-        return result_text
-    else:
-        # 폴백 메시지
-        outcome = "성공" if context.is_success else "실패"
-        return f"{context.state.current_date}. {context.target.visual_description}을(를) 상대로 {outcome}했습니다."
+    return system_prompt, user_prompt
+
+
+def _log_daily_story(context: DailyStoryContext, result_text: str) -> None:
+    """생성된 일일 스토리 로그"""
+    log_service.log_generated_text(
+        "daily_story",
+        result_text,
+        date=context.state.current_date,
+        target=context.target.visual_description,
+        is_success=context.is_success
+    )
+
+
+def _daily_story_fallback(context: DailyStoryContext) -> str:
+    """LLM 호출 실패 시 사용하는 일일 스토리 폴백 메시지"""
+    outcome = "성공" if context.is_success else "실패"
+    return f"{context.state.current_date}. {context.target.visual_description}을(를) 상대로 {outcome}했습니다."
 
 
 async def generate_monthly_summary(chapter_data: dict, campaign_year: int = 1925) -> str:
@@ -231,18 +646,17 @@ async def generate_monthly_summary(chapter_data: dict, campaign_year: int = 1925
     지난 한 달의 사건들을 요약하고, 다음 달에 대한 불안감이나 결의를 표현하세요.
     """
     
-    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=300)
+    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=300, stage="monthly_summary")
     
     if result:
         result_text = result.strip()
-        print("\n" + "="*80)
-        print("[LLM 생성 데이터] 월간 요약")
-        print("="*80)
-        print(f"월: {chapter_data.get('month_name', '한 달')}")
-        print(f"점수: {chapter_data.get('final_score', 0)}점")
-        print(f"정신 상태: {chapter_data.get('madness_state', '알 수 없음')}")
-        print(f"\n생성된 요약:\n{result_text}")
-        print("="*80 + "\n")
+        log_service.log_generated_text(
+            "monthly_summary",
+            result_text,
+            month=chapter_data.get('month_name', '한 달'),
+            final_score=chapter_data.get('final_score', 0),
+            madness_state=chapter_data.get('madness_state', '알 수 없음')
+        )
         return result_text
     else:
         return f"{chapter_data.get('month_name', '한 달')}의 수사가 끝났습니다."
@@ -308,17 +722,16 @@ async def generate_prologue(campaign_year: int) -> str:
 프롤로그를 작성해 주세요:
 """
     
-    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=800)
+    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=800, stage="prologue")
     
     if result:
         result_text = result.strip()
-        print("\n" + "="*80)
-        print("[LLM 생성 데이터] 프롤로그")
-        print("="*80)
-        print(f"캠페인 연도: {campaign_year}")
-        print(f"프롤로그 날짜: {campaign_year - 1}-12-31")
-        print(f"\n생성된 프롤로그:\n{result_text}")
-        print("="*80 + "\n")
+        log_service.log_generated_text(
+            "prologue",
+            result_text,
+            campaign_year=campaign_year,
+            date=f"{campaign_year - 1}-12-31"
+        )
         return result_text
     else:
         # 폴백: 기본 프롤로그 반환
@@ -347,16 +760,11 @@ async def generate_summary_line(story_text: str) -> str:
     요약:
     """
     
-    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=100)
+    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=100, stage="summary_line")
     
     if result:
         result_text = result.strip()
-        print("\n" + "="*80)
-        print("[LLM 생성 데이터] 요약 줄")
-        print("="*80)
-        print(f"원본 스토리 길이: {len(story_text)}자")
-        print(f"\n생성된 요약:\n{result_text}")
-        print("="*80 + "\n")
+        log_service.log_generated_text("summary_line", result_text, story_chars=len(story_text))
         return result_text
     else:
         # 폴백: 첫 50자만 반환
@@ -381,14 +789,15 @@ async def generate_weekly_summary(
     """
     system_prompt = load_system_prompt(campaign_year)
     
-    # 일요일 조우 정보 포맷팅
+    # 일요일 조우 정보 포맷팅 (스토리와 동시에 생성되는 경우 요약 줄이 아직 없을 수 있음)
     sunday_info = f"""
 일요일 조우:
 - 날짜: {sunday_encounter.get('date', '알 수 없음')}
 - 대상: {sunday_encounter.get('target_name', '알 수 없음')}
 - 결과: {'성공' if sunday_encounter.get('is_success', False) else '실패'}
-- 요약: {sunday_encounter.get('summary_line', '')}
 """
+    if sunday_encounter.get('summary_line'):
+        sunday_info += f"- 요약: {sunday_encounter.get('summary_line')}\n"
     
     # 주요 조우 정보 포맷팅
     encounters_text = "주간 주요 조우:\n"
@@ -418,19 +827,18 @@ async def generate_weekly_summary(
 주간 요약:
 """
     
-    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=500)
+    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=500, stage="weekly_summary")
     
     if result:
         result_text = result.strip()
-        print("\n" + "="*80)
-        print("[LLM 생성 데이터] 주간 요약")
-        print("="*80)
-        print(f"일요일 조우 날짜: {sunday_encounter.get('date', '알 수 없음')}")
-        print(f"일요일 조우 대상: {sunday_encounter.get('target_name', '알 수 없음')}")
-        print(f"일요일 조우 결과: {'성공' if sunday_encounter.get('is_success', False) else '실패'}")
-        print(f"주간 주요 조우 수: {len(key_encounters)}건")
-        print(f"\n생성된 주간 요약:\n{result_text}")
-        print("="*80 + "\n")
+        log_service.log_generated_text(
+            "weekly_summary",
+            result_text,
+            sunday_date=sunday_encounter.get('date', '알 수 없음'),
+            sunday_target=sunday_encounter.get('target_name', '알 수 없음'),
+            sunday_is_success=sunday_encounter.get('is_success', False),
+            key_encounter_count=len(key_encounters)
+        )
         return result_text
     else:
         # 폴백: 간단한 요약 반환
@@ -529,21 +937,20 @@ async def generate_monthly_conclusion(month_data: dict, campaign_year: int = 192
 월별 결말:
 """
     
-    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=1200)
+    result = await call_mistral_api(system_prompt, user_prompt, max_tokens=1200, stage="monthly_conclusion")
     
     if result:
         result_text = result.strip()
-        stats = month_data.get("statistics", {})
-        print("\n" + "="*80)
-        print("[LLM 생성 데이터] 월간 결말")
-        print("="*80)
-        print(f"월: {year}년 {month_name}")
-        print(f"전체 조우: {stats.get('total_entries', 0)}건")
-        print(f"성공률: {stats.get('success_rate', 0)}%")
-        print(f"일요일 조우 성공률: {stats.get('sunday_success_rate', 0)}%")
-        print(f"광기 발작: {stats.get('madness_triggered_count', 0)}회")
-        print(f"\n생성된 월간 결말:\n{result_text}")
-        print("="*80 + "\n")
+        log_service.log_generated_text(
+            "monthly_conclusion",
+            result_text,
+            year=year,
+            month=month_name,
+            total_entries=stats.get('total_entries', 0),
+            success_rate=stats.get('success_rate', 0),
+            sunday_success_rate=stats.get('sunday_success_rate', 0),
+            madness_triggered_count=stats.get('madness_triggered_count', 0)
+        )
         return result_text
     else:
         # 폴백: 간단한 결말 반환
@@ -0,0 +1,212 @@
+import os
+import sys
+import json
+import queue
+import atexit
+import random
+import hashlib
+import logging
+import logging.handlers
+import traceback
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+
+from app.services import metrics
+
+
+# 로그 설정
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()  # json 또는 text
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# LLM 단계별 로그 레벨 (예: "daily_story=INFO,summary_line=WARNING", 지정하지 않은 단계는 LOG_LEVEL)
+LOG_LLM_STAGE_LEVELS = os.getenv("LOG_LLM_STAGE_LEVELS", "")
+# LLM 생성 텍스트 미리보기 길이 (글자 수)
+LOG_LLM_TEXT_PREVIEW_CHARS = int(os.getenv("LOG_LLM_TEXT_PREVIEW_CHARS", "200"))
+# 생성 텍스트 전체를 남길 요청 비율 (0.0 ~ 1.0, 요청 ID 단위로 샘플링)
+LOG_LLM_FULL_TEXT_SAMPLE_RATE = float(os.getenv("LOG_LLM_FULL_TEXT_SAMPLE_RATE", "0.05"))
+
+# 앱 로거 이름 공간 (uvicorn 등 다른 로거 설정은 건드리지 않음)
+ROOT_LOGGER_NAME = "app"
+LLM_LOGGER_NAME = f"{ROOT_LOGGER_NAME}.llm"
+
+# 현재 요청 ID (RequestIdMiddleware가 요청마다 설정, asyncio 태스크에도 그대로 전달됨)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+log_records_dropped_total = metrics.registry.register(metrics.Counter(
+    "log_records_dropped_total", "로그 큐가 가득 차서 버린 로그 레코드 수"
+))
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    요청 처리 흐름에서 로그 레코드를 큐에 넣기만 하는 핸들러
+
+    출력(포맷팅, stdout 쓰기)은 QueueListener 스레드에서 처리합니다.
+    큐가 가득 차면 요청을 막지 않고 레코드를 버립니다.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_records_dropped_total.inc()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 요청 ID는 contextvar이므로 리스너 스레드로 넘기기 전에 기록
+        record.request_id = request_id_var.get()
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+            record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체로 출력 (extra={"fields": {...}}의 값은 최상위 키로 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """로컬 개발용 사람이 읽기 쉬운 형식"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        request_id = getattr(record, "request_id", None) or "-"
+        line = f"{timestamp} {record.levelname:<7} [{request_id}] {record.name}: {record.getMessage()}"
+        fields = getattr(record, "fields", None)
+        if fields:
+            text = fields.get("text")
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items() if key != "text")
+            if text:
+                line += "\n" + text
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+
+def _parse_stage_levels(value: str) -> Dict[str, int]:
+    """"stage=LEVEL,..." 형식의 단계별 로그 레벨 파싱 (잘못된 항목은 무시)"""
+    levels = {}
+    for item in value.split(","):
+        stage, _, level = item.partition("=")
+        level_number = logging.getLevelName(level.strip().upper())
+        if stage.strip() and isinstance(level_number, int):
+            levels[stage.strip()] = level_number
+    return levels
+
+
+def configure() -> None:
+    """앱 로거에 큐 핸들러와 리스너 스레드 설정 (여러 번 호출해도 한 번만 설정)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(TextFormatter() if LOG_FORMAT == "text" else JsonFormatter())
+
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.handlers = [_NonBlockingQueueHandler(log_queue)]
+    root.setLevel(LOG_LEVEL if isinstance(logging.getLevelName(LOG_LEVEL), int) else logging.INFO)
+    root.propagate = False
+    for stage, level in _parse_stage_levels(LOG_LLM_STAGE_LEVELS).items():
+        logging.getLogger(f"{LLM_LOGGER_NAME}.{stage}").setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown)
+
+
+def shutdown() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    앱 로거 반환 (처음 호출 시 로그 설정)
+
+    Args:
+        name: 모듈 이름 (__name__, "app." 아래가 아니면 "app." 아래로 붙임)
+    """
+    configure()
+    if name != ROOT_LOGGER_NAME and not name.startswith(ROOT_LOGGER_NAME + "."):
+        name = f"{ROOT_LOGGER_NAME}.{name}"
+    return logging.getLogger(name)
+
+
+def get_stage_logger(stage: str) -> logging.Logger:
+    """LLM 단계별 로거 (LOG_LLM_STAGE_LEVELS로 단계마다 레벨 조정)"""
+    return get_logger(f"{LLM_LOGGER_NAME}.{stage}")
+
+
+def truncate(text: str, limit: int) -> str:
+    """limit 글자를 넘으면 잘라서 "…" 표시"""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def _full_text_sampled() -> bool:
+    """
+    생성 텍스트 전체를 남길지 결정
+
+    요청 ID가 있으면 ID의 해시로 결정하여 한 조우의 스토리, 요약 줄, 주간 요약이 함께 남거나 함께 생략됩니다.
+    """
+    rate = LOG_LLM_FULL_TEXT_SAMPLE_RATE
+    if rate <= 0:
+        return False
+    if rate >= 1:
+        return True
+    request_id = request_id_var.get()
+    if request_id is None:
+        return random.random() < rate
+    digest = hashlib.blake2b(request_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64 < rate
+
+
+def log_generated_text(stage: str, text: str, **fields: Any) -> None:
+    """
+    LLM 생성 결과 로그 (INFO)
+
+    기본은 앞부분 미리보기(LOG_LLM_TEXT_PREVIEW_CHARS)와 글자 수만 남기고,
+    샘플링된 요청(LOG_LLM_FULL_TEXT_SAMPLE_RATE)만 전체 텍스트를 남깁니다.
+
+    Args:
+        stage: LLM 단계 (daily_story, summary_line, weekly_summary 등)
+        text: 생성된 텍스트
+        **fields: 함께 남길 값 (날짜, 대상 등)
+    """
+    logger = get_stage_logger(stage)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    fields["stage"] = stage
+    fields["chars"] = len(text)
+    if _full_text_sampled():
+        fields["text"] = text
+    else:
+        fields["text_preview"] = truncate(text, LOG_LLM_TEXT_PREVIEW_CHARS)
+    logger.info("LLM 생성 완료", extra={"fields": fields})
@@ -0,0 +1,195 @@
+import os
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Tuple, Sequence, Optional
+
+
+# /metrics 엔드포인트와 요청/LLM 측정 사용 여부
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 히스토그램 버킷 (초, 바이트)
+HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LLM_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+JSON_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+PAYLOAD_SIZE_BUCKETS = tuple(1024 * 4 ** i for i in range(8))  # 1KB ~ 16MB
+
+LabelValues = Tuple[str, ...]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """레이블별 값을 가지는 지표 (Prometheus 텍스트 형식으로 출력)"""
+
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check_labels(self, values: Sequence[str]) -> LabelValues:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 값은 {self.labelnames} 순서로 {len(self.labelnames)}개여야 합니다.")
+        return tuple(str(value) for value in values)
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            lines.extend(self._render_samples())
+        return lines
+
+
+class Counter(_Metric):
+    """증가만 하는 누적 값"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._check_labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(self._check_labels(labels), 0)
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """버킷별 관측 횟수, 합계, 개수"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = HTTP_LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 -> [버킷별 개수 (마지막은 +Inf), 합계]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._check_labels(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(self._check_labels(labels))
+        return sum(state[0]) if state else 0
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, ("le", _format_number(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """지표 목록 (등록 순서대로 출력)"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# HTTP 요청 (라우터 경로 템플릿별, 예: /api/narrative/report/{month})
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)",
+    ("method", "route", "status"), HTTP_LATENCY_BUCKETS
+))
+http_request_body_bytes = registry.register(Histogram(
+    "http_request_body_bytes", "요청 본문 크기 (클라이언트가 보내는 game_data 크기)",
+    ("method", "route"), PAYLOAD_SIZE_BUCKETS
+))
+
+# LLM (generate_* 단계별)
+llm_calls_total = registry.register(Counter(
+    "llm_calls_total", "LLM 호출 요청 수 (캐시 히트 포함)", ("stage",)
+))
+llm_cache_hits_total = registry.register(Counter(
+    "llm_cache_hits_total", "LLM 응답 캐시 히트 수", ("stage",)
+))
+llm_fallbacks_total = registry.register(Counter(
+    "llm_fallbacks_total", "LLM 응답을 받지 못해 폴백 텍스트를 사용한 수", ("stage",)
+))
+llm_request_duration_seconds = registry.register(Histogram(
+    "llm_request_duration_seconds", "Mistral API 호출 시간 (재시도 포함, 캐시 히트 제외)",
+    ("stage",), LLM_LATENCY_BUCKETS
+))
+llm_prompt_tokens_total = registry.register(Counter(
+    "llm_prompt_tokens_total", "Mistral API usage.prompt_tokens 합계", ("stage",)
+))
+llm_completion_tokens_total = registry.register(Counter(
+    "llm_completion_tokens_total", "Mistral API usage.completion_tokens 합계", ("stage",)
+))
+
+# JSON 직렬화 (FastJSONResponse)
+json_render_duration_seconds = registry.register(Histogram(
+    "json_render_duration_seconds", "JSON 응답 직렬화 시간", (), JSON_LATENCY_BUCKETS
+))
+json_render_bytes = registry.register(Histogram(
+    "json_render_bytes", "직렬화한 JSON 응답 크기", (), PAYLOAD_SIZE_BUCKETS
+))
+
+
+def record_llm_usage(stage: str, usage: Optional[Dict[str, int]]) -> None:
+    """Mistral API 응답의 usage 필드 (prompt_tokens, completion_tokens) 반영"""
+    if not usage:
+        return
+    llm_prompt_tokens_total.inc(stage, amount=usage.get("prompt_tokens", 0) or 0)
+    llm_completion_tokens_total.inc(stage, amount=usage.get("completion_tokens", 0) or 0)
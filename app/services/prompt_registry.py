@@ -0,0 +1,156 @@
+import os
+import time
+import threading
+from typing import Optional, Dict
+
+
+PROMPTS_DIR = os.path.join(os.path.dirname(__file__), "..", "prompts")
+SYSTEM_PROMPT_PATH = os.path.join(PROMPTS_DIR, "system_prompt.txt")
+MONTHLY_CONCLUSION_PROMPTS_PATH = os.path.join(PROMPTS_DIR, "monthly_conclusion_prompts.txt")
+
+# 파일 수정 여부(mtime) 확인 최소 간격 (초, 0이면 매 호출마다 확인)
+PROMPT_RELOAD_CHECK_INTERVAL = float(os.getenv("PROMPT_RELOAD_CHECK_INTERVAL", "2.0"))
+
+DEFAULT_SYSTEM_PROMPT = """당신은 아컴의 탐정 존 밀러입니다. 러브크래프트 스타일의 호러 느와르 소설을 작성하세요."""
+
+# 연도별 배경 설명 (시스템 프롬프트 뒤에 추가)
+YEAR_CONTEXTS: Dict[int, str] = {
+    1925: """
+# 배경 설정 (1925년)
+이 이야기는 크툴루의 부름(The Call of Cthulhu)의 세계관을 배경으로 합니다.
+- 항구에서 들려오는 기이한 소문들, 어두운 골목에서 벌어지는 의문의 사건들
+- 남태평양의 외딴 섬에서 돌아온 선원들의 정신 이상 사례
+- 위대한 옛것을 숭배하는 광신도들의 음모
+- 구스타프 요한센의 일기와 같은 선원들의 기록들이 중요한 단서가 될 수 있음
+- 해양과 항구, 외딴 섬과 관련된 공포가 주요 테마
+""",
+    1931: """
+# 배경 설정 (1931년)
+이 이야기는 인스머스의 그림자(The Shadow over Innsmouth)의 세계관을 배경으로 합니다.
+- 해안가 마을 인스머스에서 들려오는 기이한 소문들
+- 사람들이 사라지는 해안 도시의 비밀
+- 딥 원스(Deep Ones)와 인간의 잡종에 대한 공포
+- 해안가와 바다, 물속의 존재들이 주요 테마
+- 인스머스의 주민들이 가진 기괴한 특징들
+- 밤이 되면 해안가에서 벌어지는 의식들
+""",
+}
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    """파일 수정 시각 (파일이 없으면 None)"""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def parse_monthly_conclusion_prompts(text: str) -> Dict[str, str]:
+    """
+    월별 결산 결말 프롬프트 파일 내용 파싱
+
+    Args:
+        text: "월이름: 내용" 형식의 줄들 (#으로 시작하는 줄은 주석)
+
+    Returns:
+        월 이름 -> 지시사항 딕셔너리 (같은 월이 여러 번 나오면 첫 번째 항목 사용)
+    """
+    prompts: Dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        # 주석과 빈 줄 건너뛰기
+        if line.startswith("#") or not line:
+            continue
+        if ":" in line:
+            month, content = line.split(":", 1)
+            prompts.setdefault(month.strip(), content.strip())
+    return prompts
+
+
+class PromptRegistry:
+    """
+    프롬프트 파일 메모리 캐시
+
+    연도별 시스템 프롬프트와 월별 결산 지시사항을 한 번에 조립해 두고,
+    파일 수정 시각(mtime)이 바뀐 경우에만 다시 읽습니다.
+    """
+
+    def __init__(
+        self,
+        system_prompt_path: str = SYSTEM_PROMPT_PATH,
+        monthly_prompts_path: str = MONTHLY_CONCLUSION_PROMPTS_PATH,
+        check_interval: float = PROMPT_RELOAD_CHECK_INTERVAL
+    ):
+        self.system_prompt_path = system_prompt_path
+        self.monthly_prompts_path = monthly_prompts_path
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._last_check = 0.0
+        self._system_mtime: Optional[float] = None
+        self._monthly_mtime: Optional[float] = None
+        self._base_prompt = DEFAULT_SYSTEM_PROMPT
+        self._system_prompts: Dict[int, str] = {}
+        self._monthly_prompts: Dict[str, str] = {}
+
+    def load(self) -> None:
+        """프롬프트 파일을 읽고 연도별 시스템 프롬프트를 미리 조립 (앱 시작 시 호출)"""
+        with self._lock:
+            self._load_system_prompt(_file_mtime(self.system_prompt_path))
+            self._load_monthly_prompts(_file_mtime(self.monthly_prompts_path))
+            self._loaded = True
+            self._last_check = time.monotonic()
+
+    def _load_system_prompt(self, mtime: Optional[float]) -> None:
+        try:
+            with open(self.system_prompt_path, "r", encoding="utf-8") as f:
+                self._base_prompt = f.read()
+        except FileNotFoundError:
+            self._base_prompt = DEFAULT_SYSTEM_PROMPT
+        self._system_prompts = {
+            year: self._base_prompt + year_context
+            for year, year_context in YEAR_CONTEXTS.items()
+        }
+        self._system_mtime = mtime
+        self.reloads += 1
+
+    def _load_monthly_prompts(self, mtime: Optional[float]) -> None:
+        try:
+            with open(self.monthly_prompts_path, "r", encoding="utf-8") as f:
+                self._monthly_prompts = parse_monthly_conclusion_prompts(f.read())
+        except FileNotFoundError:
+            self._monthly_prompts = {}
+        self._monthly_mtime = mtime
+        self.reloads += 1
+
+    def _refresh_if_changed(self) -> None:
+        """확인 간격이 지났으면 mtime을 비교하여 바뀐 파일만 다시 읽기"""
+        if not self._loaded:
+            self.load()
+            return
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        with self._lock:
+            self._last_check = now
+            system_mtime = _file_mtime(self.system_prompt_path)
+            if system_mtime != self._system_mtime:
+                self._load_system_prompt(system_mtime)
+            monthly_mtime = _file_mtime(self.monthly_prompts_path)
+            if monthly_mtime != self._monthly_mtime:
+                self._load_monthly_prompts(monthly_mtime)
+
+    def get_system_prompt(self, campaign_year: int = 1925) -> str:
+        """연도별 배경 설명이 포함된 시스템 프롬프트"""
+        self._refresh_if_changed()
+        return self._system_prompts.get(campaign_year, self._base_prompt)
+
+    def get_monthly_conclusion_prompt(self, month_name: str) -> Optional[str]:
+        """월별 결산 결말 지시사항 (없으면 None)"""
+        self._refresh_if_changed()
+        return self._monthly_prompts.get(month_name)
+
+
+# 앱 전역 레지스트리
+registry = PromptRegistry()
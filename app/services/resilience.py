@@ -0,0 +1,186 @@
+import os
+import time
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any
+
+
+MISTRAL_MAX_RETRIES = int(os.getenv("MISTRAL_MAX_RETRIES", "2"))
+MISTRAL_BACKOFF_BASE = float(os.getenv("MISTRAL_BACKOFF_BASE", "0.5"))
+MISTRAL_BACKOFF_MAX = float(os.getenv("MISTRAL_BACKOFF_MAX", "8.0"))
+MISTRAL_BREAKER_THRESHOLD = int(os.getenv("MISTRAL_BREAKER_THRESHOLD", "5"))
+MISTRAL_BREAKER_RECOVERY = float(os.getenv("MISTRAL_BREAKER_RECOVERY", "30.0"))
+
+# 재시도할 HTTP 상태 코드 (429: 요청 한도 초과, 5xx: 일시적 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 생성 단계별 전체 마감 시간 (초, 재시도 포함)
+STAGE_DEADLINES: Dict[str, float] = {
+    "daily_story": float(os.getenv("MISTRAL_DEADLINE_DAILY_STORY", "30.0")),
+    "summary_line": float(os.getenv("MISTRAL_DEADLINE_SUMMARY_LINE", "8.0")),
+    "weekly_summary": float(os.getenv("MISTRAL_DEADLINE_WEEKLY_SUMMARY", "20.0")),
+    "monthly_summary": float(os.getenv("MISTRAL_DEADLINE_MONTHLY_SUMMARY", "15.0")),
+    "monthly_conclusion": float(os.getenv("MISTRAL_DEADLINE_MONTHLY_CONCLUSION", "45.0")),
+    "prologue": float(os.getenv("MISTRAL_DEADLINE_PROLOGUE", "30.0")),
+}
+DEFAULT_DEADLINE = float(os.getenv("MISTRAL_DEADLINE_DEFAULT", "30.0"))
+
+
+def get_stage_deadline(stage: str) -> float:
+    """생성 단계별 마감 시간 (초) 반환"""
+    return STAGE_DEADLINES.get(stage, DEFAULT_DEADLINE)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 파싱
+
+    Args:
+        value: 헤더 값 (초 단위 숫자 또는 HTTP 날짜)
+
+    Returns:
+        대기 시간(초) 또는 None (헤더가 없거나 해석할 수 없는 경우)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """지터가 적용된 지수 백오프 재시도 정책"""
+
+    def __init__(
+        self,
+        max_retries: int = MISTRAL_MAX_RETRIES,
+        base_delay: float = MISTRAL_BACKOFF_BASE,
+        max_delay: float = MISTRAL_BACKOFF_MAX
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        다음 재시도까지 대기 시간 계산
+
+        Args:
+            attempt: 지금까지 실패한 시도 횟수 (0부터)
+            retry_after: 서버가 Retry-After로 지정한 대기 시간 (우선 적용)
+
+        Returns:
+            대기 시간(초)
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        # Full jitter: 0 ~ min(max_delay, base * 2^attempt)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 upstream 호출을 일정 시간 차단하는 서킷 브레이커
+
+    - closed: 정상 호출
+    - open: recovery_timeout 동안 즉시 실패 (폴백 사용)
+    - half_open: 복구 확인용 호출 하나만 허용
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = MISTRAL_BREAKER_THRESHOLD,
+        recovery_timeout: float = MISTRAL_BREAKER_RECOVERY
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self.times_opened = 0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (open 상태에서는 recovery_timeout 경과 후 probe 하나만 허용)"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            else:
+                self.rejected += 1
+                return False
+        # half_open
+        if self._probe_in_flight:
+            self.rejected += 1
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (차단 해제)"""
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (임계치 도달 또는 probe 실패 시 차단)"""
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def record_rate_limited(self) -> None:
+        """
+        429 응답 기록
+
+        요청 한도 초과는 upstream 장애가 아니므로 closed 상태에서는 반영하지 않지만,
+        half_open의 probe가 429를 받으면 복구를 확인하지 못했으므로 probe 실패로 처리합니다.
+        """
+        if self.state == self.HALF_OPEN:
+            self.record_failure()
+
+    @property
+    def probing(self) -> bool:
+        """half_open 상태에서 probe가 진행 중인지 여부"""
+        return self.state == self.HALF_OPEN and self._probe_in_flight
+
+    def release_probe(self) -> None:
+        """
+        결과를 기록하지 못하고 끝난 probe 해제
+
+        취소(CancelledError), 예상치 못한 예외 등으로 record_success()/record_failure() 없이
+        probe가 끝나면 half_open에서 다음 호출이 다시 probe가 될 수 있도록 합니다.
+        결과를 이미 기록했으면 아무 것도 하지 않습니다.
+        """
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 상태 및 카운터"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
@@ -0,0 +1,268 @@
+import os
+import asyncio
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from app.services import delta_protocol
+from app.services import json_codec
+from app.services import log_service
+
+
+# 저널 레코드가 이 개수(또는 크기)를 넘으면 컴팩션 대상
+JOURNAL_COMPACT_RECORDS = int(os.getenv("JOURNAL_COMPACT_RECORDS", "200"))
+JOURNAL_COMPACT_BYTES = int(os.getenv("JOURNAL_COMPACT_BYTES", str(4 * 1024 * 1024)))
+
+# 백그라운드 컴팩터 실행 간격 (초)
+JOURNAL_COMPACT_INTERVAL = float(os.getenv("JOURNAL_COMPACT_INTERVAL", "60"))
+
+logger = log_service.get_logger(__name__)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """파일 교체(rename)가 디스크에 반영되도록 디렉토리 fsync (지원하지 않는 OS는 무시)"""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SaveJournal:
+    """
+    스냅샷 + 추가 전용 저널 세이브 파일
+
+    저장할 때마다 이전 저장 상태와의 차이(JSON Patch)를 저널 파일에 JSON 한 줄로 추가하고 fsync합니다.
+    조우 한 번의 저장은 새 일일 엔트리와 바뀐 상태 값만큼의 레코드이며, 기존 파일을 잘라내지 않으므로
+    쓰는 도중 중단되어도 마지막 (불완전한) 줄만 버리면 직전 저장 상태로 복구됩니다.
+
+    컴팩션은 현재 상태를 새 스냅샷으로 원자적으로 교체(임시 파일 + rename)한 뒤 저널을 비웁니다.
+    스냅샷에 마지막으로 반영한 레코드 번호(seq)를 기록하므로, 교체 직후 저널을 비우기 전에
+    중단되어도 이미 반영된 레코드는 다시 적용하지 않습니다.
+
+    메모리에는 차이 계산용 스냅샷(delta_protocol.snapshot, 누적 기록 리스트는 길이만)만 보관하므로,
+    저장할 때마다 문서 전체를 복사하거나 비교하지 않습니다. load()와 백그라운드 컴팩션은 파일에서 전체 문서를 다시 읽습니다.
+
+    저널 하나에 기록하는 프로세스는 하나뿐이어야 합니다. (메모리의 마지막 저장 상태를 기준으로 차이를 계산하므로,
+    다른 프로세스가 같은 저널에 추가한 레코드는 다음 load() 전까지 반영되지 않습니다.)
+    """
+
+    def __init__(self, directory: Path, name: str):
+        self.directory = Path(directory)
+        self.snapshot_path = self.directory / f"{name}.snapshot.json"
+        self.journal_path = self.directory / f"{name}.journal.jsonl"
+        self._lock = threading.Lock()
+        self._loaded = False
+        # 마지막 저장 상태의 차이 계산용 스냅샷 (전체 문서가 아님)
+        self._state: Optional[Dict[str, Any]] = None
+        self._seq = 0
+        self._snapshot_seq = 0
+        self._journal_records = 0
+        self._journal_bytes = 0
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                snapshot = json_codec.loads(f.read())
+        except FileNotFoundError:
+            data, self._seq = None, 0
+        else:
+            data, self._seq = snapshot.get("data"), int(snapshot.get("seq", 0))
+        self._snapshot_seq = self._seq
+        return data
+
+    def _replay_journal(self, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """스냅샷 이후의 저널 레코드 적용 (끝의 불완전한 줄은 잘라냄)"""
+        self._journal_records = 0
+        self._journal_bytes = 0
+        try:
+            f = open(self.journal_path, "rb")
+        except FileNotFoundError:
+            return data
+        valid_bytes = 0
+        with f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("줄바꿈 없음")
+                    record = json_codec.loads(line)
+                except ValueError:
+                    logger.warning("저널 끝의 불완전한 레코드를 버립니다: %s", self.journal_path)
+                    break
+                valid_bytes += len(line)
+                self._journal_records += 1
+                if record["seq"] <= self._seq:
+                    continue
+                if "data" in record:
+                    data = record["data"]
+                else:
+                    data = delta_protocol.apply_patch(data, record["patch"])
+                self._seq = record["seq"]
+        if valid_bytes < self.journal_path.stat().st_size:
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(valid_bytes)
+                os.fsync(f.fileno())
+        self._journal_bytes = valid_bytes
+        return data
+
+    def _read_locked(self) -> Optional[Dict[str, Any]]:
+        """스냅샷에 저널을 재생한 전체 문서를 읽고 차이 계산용 스냅샷 갱신 (self._lock을 가진 상태에서 호출)"""
+        data = self._replay_journal(self._read_snapshot())
+        self._state = delta_protocol.snapshot(data) if data is not None else None
+        self._loaded = True
+        return data
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷에 저널을 재생한 게임 데이터 (저장된 적이 없으면 None)
+
+        매번 파일에서 새로 읽으므로 호출자가 자유롭게 변경할 수 있습니다.
+        """
+        with self._lock:
+            return self._read_locked()
+
+    def append(self, data: Dict[str, Any]) -> int:
+        """
+        이전 저장 상태와의 차이를 저널에 기록 (fsync)
+
+        누적 기록 리스트는 새로 추가된 항목만 비교하므로, 조우 한 번의 저장 비용은 전체 기록의 양과 관계없습니다.
+
+        Returns:
+            기록한 패치 연산 수 (변경이 없으면 0, 기록하지 않음)
+        """
+        with self._lock:
+            if not self._loaded:
+                self._read_locked()
+            if self._state is None:
+                record: Dict[str, Any] = {"seq": self._seq + 1, "data": data}
+                op_count = 1
+            else:
+                patch = delta_protocol.make_patch(self._state, data)
+                if not patch:
+                    return 0
+                record = {"seq": self._seq + 1, "patch": patch}
+                op_count = len(patch)
+            record["ts"] = datetime.now().isoformat()
+
+            line = json_codec.dumps(record) + b"\n"
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "ab") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._state = delta_protocol.snapshot(data)
+            self._seq = record["seq"]
+            self._journal_records += 1
+            self._journal_bytes += len(line)
+
+            # 백그라운드 컴팩터가 없는 환경 (Mangum lifespan="off" 등)에서도 저널이 계속 커지지 않도록
+            # 저장 직후 기준을 넘었으면 같은 락 안에서 컴팩션 (저장은 이미 완료되었으므로 실패해도 무시)
+            if self.needs_compaction():
+                try:
+                    self._compact_locked(data)
+                except OSError as e:
+                    logger.warning("저널 컴팩션 실패 (다음 저장 시 재시도): %s", e)
+            return op_count
+
+    def needs_compaction(self) -> bool:
+        """저널이 컴팩션 기준을 넘었는지 확인"""
+        return self._journal_records >= JOURNAL_COMPACT_RECORDS or self._journal_bytes >= JOURNAL_COMPACT_BYTES
+
+    def compact(self) -> bool:
+        """
+        현재 상태를 스냅샷으로 저장하고 저널 비우기 (전체 문서는 파일에서 다시 읽음)
+
+        Returns:
+            컴팩션 수행 여부 (저널이 비어 있으면 False)
+        """
+        with self._lock:
+            if self._loaded and self._journal_records == 0:
+                return False
+            return self._compact_locked(self._read_locked())
+
+    def _compact_locked(self, data: Optional[Dict[str, Any]]) -> bool:
+        """data(현재 전체 문서)를 스냅샷으로 저장하고 저널 비우기 (self._lock을 가진 상태에서 호출)"""
+        if self._journal_records == 0 or data is None:
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json_codec.dumps({"seq": self._seq, "data": data}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        _fsync_directory(self.directory)
+
+        with open(self.journal_path, "wb") as f:
+            os.fsync(f.fileno())
+        self._snapshot_seq = self._seq
+        self._journal_records = 0
+        self._journal_bytes = 0
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """저널 상태"""
+        return {
+            "seq": self._seq,
+            "snapshot_seq": self._snapshot_seq,
+            "journal_records": self._journal_records,
+            "journal_bytes": self._journal_bytes
+        }
+
+
+_journals: Dict[str, SaveJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(directory: Path, name: str) -> SaveJournal:
+    """디렉토리/이름별 저널 (프로세스 전역으로 하나씩)"""
+    key = str(Path(directory) / name)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = SaveJournal(directory, name)
+        return journal
+
+
+def compact_all(force: bool = False) -> List[str]:
+    """
+    열려 있는 저널 중 기준을 넘은 저널 컴팩션
+
+    Args:
+        force: True이면 기준과 관계없이 레코드가 있는 모든 저널 컴팩션
+
+    Returns:
+        컴팩션한 저널 경로 목록
+    """
+    with _journals_lock:
+        journals = list(_journals.values())
+    compacted = []
+    for journal in journals:
+        if (force or journal.needs_compaction()) and journal.compact():
+            compacted.append(str(journal.journal_path))
+    return compacted
+
+
+async def run_compactor(interval: float = JOURNAL_COMPACT_INTERVAL) -> None:
+    """
+    백그라운드 컴팩터 (앱 시작 시 태스크로 실행, 종료 시 취소)
+
+    기준을 넘은 저널은 append()가 직접 컴팩션하므로, 이 태스크는 저장 요청 경로 밖에서
+    미리 컴팩션해 두는 최적화일 뿐이며 lifespan 없이 실행되는 환경에서는 없어도 됩니다.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            compacted = await asyncio.to_thread(compact_all)
+            if compacted:
+                logger.info("저널 컴팩션 완료: %d개", len(compacted))
+        except Exception as e:
+            logger.exception("저널 컴팩션 실패")
@@ -0,0 +1,309 @@
+import os
+import abc
+import uuid
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Awaitable
+
+from app.services.sqlite_storage import SQLiteStorage
+from app.services.campaign_index import CampaignIndex
+from app.services.write_coalescer import WriteCoalescer
+from app.services import storage_service
+from app.services import tracing
+
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+# 캠페인 저장소 설정 (filesystem 또는 sqlite)
+CAMPAIGN_STORE_BACKEND = os.getenv("CAMPAIGN_STORE_BACKEND", "filesystem").lower()
+CAMPAIGN_STORE_DIR = Path(os.getenv("CAMPAIGN_STORE_DIR", str(DATA_DIR / "campaigns")))
+CAMPAIGN_STORE_SQLITE_PATH = Path(os.getenv("CAMPAIGN_STORE_SQLITE_PATH", str(DATA_DIR / "campaigns.sqlite3")))
+CAMPAIGN_STORE_CACHE_SIZE = int(os.getenv("CAMPAIGN_STORE_CACHE_SIZE", "64"))
+
+
+class CampaignNotFoundError(Exception):
+    """캠페인 ID에 해당하는 저장 데이터가 없음"""
+
+
+def new_campaign_id() -> str:
+    """새 캠페인 ID 생성"""
+    return uuid.uuid4().hex
+
+
+def is_valid_campaign_id(campaign_id: str) -> bool:
+    """캠페인 ID 형식 확인 (파일 이름으로 사용하므로 영숫자/-/_만 허용)"""
+    return bool(campaign_id) and len(campaign_id) <= 64 and all(
+        c.isalnum() or c in "-_" for c in campaign_id
+    )
+
+
+class CampaignBackend(abc.ABC):
+    """캠페인 영구 저장소 인터페이스 (다른 저장소를 연결하려면 이 클래스를 상속)"""
+
+    @abc.abstractmethod
+    def load(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        """저장된 게임 데이터 (없으면 None)"""
+
+    @abc.abstractmethod
+    def save(self, campaign_id: str, data: Dict[str, Any]) -> None:
+        """게임 데이터 저장"""
+
+    def save_encoded(self, campaign_id: str, raw: bytes) -> None:
+        """직렬화된 게임 데이터 저장 (CampaignStore가 사용, 기본 구현은 디코딩 후 save 호출)"""
+        self.save(campaign_id, storage_service.decode_save(raw))
+
+    @abc.abstractmethod
+    def delete(self, campaign_id: str) -> bool:
+        """저장된 게임 데이터 삭제 (삭제했으면 True)"""
+
+    @abc.abstractmethod
+    def list_ids(self) -> List[str]:
+        """저장된 캠페인 ID 목록"""
+
+
+class FileSystemBackend(CampaignBackend):
+    """캠페인별 JSON 파일 저장소 (임시 파일에 쓴 뒤 교체)"""
+
+    def __init__(self, directory: Path = CAMPAIGN_STORE_DIR):
+        self.directory = Path(directory)
+
+    def _path(self, campaign_id: str) -> Path:
+        return self.directory / f"{campaign_id}.json"
+
+    def load(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(campaign_id), "rb") as f:
+                return storage_service.decode_save(f.read())
+        except FileNotFoundError:
+            return None
+
+    def save(self, campaign_id: str, data: Dict[str, Any]) -> None:
+        self.save_encoded(campaign_id, storage_service.encode_save(data))
+
+    def save_encoded(self, campaign_id: str, raw: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(campaign_id)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def delete(self, campaign_id: str) -> bool:
+        try:
+            self._path(campaign_id).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def list_ids(self) -> List[str]:
+        if not self.directory.exists():
+            return []
+        return sorted(path.stem for path in self.directory.glob("*.json"))
+
+
+class SQLiteBackend(CampaignBackend):
+    """정규화된 SQLite 저장소 (변경된 행만 기록, sqlite_storage 참고)"""
+
+    def __init__(self, path: Path = CAMPAIGN_STORE_SQLITE_PATH):
+        self.storage = SQLiteStorage(path)
+
+    def load(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        return self.storage.load(campaign_id)
+
+    def save(self, campaign_id: str, data: Dict[str, Any]) -> None:
+        self.storage.save(campaign_id, data)
+
+    def delete(self, campaign_id: str) -> bool:
+        return self.storage.delete(campaign_id)
+
+    def list_ids(self) -> List[str]:
+        return self.storage.list_ids()
+
+
+class CampaignStore:
+    """
+    서버 측 캠페인 저장소 (메모리 LRU 캐시 + 영구 저장소)
+
+    캐시에 있는 캠페인 데이터는 요청 처리 중 직접 변경되므로, 같은 캠페인에 대한 변경 요청은
+    lock(campaign_id)으로 직렬화하고, 처리 중 오류가 나면 discard()로 캐시를 버려
+    다음 요청에서 저장된 상태를 다시 읽게 합니다.
+
+    영구 저장소 읽기/쓰기는 스레드 풀에서 실행하고 (WriteCoalescer), 같은 캠페인의 쓰기는 하나로 병합합니다.
+    변경 요청은 lock 안에서 stage()로 직렬화한 bytes를 쓰기 대기열에 등록하고, lock을 해제한 뒤 기록을 기다리므로
+    기록 중에 들어온 다음 요청의 저장이 대기 중인 쓰기 하나로 합쳐집니다.
+    """
+
+    def __init__(self, backend: CampaignBackend, cache_size: int = CAMPAIGN_STORE_CACHE_SIZE):
+        self.backend = backend
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._indexes: Dict[str, CampaignIndex] = {}
+        self._memos: Dict[str, Dict[Any, Any]] = {}
+        self._writer: WriteCoalescer[None] = WriteCoalescer(backend.save_encoded)
+        self.hits = 0
+        self.misses = 0
+        self.saves = 0
+
+    def lock(self, campaign_id: str) -> asyncio.Lock:
+        """캠페인별 변경 lock"""
+        lock = self._locks.get(campaign_id)
+        if lock is None:
+            lock = self._locks[campaign_id] = asyncio.Lock()
+        return lock
+
+    def _remember(self, campaign_id: str, data: Dict[str, Any]) -> None:
+        self._cache[campaign_id] = data
+        self._cache.move_to_end(campaign_id)
+        while len(self._cache) > self.cache_size:
+            evicted_id, _ = self._cache.popitem(last=False)
+            self._indexes.pop(evicted_id, None)
+            self._memos.pop(evicted_id, None)
+            lock = self._locks.get(evicted_id)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted_id]
+
+    @tracing.traced("campaign_store.get")
+    async def get(self, campaign_id: str) -> Dict[str, Any]:
+        """
+        캠페인 데이터 조회 (캐시 우선)
+
+        Raises:
+            CampaignNotFoundError: 저장된 캠페인이 없는 경우
+        """
+        data = self._cache.get(campaign_id)
+        if data is not None:
+            self.hits += 1
+            self._cache.move_to_end(campaign_id)
+            return data
+
+        self.misses += 1
+        data = await asyncio.to_thread(self.backend.load, campaign_id) if is_valid_campaign_id(campaign_id) else None
+        if data is None:
+            raise CampaignNotFoundError(f"캠페인을 찾을 수 없습니다: {campaign_id}")
+        # 읽는 동안 다른 요청이 같은 캠페인을 캐시에 올렸다면 그 객체를 사용 (변경 내용 유실 방지)
+        cached = self._cache.get(campaign_id)
+        if cached is not None:
+            return cached
+        self._remember(campaign_id, data)
+        return data
+
+    @tracing.traced("campaign_store.stage")
+    async def stage(self, campaign_id: str, data: Dict[str, Any]) -> Awaitable[None]:
+        """
+        캠페인 데이터 저장 예약 (캐시 갱신, 직렬화 후 쓰기 대기열에 등록)
+
+        캠페인 lock을 보유한 상태에서 호출합니다. 반환 시점에는 직렬화가 끝났으므로 data를 다시 변경해도 되며,
+        반환된 awaitable(영구 저장소 기록)은 lock을 해제한 뒤 기다립니다.
+
+        Returns:
+            영구 저장소 기록 완료를 기다리는 awaitable
+
+        Raises:
+            ValueError: 잘못된 캠페인 ID
+        """
+        if not is_valid_campaign_id(campaign_id):
+            raise ValueError(f"잘못된 캠페인 ID: {campaign_id}")
+        if "save_file_info" in data:
+            data["save_file_info"]["last_played"] = datetime.now().isoformat()
+        self._remember(campaign_id, data)
+        raw = await asyncio.to_thread(storage_service.encode_save, data)
+        self.saves += 1
+        return self._writer.submit(campaign_id, raw)
+
+    async def save(self, campaign_id: str, data: Dict[str, Any]) -> None:
+        """
+        캠페인 데이터 저장 (영구 저장소 기록이 끝날 때까지 대기)
+
+        캠페인 lock을 보유한 상태에서 호출합니다. 변경 요청은 stage()를 사용하여 lock 밖에서 기록을 기다립니다.
+        """
+        await (await self.stage(campaign_id, data))
+
+    async def create(self, data: Dict[str, Any]) -> str:
+        """새 캠페인 저장 후 캠페인 ID 반환"""
+        campaign_id = new_campaign_id()
+        data.setdefault("save_file_info", {})["campaign_id"] = campaign_id
+        async with self.lock(campaign_id):
+            await self.save(campaign_id, data)
+        return campaign_id
+
+    def index(self, campaign_id: str, data: Dict[str, Any]) -> CampaignIndex:
+        """
+        캐시된 캠페인의 기록 인덱스 (revision이 다르면 다시 생성)
+
+        호출자는 기록을 추가할 때 인덱스도 갱신하고 revision을 맞춰야 합니다.
+        """
+        index = self._indexes.get(campaign_id)
+        if index is None or not index.is_current(data):
+            index = CampaignIndex.build(data)
+            if campaign_id in self._cache:
+                self._indexes[campaign_id] = index
+        return index
+
+    def memo(self, campaign_id: str) -> Dict[Any, Any]:
+        """
+        캐시된 캠페인의 조회 결과 메모 (호출자가 키와 값을 정함)
+
+        캠페인이 캐시에서 빠지거나 discard()되면 함께 버려지므로, 실패한 변경 요청 중에
+        계산된 결과가 남지 않습니다. 캐시에 없는 캠페인은 보관하지 않는 빈 딕셔너리를 반환합니다.
+        """
+        if campaign_id not in self._cache:
+            return {}
+        memo = self._memos.get(campaign_id)
+        if memo is None:
+            memo = self._memos[campaign_id] = {}
+        return memo
+
+    def discard(self, campaign_id: str) -> None:
+        """캐시에서 제거 (다음 조회 시 영구 저장소에서 다시 읽음)"""
+        self._cache.pop(campaign_id, None)
+        self._indexes.pop(campaign_id, None)
+        self._memos.pop(campaign_id, None)
+
+    async def delete(self, campaign_id: str) -> bool:
+        """캠페인 삭제"""
+        self.discard(campaign_id)
+        if not is_valid_campaign_id(campaign_id):
+            return False
+        return await asyncio.to_thread(self.backend.delete, campaign_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 히트/미스 및 저장 횟수"""
+        return {
+            "backend": type(self.backend).__name__,
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "saves": self.saves,
+            **self._writer.stats()
+        }
+
+
+def create_backend(name: str = CAMPAIGN_STORE_BACKEND) -> CampaignBackend:
+    """설정 이름으로 영구 저장소 생성"""
+    if name == "sqlite":
+        return SQLiteBackend()
+    if name == "filesystem":
+        return FileSystemBackend()
+    raise ValueError(f"알 수 없는 캠페인 저장소: {name}")
+
+
+_store: Optional[CampaignStore] = None
+
+
+def get_campaign_store() -> CampaignStore:
+    """프로세스 전역 캠페인 저장소 (최초 호출 시 생성)"""
+    global _store
+    if _store is None:
+        _store = CampaignStore(create_backend())
+    return _store
+
+
+def set_campaign_store(store: Optional[CampaignStore]) -> None:
+    """캠페인 저장소 교체 (다른 저장소 연결 또는 초기화용)"""
+    global _store
+    _store = store
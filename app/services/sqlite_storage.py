@@ -0,0 +1,345 @@
+import json
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.services import json_codec
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS campaigns (
+    campaign_id TEXT PRIMARY KEY,
+    player_name TEXT,
+    campaign_year INTEGER,
+    today_date TEXT,
+    revision INTEGER NOT NULL DEFAULT 0,
+    last_played TEXT,
+    updated_at TEXT NOT NULL,
+    document TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_campaigns_last_played ON campaigns (last_played);
+
+CREATE TABLE IF NOT EXISTS monthly_chapters (
+    campaign_id TEXT NOT NULL REFERENCES campaigns (campaign_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    month TEXT NOT NULL,
+    is_completed INTEGER NOT NULL DEFAULT 0,
+    monthly_score INTEGER NOT NULL DEFAULT 0,
+    monthly_madness INTEGER NOT NULL DEFAULT 0,
+    document TEXT NOT NULL,
+    PRIMARY KEY (campaign_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS daily_entries (
+    campaign_id TEXT NOT NULL REFERENCES campaigns (campaign_id) ON DELETE CASCADE,
+    chapter_position INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    diary_write_date TEXT,
+    day_of_week TEXT,
+    is_success INTEGER NOT NULL DEFAULT 0,
+    document TEXT NOT NULL,
+    PRIMARY KEY (campaign_id, chapter_position, position)
+);
+CREATE INDEX IF NOT EXISTS idx_daily_entries_date ON daily_entries (campaign_id, diary_write_date);
+
+CREATE TABLE IF NOT EXISTS weekly_records (
+    campaign_id TEXT NOT NULL REFERENCES campaigns (campaign_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    week_number INTEGER,
+    week_start_date TEXT,
+    week_end_date TEXT,
+    document TEXT NOT NULL,
+    PRIMARY KEY (campaign_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_weekly_records_dates ON weekly_records (campaign_id, week_start_date, week_end_date);
+"""
+
+RowKey = Tuple[Any, ...]
+
+
+def _dumps(value: Any) -> str:
+    return json_codec.dumps_str(value)
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def split_game_data(data: Dict[str, Any]) -> Dict[RowKey, Tuple[str, tuple]]:
+    """
+    게임 데이터(JSON 스키마)를 테이블 행으로 분해
+
+    월간 챕터의 daily_entries와 legacy_inventory.weekly_records는 각각 별도 행으로 저장하고,
+    나머지 문서에는 키 순서 유지를 위해 빈 리스트를 남깁니다.
+
+    Returns:
+        행 키 -> (문서 JSON, 인덱스 컬럼 값) 딕셔너리
+        행 키: ("campaign",), ("chapter", 챕터 위치), ("entry", 챕터 위치, 위치), ("week", 위치)
+    """
+    rows: Dict[RowKey, Tuple[str, tuple]] = {}
+    history = data.get("campaign_history", {})
+    legacy = data.get("legacy_inventory", {})
+
+    for chapter_position, chapter in enumerate(history.get("monthly_chapters", [])):
+        for position, entry in enumerate(chapter.get("daily_entries", [])):
+            snapshot = entry.get("game_logic_snapshot", {})
+            rows[("entry", chapter_position, position)] = (_dumps(entry), (
+                entry.get("diary_write_date"),
+                entry.get("day_of_week"),
+                int(bool(snapshot.get("is_success")))
+            ))
+        header = {**chapter, "daily_entries": []} if "daily_entries" in chapter else chapter
+        rows[("chapter", chapter_position)] = (_dumps(header), (
+            chapter.get("month", ""),
+            int(bool(chapter.get("is_completed"))),
+            int(chapter.get("monthly_score", 0) or 0),
+            int(chapter.get("monthly_madness", 0) or 0)
+        ))
+
+    for position, record in enumerate(legacy.get("weekly_records", [])):
+        rows[("week", position)] = (_dumps(record), (
+            record.get("week_number"),
+            record.get("week_start_date"),
+            record.get("week_end_date")
+        ))
+
+    document = dict(data)
+    if "campaign_history" in data:
+        document["campaign_history"] = {**history, "monthly_chapters": []}
+    if "legacy_inventory" in data:
+        document["legacy_inventory"] = {**legacy, "weekly_records": []}
+    save_file_info = data.get("save_file_info", {})
+    rows[("campaign",)] = (_dumps(document), (
+        save_file_info.get("player_name"),
+        save_file_info.get("campaign_year"),
+        data.get("current_state", {}).get("today_date"),
+        int(save_file_info.get("revision", 0) or 0),
+        save_file_info.get("last_played")
+    ))
+    return rows
+
+
+class SQLiteStorage:
+    """
+    정규화된 SQLite 게임 데이터 저장소 (WAL 모드)
+
+    캠페인, 월간 챕터, 일일 엔트리, 주간 기록을 각각의 테이블에 저장합니다.
+    캠페인별로 마지막으로 읽거나 쓴 행의 해시를 기억해 두고, 저장할 때는 바뀐 행만
+    INSERT/DELETE 하므로 조우 한 번의 저장은 보통 새 일일 엔트리 한 행과 캠페인 행 갱신입니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._digests: Dict[str, Dict[RowKey, bytes]] = {}
+        self.rows_written = 0
+        self.rows_deleted = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._digests.clear()
+
+    def _read_rows(self, conn: sqlite3.Connection, campaign_id: str) -> Optional[Dict[RowKey, str]]:
+        row = conn.execute("SELECT document FROM campaigns WHERE campaign_id = ?", (campaign_id,)).fetchone()
+        if row is None:
+            return None
+        rows: Dict[RowKey, str] = {("campaign",): row[0]}
+        for position, document in conn.execute(
+            "SELECT position, document FROM monthly_chapters WHERE campaign_id = ?", (campaign_id,)
+        ):
+            rows[("chapter", position)] = document
+        for chapter_position, position, document in conn.execute(
+            "SELECT chapter_position, position, document FROM daily_entries WHERE campaign_id = ?", (campaign_id,)
+        ):
+            rows[("entry", chapter_position, position)] = document
+        for position, document in conn.execute(
+            "SELECT position, document FROM weekly_records WHERE campaign_id = ?", (campaign_id,)
+        ):
+            rows[("week", position)] = document
+        return rows
+
+    def load(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        """
+        캠페인을 게임 데이터(JSON 스키마)로 조립
+
+        Returns:
+            게임 데이터 딕셔너리 (캠페인이 없으면 None)
+        """
+        with self._lock:
+            rows = self._read_rows(self._connect(), campaign_id)
+            if rows is None:
+                self._digests.pop(campaign_id, None)
+                return None
+            self._digests[campaign_id] = {key: _digest(text) for key, text in rows.items()}
+
+        data = json_codec.loads(rows[("campaign",)])
+        chapters: Dict[int, Dict[str, Any]] = {}
+        entries: Dict[int, List[Tuple[int, Any]]] = {}
+        weeks: List[Tuple[int, Any]] = []
+        for key, text in rows.items():
+            if key[0] == "chapter":
+                chapters[key[1]] = json_codec.loads(text)
+            elif key[0] == "entry":
+                entries.setdefault(key[1], []).append((key[2], json_codec.loads(text)))
+            elif key[0] == "week":
+                weeks.append((key[1], json_codec.loads(text)))
+
+        for chapter_position, chapter in chapters.items():
+            if chapter_position in entries or "daily_entries" in chapter:
+                chapter["daily_entries"] = [entry for _, entry in sorted(entries.get(chapter_position, []), key=lambda item: item[0])]
+        if "campaign_history" in data:
+            data["campaign_history"]["monthly_chapters"] = [chapters[position] for position in sorted(chapters)]
+        if "legacy_inventory" in data:
+            data["legacy_inventory"]["weekly_records"] = [record for _, record in sorted(weeks, key=lambda item: item[0])]
+        return data
+
+    def save(self, campaign_id: str, data: Dict[str, Any]) -> int:
+        """
+        게임 데이터 저장 (이전 저장 이후 바뀐 행만 기록)
+
+        Returns:
+            기록하거나 삭제한 행 수
+        """
+        rows = split_game_data(data)
+        digests = {key: _digest(text) for key, (text, _) in rows.items()}
+        now = datetime.now().isoformat()
+
+        with self._lock:
+            conn = self._connect()
+            previous = self._digests.get(campaign_id)
+            if previous is not None:
+                # 다른 연결(프로세스)이 그 사이에 저장했다면 기억해 둔 해시를 버리고 다시 읽기
+                row = conn.execute("SELECT document FROM campaigns WHERE campaign_id = ?", (campaign_id,)).fetchone()
+                if row is None or _digest(row[0]) != previous.get(("campaign",)):
+                    previous = None
+            if previous is None:
+                stored = self._read_rows(conn, campaign_id) or {}
+                previous = {key: _digest(text) for key, text in stored.items()}
+
+            changed = [key for key, digest in digests.items() if previous.get(key) != digest]
+            removed = [key for key in previous if key not in digests]
+            # 캠페인 행이 먼저 있어야 외래 키를 만족하므로 가장 먼저 기록
+            changed.sort(key=lambda key: key[0] != "campaign")
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for key in removed:
+                    self._delete_row(conn, campaign_id, key)
+                for key in changed:
+                    self._write_row(conn, campaign_id, key, rows[key], now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                self._digests.pop(campaign_id, None)
+                raise
+
+            self._digests[campaign_id] = digests
+            self.rows_written += len(changed)
+            self.rows_deleted += len(removed)
+        return len(changed) + len(removed)
+
+    def _write_row(self, conn: sqlite3.Connection, campaign_id: str, key: RowKey, row: Tuple[str, tuple], now: str) -> None:
+        document, columns = row
+        kind = key[0]
+        if kind == "campaign":
+            conn.execute(
+                "INSERT INTO campaigns (campaign_id, player_name, campaign_year, today_date, revision, last_played, updated_at, document)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(campaign_id) DO UPDATE SET player_name = excluded.player_name,"
+                " campaign_year = excluded.campaign_year, today_date = excluded.today_date,"
+                " revision = excluded.revision, last_played = excluded.last_played,"
+                " updated_at = excluded.updated_at, document = excluded.document",
+                (campaign_id, *columns, now, document)
+            )
+        elif kind == "chapter":
+            conn.execute(
+                "INSERT OR REPLACE INTO monthly_chapters"
+                " (campaign_id, position, month, is_completed, monthly_score, monthly_madness, document)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (campaign_id, key[1], *columns, document)
+            )
+        elif kind == "entry":
+            conn.execute(
+                "INSERT OR REPLACE INTO daily_entries"
+                " (campaign_id, chapter_position, position, diary_write_date, day_of_week, is_success, document)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (campaign_id, key[1], key[2], *columns, document)
+            )
+        elif kind == "week":
+            conn.execute(
+                "INSERT OR REPLACE INTO weekly_records"
+                " (campaign_id, position, week_number, week_start_date, week_end_date, document)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (campaign_id, key[1], *columns, document)
+            )
+
+    def _delete_row(self, conn: sqlite3.Connection, campaign_id: str, key: RowKey) -> None:
+        kind = key[0]
+        if kind == "chapter":
+            conn.execute("DELETE FROM monthly_chapters WHERE campaign_id = ? AND position = ?", (campaign_id, key[1]))
+        elif kind == "entry":
+            conn.execute(
+                "DELETE FROM daily_entries WHERE campaign_id = ? AND chapter_position = ? AND position = ?",
+                (campaign_id, key[1], key[2])
+            )
+        elif kind == "week":
+            conn.execute("DELETE FROM weekly_records WHERE campaign_id = ? AND position = ?", (campaign_id, key[1]))
+
+    def delete(self, campaign_id: str) -> bool:
+        """캠페인과 하위 행 삭제"""
+        with self._lock:
+            self._digests.pop(campaign_id, None)
+            cursor = self._connect().execute("DELETE FROM campaigns WHERE campaign_id = ?", (campaign_id,))
+        return cursor.rowcount > 0
+
+    def list_ids(self) -> List[str]:
+        """저장된 캠페인 ID 목록"""
+        with self._lock:
+            rows = self._connect().execute("SELECT campaign_id FROM campaigns ORDER BY campaign_id").fetchall()
+        return [row[0] for row in rows]
+
+    def entries_between(self, campaign_id: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """날짜 인덱스로 기간 내 일일 엔트리 조회 (YYYY-MM-DD, 양끝 포함)"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT document FROM daily_entries WHERE campaign_id = ? AND diary_write_date BETWEEN ? AND ?"
+                " ORDER BY diary_write_date, chapter_position, position",
+                (campaign_id, start_date, end_date)
+            ).fetchall()
+        return [json_codec.loads(row[0]) for row in rows]
+
+    def import_json(self, campaign_id: str, path: Path) -> int:
+        """기존 JSON 세이브 파일을 캠페인으로 가져오기 (기록한 행 수 반환)"""
+        with open(path, "rb") as f:
+            data = json_codec.loads(f.read())
+        return self.save(campaign_id, data)
+
+    def export_json(self, campaign_id: str, path: Path) -> bool:
+        """캠페인을 기존 JSON 세이브 파일 형식으로 내보내기 (캠페인이 없으면 False)"""
+        data = self.load(campaign_id)
+        if data is None:
+            return False
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return True
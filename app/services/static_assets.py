@@ -0,0 +1,157 @@
+import json
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+from app.services import log_service
+from app.middleware.compression import accepts_encoding
+
+
+# 작업 디렉토리와 관계없이 프로젝트 루트 기준 경로 사용
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+STATIC_DIR = PROJECT_ROOT / "static"
+SOURCE_INDEX_HTML_PATH = PROJECT_ROOT / "index.html"
+
+# tools/build_assets.py 출력 위치
+DIST_DIR = STATIC_DIR / "dist"
+DIST_URL_PREFIX = "/static/dist/"
+MANIFEST_VERSION = 1
+
+# 파일 이름에 내용 해시가 있으므로 내용이 바뀌면 URL도 바뀜
+BUNDLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# 사전 압축본 (선호 순서)
+ENCODING_SUFFIXES = {"br": "br", "gzip": "gz"}
+
+MEDIA_TYPES = {
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+}
+
+logger = log_service.get_logger(__name__)
+
+
+class BundleFile:
+    """메모리에 올린 번들 (원본과 사전 압축본)"""
+
+    def __init__(self, path: Path):
+        self.media_type: str = MEDIA_TYPES.get(path.suffix, "application/octet-stream")
+        # 파일 이름의 내용 해시를 강한 ETag로 사용 (app.<hash>.js), 압축본은 인코딩별 ETag ("<hash>-br")
+        etag = '"' + path.name.split(".")[-2] + '"'
+        self.bodies: Dict[str, bytes] = {"identity": path.read_bytes()}
+        self.etags: Dict[str, str] = {"identity": etag}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            compressed = path.with_name(f"{path.name}.{suffix}")
+            if compressed.is_file():
+                self.bodies[encoding] = compressed.read_bytes()
+                # encounter_data.encoding_etag와 같은 형식 (빌드 도구가 fastapi 없이 import하므로 직접 생성)
+                self.etags[encoding] = f'{etag[:-1]}-{encoding}"'
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[Optional[str], bytes, str]:
+        """
+        허용된 인코딩에 맞는 본문 선택 (br, gzip 순)
+
+        Args:
+            accept_encoding: 요청의 Accept-Encoding 헤더 값
+
+        Returns:
+            (Content-Encoding 값 또는 None, 본문, 해당 표현의 ETag)
+        """
+        for encoding in ENCODING_SUFFIXES:
+            if encoding in self.bodies and accepts_encoding(accept_encoding, encoding):
+                return encoding, self.bodies[encoding], self.etags[encoding]
+        return None, self.bodies["identity"], self.etags["identity"]
+
+
+class StaticAssets:
+    """
+    빌드된 정적 자산 (static/dist/manifest.json)
+
+    매니페스트가 없으면 (빌드하지 않은 개발 환경) 원본 index.html과 static/ 파일을 그대로 사용합니다.
+    매니페스트와 번들은 첫 사용 시 한 번만 읽습니다.
+    """
+
+    def __init__(self, dist_dir: Path = DIST_DIR):
+        self.dist_dir = dist_dir
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._files: Dict[str, BundleFile] = {}
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            manifest_path = self.dist_dir / "manifest.json"
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                manifest = None
+            except (OSError, ValueError) as e:
+                logger.warning("정적 자산 매니페스트 로드 실패, 원본 파일 사용: %s", e)
+                manifest = None
+
+            if manifest is not None:
+                if manifest.get("version") != MANIFEST_VERSION:
+                    logger.warning("정적 자산 매니페스트 버전 불일치 (%s), 원본 파일 사용", manifest.get("version"))
+                    manifest = None
+                else:
+                    self._warn_if_stale(manifest_path, manifest)
+            self._manifest = manifest
+            self._loaded = True
+
+    def _warn_if_stale(self, manifest_path: Path, manifest: Dict[str, Any]) -> None:
+        """번들 빌드 이후 원본이 수정되었으면 경고 (다시 빌드 필요)"""
+        built_at = manifest_path.stat().st_mtime
+        sources = [SOURCE_INDEX_HTML_PATH] + [
+            PROJECT_ROOT / source.lstrip("/")
+            for bundle in manifest.get("bundles", {}).values()
+            for source in bundle.get("sources", [])
+        ]
+        stale = [str(path.relative_to(PROJECT_ROOT)) for path in sources if path.is_file() and path.stat().st_mtime > built_at]
+        if stale:
+            logger.warning(
+                "빌드 이후 수정된 정적 파일이 있습니다. python tools/build_assets.py로 다시 빌드하세요: %s",
+                ", ".join(stale)
+            )
+
+    @property
+    def built(self) -> bool:
+        self._load()
+        return self._manifest is not None
+
+    def index_html_path(self) -> Path:
+        """제공할 index.html 경로 (빌드된 index.html 우선)"""
+        if self.built:
+            rendered = self.dist_dir / "index.html"
+            if rendered.is_file():
+                return rendered
+        return SOURCE_INDEX_HTML_PATH
+
+    def get_bundle(self, filename: str) -> Optional[BundleFile]:
+        """
+        매니페스트에 있는 번들 조회
+
+        Args:
+            filename: 해시가 포함된 파일 이름 (예: app.3f2a9c1b0d.js)
+
+        Returns:
+            BundleFile 또는 None (매니페스트에 없는 파일)
+        """
+        if not self.built:
+            return None
+        bundle = self._files.get(filename)
+        if bundle is not None:
+            return bundle
+        if filename not in {entry.get("file") for entry in self._manifest.get("bundles", {}).values()}:
+            return None
+        try:
+            bundle = BundleFile(self.dist_dir / filename)
+        except OSError as e:
+            logger.warning("번들 파일 로드 실패 %s: %s", filename, e)
+            return None
+        self._files[filename] = bundle
+        return bundle
+
+
+assets = StaticAssets()
@@ -1,22 +1,90 @@
+import os
+import gzip
 import json
+import asyncio
+import sqlite3
 from datetime import date, datetime
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from app.services.sqlite_storage import SQLiteStorage
+from app.services import save_journal
+from app.services.write_coalescer import WriteCoalescer
+from app.services import json_codec
+from app.services import campaign_statistics
+from app.services import log_service
+from app.services import tracing
+
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 SAVE_FILE = DATA_DIR / "save_game.json"
 
+# 세이브 저장 방식
+# - json: data/save_game.json 파일 하나
+# - sqlite: 정규화된 SQLite 데이터베이스
+# - journal: 스냅샷 + 추가 전용 저널 (save_journal 참고)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json").lower()
+STORAGE_SQLITE_PATH = Path(os.getenv("STORAGE_SQLITE_PATH", str(DATA_DIR / "save_game.sqlite3")))
+STORAGE_JOURNAL_DIR = Path(os.getenv("STORAGE_JOURNAL_DIR", str(DATA_DIR / "journal")))
+
+# 세이브 파일 압축 (none 또는 gzip, 읽을 때는 형식을 자동 감지)
+SAVE_COMPRESSION = os.getenv("SAVE_COMPRESSION", "none").lower()
+SAVE_COMPRESSION_LEVEL = int(os.getenv("SAVE_COMPRESSION_LEVEL", "6"))
+GZIP_MAGIC = b"\x1f\x8b"
+DEFAULT_CAMPAIGN_ID = "default"
+
+_sqlite_storage: Optional[SQLiteStorage] = None
+
+logger = log_service.get_logger(__name__)
+
 
 def ensure_data_dir():
     """data 디렉토리가 없으면 생성"""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_game_data() -> Dict[str, Any]:
+@tracing.traced("storage.encode_save")
+def encode_save(data: Dict[str, Any]) -> bytes:
+    """세이브 데이터를 파일 내용으로 변환 (SAVE_COMPRESSION=gzip이면 gzip 압축)"""
+    payload = json_codec.dumps(data)
+    if SAVE_COMPRESSION == "gzip":
+        return gzip.compress(payload, compresslevel=SAVE_COMPRESSION_LEVEL, mtime=0)
+    return payload
+
+
+@tracing.traced("storage.decode_save")
+def decode_save(raw: bytes) -> Any:
+    """세이브 파일 내용 해석 (gzip 압축 여부 자동 감지)"""
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return json_codec.loads(raw)
+
+
+def get_sqlite_storage() -> SQLiteStorage:
+    """SQLite 저장소 (최초 호출 시 생성)"""
+    global _sqlite_storage
+    if _sqlite_storage is None:
+        _sqlite_storage = SQLiteStorage(STORAGE_SQLITE_PATH)
+    return _sqlite_storage
+
+
+def _validate_prologue(data: Dict[str, Any]) -> None:
+    """프롤로그 검증: 새 게임 생성 후 불러올 때 프롤로그가 없거나 비어있으면 오류 발생"""
+    prologue = data.get("campaign_history", {}).get("prologue", {})
+    prologue_content = prologue.get("content", "")
+    
+    if not prologue_content or prologue_content.strip() == "":
+        raise ValueError("프롤로그 내용이 데이터베이스에 없습니다. 프롤로그를 생성한 후 다시 시도해주세요.")
+
+
+@tracing.traced("storage.load_game_data")
+def load_game_data(campaign_id: str = DEFAULT_CAMPAIGN_ID) -> Dict[str, Any]:
     """
     게임 데이터 로드
     
+    Args:
+        campaign_id: 캠페인 ID (sqlite/journal 저장 방식에서만 사용, json 방식은 세이브 파일 하나)
+    
     Returns:
         게임 데이터 딕셔너리 (파일이 없으면 새 게임 초기화)
         
@@ -25,32 +93,40 @@ def load_game_data() -> Dict[str, Any]:
     """
     ensure_data_dir()
     
+    if STORAGE_BACKEND in ("sqlite", "journal"):
+        if STORAGE_BACKEND == "sqlite":
+            data = get_sqlite_storage().load(campaign_id)
+        else:
+            data = save_journal.get_journal(STORAGE_JOURNAL_DIR, campaign_id).load()
+        if data is None:
+            return initialize_new_game()
+        _validate_prologue(data)
+        return data
+    
     if not SAVE_FILE.exists():
         return initialize_new_game()
     
     try:
-        with open(SAVE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-            # 프롤로그 검증: 새 게임 생성 후 불러올 때 프롤로그가 없거나 비어있으면 오류 발생
-            prologue = data.get("campaign_history", {}).get("prologue", {})
-            prologue_content = prologue.get("content", "")
-            
-            if not prologue_content or prologue_content.strip() == "":
-                raise ValueError("프롤로그 내용이 데이터베이스에 없습니다. 프롤로그를 생성한 후 다시 시도해주세요.")
-            
+        with open(SAVE_FILE, "rb") as f:
+            data = decode_save(f.read())
+            _validate_prologue(data)
             return data
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"게임 데이터 로드 실패: {e}. 새 게임을 시작합니다.")
+    except (json.JSONDecodeError, IOError, EOFError) as e:
+        logger.warning("게임 데이터 로드 실패: %s. 새 게임을 시작합니다.", e)
         return initialize_new_game()
 
 
-def save_game_data(data: Dict[str, Any]) -> bool:
+@tracing.traced("storage.save_game_data")
+def save_game_data(data: Dict[str, Any], campaign_id: str = DEFAULT_CAMPAIGN_ID) -> bool:
     """
     게임 데이터 저장
     
+    sqlite 저장 방식에서는 이전 저장 이후 바뀐 행(보통 새 일일 엔트리 한 행)만 기록하고,
+    journal 저장 방식에서는 바뀐 내용을 저널에 한 줄로 추가합니다.
+    
     Args:
         data: 저장할 게임 데이터
+        campaign_id: 캠페인 ID (sqlite/journal 저장 방식에서만 사용)
         
     Returns:
         저장 성공 여부
@@ -62,14 +138,60 @@ def save_game_data(data: Dict[str, Any]) -> bool:
         if "save_file_info" in data:
             data["save_file_info"]["last_played"] = datetime.now().isoformat()
         
-        with open(SAVE_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if STORAGE_BACKEND == "sqlite":
+            get_sqlite_storage().save(campaign_id, data)
+            return True
+        if STORAGE_BACKEND == "journal":
+            save_journal.get_journal(STORAGE_JOURNAL_DIR, campaign_id).append(data)
+            return True
+        
+        # 공백 없는 JSON (선택적으로 gzip)을 임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 기존 세이브 파일은 그대로)
+        payload = encode_save(data)
+        tmp_path = SAVE_FILE.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, SAVE_FILE)
         return True
-    except IOError as e:
-        print(f"게임 데이터 저장 실패: {e}")
+    except (IOError, sqlite3.Error) as e:
+        logger.error("게임 데이터 저장 실패: %s", e)
         return False
 
 
+# 캠페인별 저장 직렬화/병합 (저장 방식과 무관하게 스레드 풀에서 기록)
+_save_coalescer: WriteCoalescer[bool] = WriteCoalescer(lambda campaign_id, data: save_game_data(data, campaign_id))
+
+
+async def load_game_data_async(campaign_id: str = DEFAULT_CAMPAIGN_ID) -> Dict[str, Any]:
+    """
+    게임 데이터 로드 (파일 읽기/파싱을 스레드 풀에서 실행)
+    
+    Raises:
+        ValueError: 프롤로그가 없거나 비어있는 경우
+    """
+    return await asyncio.to_thread(load_game_data, campaign_id)
+
+
+async def save_game_data_async(data: Dict[str, Any], campaign_id: str = DEFAULT_CAMPAIGN_ID) -> bool:
+    """
+    게임 데이터 저장 (이벤트 루프를 막지 않음)
+    
+    직렬화와 기록은 스레드 풀에서 실행하고, 같은 캠페인의 저장은 하나씩 실행합니다.
+    저장이 진행 중일 때 들어온 저장들은 하나로 합쳐 가장 마지막 데이터만 기록합니다.
+    저장이 끝날 때까지 data를 변경하지 마세요.
+    
+    Returns:
+        저장 성공 여부 (병합된 경우 실제로 기록한 저장의 결과)
+    """
+    return await _save_coalescer.write(campaign_id, data)
+
+
+def get_save_stats() -> Dict[str, int]:
+    """비동기 저장 통계 (실제 쓰기 횟수, 병합된 저장 횟수)"""
+    return _save_coalescer.stats()
+
+
 def generate_prologue(year: int) -> tuple[str, str]:
     """
     연도별 프롤로그 생성 (빈 값 반환)
@@ -95,6 +217,7 @@ def generate_prologue(year: int) -> tuple[str, str]:
     return prologue_text, prologue_date
 
 
+@tracing.traced("storage.initialize_new_game")
 def initialize_new_game(campaign_year: int = 1925) -> Dict[str, Any]:
     """
     새 게임 초기화 (프롤로그 포함)
@@ -112,7 +235,8 @@ def initialize_new_game(campaign_year: int = 1925) -> Dict[str, Any]:
         "save_file_info": {
             "player_name": "John Miller",
             "campaign_year": campaign_year,
-            "last_played": datetime.now().isoformat()
+            "last_played": datetime.now().isoformat(),
+            "revision": 0  # 서버에서 변경할 때마다 1씩 증가 (delta 프로토콜 기준)
         },
         "current_state": {
             "description": "게임 플레이 중 실시간으로 변동되는 데이터입니다.",
@@ -142,7 +266,8 @@ def initialize_new_game(campaign_year: int = 1925) -> Dict[str, Any]:
                 "content": prologue_text,
                 "is_finalized": False
             }
-        }
+        },
+        "statistics": campaign_statistics.new_statistics()
     }
 
 
@@ -175,6 +300,7 @@ def get_current_month_chapter(data: Dict[str, Any], month_name: str) -> Optional
         "monthly_madness": 0,
         "description": "일요일 조우 성공(+5점) - 광기 만료(-5점) 계산 결과",
         "chapter_summary": "",
+        "revision": 0,  # 챕터가 바뀔 때마다 1씩 증가 (월별 조회 결과 캐시 기준)
         "daily_entries": []
     }
     
@@ -184,6 +310,20 @@ def get_current_month_chapter(data: Dict[str, Any], month_name: str) -> Optional
     return new_chapter
 
 
+def touch_chapter(chapter: Dict[str, Any]) -> int:
+    """
+    챕터 revision 증가 (챕터 내용을 바꾼 뒤 호출)
+    
+    revision이 없는 기존 세이브의 챕터는 0에서 시작합니다.
+    
+    Returns:
+        증가된 revision
+    """
+    chapter["revision"] = chapter.get("revision", 0) + 1
+    return chapter["revision"]
+
+
+@tracing.traced("storage.add_daily_entry")
 def add_daily_entry(
     data: Dict[str, Any],
     date_str: str,
@@ -195,7 +335,7 @@ def add_daily_entry(
     is_finalized: bool = True
 ) -> bool:
     """
-    일일 엔트리 추가
+    일일 엔트리 추가 (통계 블록도 함께 갱신)
     
     Args:
         data: 게임 데이터
@@ -248,9 +388,12 @@ def add_daily_entry(
     }
     
     chapter["daily_entries"].append(entry)
+    touch_chapter(chapter)
+    campaign_statistics.record_daily_entry(data, entry)
     return True
 
 
+@tracing.traced("storage.add_weekly_summary")
 def add_weekly_summary(
     data: Dict[str, Any],
     week_number: int,
@@ -261,7 +404,7 @@ def add_weekly_summary(
     weekly_summary_text: str = ""
 ) -> bool:
     """
-    주차별 요약 데이터를 legacy_inventory.weekly_records에 저장
+    주차별 요약 데이터를 legacy_inventory.weekly_records에 저장 (통계 블록도 함께 갱신)
     
     Args:
         data: 게임 데이터
@@ -297,5 +440,6 @@ def add_weekly_summary(
     }
     
     legacy_inventory["weekly_records"].append(weekly_record)
+    campaign_statistics.record_weekly_record(data, weekly_record)
     return True
 
@@ -0,0 +1,322 @@
+import os
+import re
+import json
+import time
+import queue
+import random
+import secrets
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, Callable, TypeVar
+
+from fastapi.routing import APIRoute
+
+from app.services import log_service
+
+
+# 요청 단위 트레이싱 사용 여부 (Server-Timing 헤더, 트레이스 파일 기록)
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() in ("1", "true", "yes")
+# 트레이스 기록 파일 (OTLP JSON 형식 한 줄에 한 요청, 비어 있으면 기록하지 않음)
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "")
+# 파일에 기록할 요청 비율 (0.0 ~ 1.0, Server-Timing 헤더는 항상 포함)
+TRACE_EXPORT_SAMPLE_RATE = float(os.getenv("TRACE_EXPORT_SAMPLE_RATE", "1.0"))
+# Server-Timing 헤더에 포함할 최대 항목 수 (소요 시간이 긴 순)
+SERVER_TIMING_MAX_ENTRIES = int(os.getenv("SERVER_TIMING_MAX_ENTRIES", "20"))
+
+SERVICE_NAME = "365-adventure-cthulhu"
+
+# OTLP span status code
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Server-Timing 메트릭 이름에 쓸 수 없는 문자 (HTTP token 문자만 허용)
+_INVALID_TOKEN_CHARS = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+logger = log_service.get_logger(__name__)
+
+
+class Span:
+    """하나의 처리 구간 (시작/종료 시각은 Unix epoch 나노초)"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "status")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes or {}
+        self.status = STATUS_UNSET
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON span 형식"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns if self.end_ns is not None else self.start_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class Trace:
+    """요청 하나의 span 목록 (종료된 순서)"""
+
+    def __init__(self, request_id: Optional[str] = None):
+        self.trace_id = secrets.token_hex(16)
+        self.request_id = request_id
+        self.root: Optional[Span] = None
+        self.spans: List[Span] = []
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def current_trace() -> Optional[Trace]:
+    """현재 요청의 트레이스 (트레이싱 중이 아니면 None)"""
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace(name: str, request_id: Optional[str] = None, **attributes: Any) -> Iterator[Trace]:
+    """
+    요청 트레이스 시작 (루트 span 포함)
+
+    블록 안에서 시작한 span과 asyncio 태스크, asyncio.to_thread로 실행한 작업의 span은
+    contextvar를 통해 이 트레이스에 모입니다.
+    """
+    trace = Trace(request_id)
+    trace_token = _current_trace.set(trace)
+    try:
+        with span(name, **attributes) as root:
+            trace.root = root
+            yield trace
+    finally:
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    현재 span의 자식 span (트레이스 밖에서는 아무것도 기록하지 않음)
+
+    Args:
+        name: span 이름 (예: "storage.load_game_data", "llm.daily_story")
+        **attributes: span 속성
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _current_span.get()
+    current = Span(name, trace.trace_id, parent.span_id if parent else None, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = STATUS_ERROR
+        current.attributes["exception.type"] = type(e).__name__
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        trace.spans.append(current)
+
+
+def set_attribute(key: str, value: Any) -> None:
+    """현재 span에 속성 추가 (트레이스 밖이면 무시)"""
+    current = _current_span.get()
+    if current is not None:
+        current.attributes[key] = value
+
+
+def record_span(name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+    """이미 지난 구간을 현재 span의 자식 span으로 기록 (예: 요청 검증 시간)"""
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    parent = _current_span.get()
+    recorded = Span(name, trace.trace_id, parent.span_id if parent else None, attributes)
+    recorded.start_ns = start_ns
+    recorded.end_ns = end_ns
+    trace.spans.append(recorded)
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    함수 호출을 span으로 기록하는 데코레이터 (일반 함수, 코루틴 함수 모두 지원)
+
+    Args:
+        name: span 이름 (생략 시 "모듈 마지막 이름.함수 이름")
+    """
+    def decorator(func: F) -> F:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class TracedRoute(APIRoute):
+    """
+    라우트 처리 단계를 span으로 기록하는 APIRoute
+
+    - route: 본문 읽기, pydantic 검증, 엔드포인트 실행, 응답 직렬화 전체
+    - validate: 엔드포인트 호출 전까지 (본문 읽기, JSON 파싱, pydantic 검증)
+    - endpoint: 엔드포인트 함수 실행
+
+    APIRouter(route_class=TracedRoute)로 사용합니다.
+    """
+
+    def get_route_handler(self):
+        call = self.dependant.call
+        if asyncio.iscoroutinefunction(call) and not getattr(call, "_traced_endpoint", False):
+            @functools.wraps(call)
+            async def traced_endpoint(*args, **kwargs):
+                route_span = _current_span.get()
+                if route_span is not None and route_span.name == "route":
+                    record_span("validate", route_span.start_ns, time.time_ns())
+                with span("endpoint", **{"code.function": call.__name__}):
+                    return await call(*args, **kwargs)
+            traced_endpoint._traced_endpoint = True
+            self.dependant.call = traced_endpoint
+
+        handler = super().get_route_handler()
+        route_path = self.path
+
+        async def traced_handler(request):
+            with span("route", **{"http.route": route_path}):
+                return await handler(request)
+
+        return traced_handler
+
+
+def _metric_name(name: str) -> str:
+    return _INVALID_TOKEN_CHARS.sub("_", name)
+
+
+def server_timing(trace: Trace) -> str:
+    """
+    트레이스의 종료된 span을 이름별로 합산한 Server-Timing 헤더 값
+
+    동시에 실행된 span(예: 스토리와 주간 요약 LLM 호출)은 각각 합산되므로 합계가 전체 시간보다 클 수 있습니다.
+    여러 번 실행된 span은 desc에 횟수를 표시합니다.
+    """
+    totals: Dict[str, List[float]] = {}
+    for finished in trace.spans:
+        if finished.end_ns is None:
+            continue
+        entry = totals.setdefault(_metric_name(finished.name), [0.0, 0])
+        entry[0] += finished.duration_ms
+        entry[1] += 1
+    ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:SERVER_TIMING_MAX_ENTRIES]
+    parts = []
+    for metric, (duration, count) in ranked:
+        part = f"{metric};dur={duration:.1f}"
+        if count > 1:
+            part += f';desc="x{count}"'
+        parts.append(part)
+    return ", ".join(parts)
+
+
+def to_otlp(trace: Trace) -> Dict[str, Any]:
+    """트레이스를 OTLP/JSON ExportTraceServiceRequest 형식으로 변환"""
+    spans = [finished.to_otlp() for finished in trace.spans]
+    if trace.request_id:
+        for exported in spans:
+            exported["attributes"].append(_otlp_attribute("request.id", trace.request_id))
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+            "scopeSpans": [{"scope": {"name": "app.tracing"}, "spans": spans}],
+        }]
+    }
+
+
+class _TraceExporter:
+    """트레이스를 별도 스레드에서 파일에 추가 기록 (요청 처리 흐름에서는 큐에 넣기만 함)"""
+
+    def __init__(self, path: Path, max_queue: int = 1000):
+        self.path = path
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            logger.warning("트레이스 기록 큐가 가득 차서 트레이스를 버립니다: %s", trace.trace_id)
+
+    def _run(self) -> None:
+        while True:
+            trace = self._queue.get()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(to_otlp(trace), ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.warning("트레이스 기록 실패: %s", e)
+
+
+_exporter: Optional[_TraceExporter] = _TraceExporter(Path(TRACE_EXPORT_PATH)) if TRACE_EXPORT_PATH else None
+
+
+def export(trace: Trace) -> None:
+    """TRACE_EXPORT_PATH가 설정되어 있으면 샘플링 비율에 따라 트레이스 기록"""
+    if _exporter is None:
+        return
+    if TRACE_EXPORT_SAMPLE_RATE < 1 and random.random() >= TRACE_EXPORT_SAMPLE_RATE:
+        return
+    _exporter.export(trace)
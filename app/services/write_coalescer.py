@@ -0,0 +1,96 @@
+import asyncio
+from typing import Optional, Dict, Any, Callable, TypeVar, Generic
+
+
+T = TypeVar("T")
+
+
+class _KeyState:
+    """키 하나의 쓰기 상태"""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.pending: Any = None
+        self.pending_future: Optional[asyncio.Future] = None
+
+
+class WriteCoalescer(Generic[T]):
+    """
+    키(캠페인)별 쓰기 직렬화 및 병합
+
+    동기 쓰기 함수를 스레드 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    같은 키에 대한 쓰기는 키별 lock으로 한 번에 하나씩 실행하고, 쓰기가 진행 중일 때 들어온
+    요청들은 대기 중인 쓰기 하나로 합쳐서 가장 마지막 데이터만 기록합니다.
+    (진행 중 1개 + 대기 1개 이상으로 쌓이지 않으므로 느린 디스크에서도 쓰기 횟수가 늘지 않습니다.)
+
+    쓰기 함수가 스레드에서 데이터를 직렬화하므로, 호출자는 쓰기가 끝날 때까지
+    넘긴 데이터를 변경하지 않아야 합니다. (직렬화한 bytes처럼 변경할 수 없는 값을 넘기면 이 제약이 없습니다.)
+    """
+
+    def __init__(self, write: Callable[[str, Any], T]):
+        self._write = write
+        self._states: Dict[str, _KeyState] = {}
+        self.writes = 0
+        self.coalesced = 0
+
+    async def write(self, key: str, data: Any) -> T:
+        """
+        데이터 기록 (같은 키의 더 새로운 쓰기와 병합될 수 있음)
+
+        Returns:
+            쓰기 함수의 반환값 (병합된 경우 실제로 기록한 쓰기의 반환값)
+        """
+        return await self.submit(key, data)
+
+    def submit(self, key: str, data: Any) -> "asyncio.Future[T]":
+        """
+        데이터 기록 예약 (대기열 등록은 즉시 수행하고, 기록 결과는 반환된 future로 기다림)
+
+        호출 순서대로 등록되므로, 호출자의 lock 안에서 등록하고 lock을 해제한 뒤 기다리면
+        기록 순서는 lock 순서를 따르면서 다음 요청의 쓰기와 병합될 수 있습니다.
+        """
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _KeyState()
+
+        # 이미 대기 중인 쓰기가 있으면 데이터만 교체하고 그 결과를 기다림
+        if state.pending_future is not None:
+            state.pending = data
+            self.coalesced += 1
+            return asyncio.shield(state.pending_future)
+
+        future = asyncio.get_running_loop().create_future()
+        state.pending = data
+        state.pending_future = future
+        return asyncio.ensure_future(self._flush(key, state, future))
+
+    async def _flush(self, key: str, state: _KeyState, future: asyncio.Future) -> T:
+        """키별 lock을 얻은 뒤 그 시점의 대기 데이터를 기록"""
+        try:
+            async with state.lock:
+                data = state.pending
+                state.pending = None
+                state.pending_future = None
+                try:
+                    result = await asyncio.to_thread(self._write, key, data)
+                except BaseException as e:
+                    future.set_exception(e)
+                    # 병합된 대기자가 없으면 예외가 조회되지 않았다는 경고가 나오지 않도록 처리
+                    future.exception()
+                    raise
+                self.writes += 1
+                future.set_result(result)
+                return result
+        finally:
+            if not future.done():
+                # lock을 기다리는 중 취소된 경우: 대기자에게 취소 전달
+                if state.pending_future is future:
+                    state.pending = None
+                    state.pending_future = None
+                future.cancel()
+            if not state.lock.locked() and state.pending_future is None:
+                self._states.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """실제 쓰기 횟수와 병합된 쓰기 횟수"""
+        return {"writes": self.writes, "coalesced": self.coalesced}
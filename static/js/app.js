@@ -1749,7 +1749,8 @@ async function processEncounter() {
         return;
     }
 
-    const requestData = {
+    // 클라이언트에서 게임 데이터 전달 (조우 처리에 필요한 슬라이스만, 응답은 변경 패치)
+    const requestData = window.DeltaSync.buildRequest({
         target_date: targetDate,
         visual_description: visualDescription,
         required_symbol: requiredSymbol,
@@ -1757,9 +1758,8 @@ async function processEncounter() {
         black_dice_sum: finalBlackDiceSum,
         green_dice_symbols: finalGreenDiceSymbols,
         cthulhu_symbol_count: cthulhuCount,
-        is_forced_failure: isForcedFailure, // 강제 실패 플래그 추가
-        game_data: currentGameData  // 클라이언트에서 게임 데이터 전달
-    };
+        is_forced_failure: isForcedFailure // 강제 실패 플래그 추가
+    }, 'encounter', currentGameData, { targetDate });
     
     if (window.DebugLogger) {
         window.DebugLogger.debug('조우 처리 요청 데이터', {
@@ -1856,11 +1856,12 @@ async function processEncounter() {
             resetCthulhuButton();
             
             // 클라이언트 저장소에 업데이트된 게임 데이터 저장
-            if (data.game_data && typeof window.StorageModule !== 'undefined') {
+            const updatedGameData = window.DeltaSync.resolveGameData(currentGameData, data);
+            if (updatedGameData && typeof window.StorageModule !== 'undefined') {
                 await window.StorageModule.initDB();
                 const activeSlotId = await window.StorageModule.getActiveSlot();
                 if (activeSlotId) {
-                    await window.StorageModule.autoSave(data.game_data, activeSlotId);
+                    await window.StorageModule.autoSave(updatedGameData, activeSlotId);
                     if (window.DebugLogger) window.DebugLogger.info('게임 데이터 저장 완료', { activeSlotId });
                     console.log('게임 데이터 저장 완료');
                 }
@@ -493,17 +493,35 @@ const DiaryComponent = {
                 this.textContent = '결산 생성 중...';
                 
                 try {
+                    let gameData = null;
+                    let activeSlotId = null;
+                    if (typeof window.StorageModule !== 'undefined') {
+                        await window.StorageModule.initDB();
+                        activeSlotId = await window.StorageModule.getActiveSlot();
+                        if (activeSlotId) {
+                            gameData = await window.StorageModule.getSaveSlot(activeSlotId);
+                        }
+                    }
+                    if (!gameData) {
+                        throw new Error('게임 데이터를 불러올 수 없습니다.');
+                    }
+                    
+                    // 해당 월 결산에 필요한 슬라이스만 전송 (응답은 변경 패치)
                     const response = await fetch(`${API_BASE}/api/game/month-conclusion`, {
                         method: 'POST',
                         headers: {
                             'Content-Type': 'application/json'
                         },
-                        body: JSON.stringify({ month: month })
+                        body: JSON.stringify(window.DeltaSync.buildRequest({ month: month }, 'month-conclusion', gameData, { month }))
                     });
                     
                     const data = await response.json();
                     
                     if (data.success) {
+                        const updatedGameData = window.DeltaSync.resolveGameData(gameData, data);
+                        if (updatedGameData && activeSlotId) {
+                            await window.StorageModule.autoSave(updatedGameData, activeSlotId);
+                        }
                         if (window.DebugLogger) window.DebugLogger.info('결산 생성 완료', { month });
                         // 결산 버튼 숨기기
                         document.getElementById('month-conclusion-section').style.display = 'none';
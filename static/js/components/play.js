@@ -1480,7 +1480,8 @@ const PlayComponent = {
             return;
         }
 
-        const requestData = {
+        // 전체 게임 데이터 대신 조우 처리에 필요한 슬라이스만 전송 (응답은 변경 패치)
+        const requestData = window.DeltaSync.buildRequest({
             target_date: targetDate,
             visual_description: visualDescription,
             required_symbol: requiredSymbol,
@@ -1488,9 +1489,8 @@ const PlayComponent = {
             black_dice_sum: finalBlackDiceSum,
             green_dice_symbols: finalGreenDiceSymbols,
             cthulhu_symbol_count: cthulhuCount,
-            is_forced_failure: isForcedFailure,
-            game_data: currentGameData
-        };
+            is_forced_failure: isForcedFailure
+        }, 'encounter', currentGameData, { targetDate });
         
         const storySection = document.getElementById('story-section');
         if (storySection) {
@@ -1510,22 +1510,24 @@ const PlayComponent = {
         
         try {
             if (window.DebugLogger) {
-                window.DebugLogger.logAPIRequest('POST', `${API_BASE}/api/game/encounter`, requestData);
+                window.DebugLogger.logAPIRequest('POST', `${API_BASE}/api/game/encounter/stream`, requestData);
             }
             const requestStartTime = Date.now();
-            const response = await fetch(`${API_BASE}/api/game/encounter`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify(requestData)
-            });
             
-            const data = await response.json();
+            // 스토리를 스트리밍으로 받아 생성되는 대로 표시
+            let streamedText = '';
+            const data = await window.Utils.postEventStream(`${API_BASE}/api/game/encounter/stream`, requestData, {
+                story: (payload) => {
+                    streamedText += payload.delta;
+                    if (storyContent) {
+                        storyContent.textContent = streamedText;
+                    }
+                }
+            });
             const requestDuration = Date.now() - requestStartTime;
             
             if (window.DebugLogger) {
-                window.DebugLogger.logAPIResponse('POST', `${API_BASE}/api/game/encounter`, data, requestDuration);
+                window.DebugLogger.logAPIResponse('POST', `${API_BASE}/api/game/encounter/stream`, data, requestDuration);
             }
             
             if (data.success) {
@@ -1578,11 +1580,12 @@ const PlayComponent = {
                 
                 this.resetCthulhuButton();
                 
-                if (data.game_data && typeof window.StorageModule !== 'undefined') {
+                const updatedGameData = window.DeltaSync.resolveGameData(currentGameData, data);
+                if (updatedGameData && typeof window.StorageModule !== 'undefined') {
                     await window.StorageModule.initDB();
                     const activeSlotId = await window.StorageModule.getActiveSlot();
                     if (activeSlotId) {
-                        await window.StorageModule.autoSave(data.game_data, activeSlotId);
+                        await window.StorageModule.autoSave(updatedGameData, activeSlotId);
                         if (window.DebugLogger) window.DebugLogger.info('게임 데이터 저장 완료', { activeSlotId });
                     }
                 }
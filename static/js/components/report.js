@@ -254,10 +254,15 @@ const ReportComponent = {
         // 조우 데이터 로드
         let encounterData = null;
         try {
-            const encounterResponse = await fetch(`${API_BASE}/api/game/encounter-data`);
-            const encounterResult = await encounterResponse.json();
-            if (encounterResult.success) {
-                encounterData = encounterResult.data;
+            if (typeof window.EncounterCache !== 'undefined') {
+                // ETag 재검증 캐시 사용 (변경 없으면 본문 전송 없음)
+                encounterData = await window.EncounterCache.load();
+            } else {
+                const encounterResponse = await fetch(`${API_BASE}/api/game/encounter-data`);
+                const encounterResult = await encounterResponse.json();
+                if (encounterResult.success) {
+                    encounterData = encounterResult.data;
+                }
             }
         } catch (error) {
             if (window.DebugLogger) {
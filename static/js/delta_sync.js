@@ -0,0 +1,198 @@
+// 게임 데이터 delta 동기화 모듈
+// 변경 API 호출 시 전체 게임 데이터 대신 엔드포인트가 읽는 부분(슬라이스)만 보내고,
+// 서버가 돌려준 JSON Patch를 로컬 게임 데이터에 적용합니다.
+
+// 서버의 통계 블록 스키마 버전 (app/services/campaign_statistics.py의 STATISTICS_VERSION과 동일)
+const STATISTICS_VERSION = 2;
+
+const MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+                     'July', 'August', 'September', 'October', 'November', 'December'];
+
+/**
+ * 'YYYY-MM-DD' 문자열의 월 이름 (예: 'January')
+ */
+function monthNameOf(dateStr) {
+    if (!dateStr) return null;
+    const month = parseInt(dateStr.split('-')[1], 10);
+    return MONTH_NAMES[month - 1] || null;
+}
+
+/**
+ * 'YYYY-MM-DD' 문자열의 연-월 키 (예: '1925-01')
+ */
+function yearMonthOf(dateStr) {
+    return dateStr ? dateStr.slice(0, 7) : null;
+}
+
+/**
+ * 게임 데이터의 revision (없으면 0)
+ */
+function getRevision(gameData) {
+    return gameData?.save_file_info?.revision || 0;
+}
+
+/**
+ * 엔드포인트가 읽는 부분만 남긴 게임 데이터 슬라이스 생성
+ *
+ * - 필요한 월의 챕터만 전체를 보내고, 나머지 챕터는 인덱스 유지를 위해 축약본으로 보냄
+ * - 관련 월이 아닌 주간 기록은 서버가 읽지 않는 본문(main_text, weekly_summary)을 제외
+ * - 통계 블록(statistics)이 없거나 버전이 다른 세이브는 서버가 백필할 수 있도록 모든 챕터 전체를 보냄
+ *
+ * @param {Object} gameData - 전체 게임 데이터
+ * @param {Object} options - { months: 전체가 필요한 월 이름 목록, recordMonth: 주간 기록 본문이 필요한 'YYYY-MM' }
+ * @returns {Object} 게임 데이터 슬라이스
+ */
+function sliceGameData(gameData, { months = [], recordMonth = null } = {}) {
+    const legacy = gameData.legacy_inventory || {};
+    const history = gameData.campaign_history || {};
+
+    const weeklyRecords = (legacy.weekly_records || []).map(record => {
+        if (recordMonth && yearMonthOf(record.week_end_date) === recordMonth) {
+            return record;
+        }
+        const { weekly_summary, ...rest } = record;
+        const { main_text, ...sundayEncounter } = record.sunday_encounter || {};
+        return { ...rest, sunday_encounter: sundayEncounter };
+    });
+
+    const needsBackfill = gameData.statistics?.version !== STATISTICS_VERSION;
+    const chapters = (history.monthly_chapters || []).map(chapter =>
+        needsBackfill || months.includes(chapter.month) ? chapter : { month: chapter.month, is_stub: true }
+    );
+
+    const slice = {
+        save_file_info: gameData.save_file_info || {},
+        current_state: gameData.current_state || {},
+        legacy_inventory: { ...legacy, weekly_records: weeklyRecords },
+        campaign_history: { monthly_chapters: chapters }
+    };
+    if (!needsBackfill) {
+        slice.statistics = gameData.statistics;
+    }
+    return slice;
+}
+
+/**
+ * 엔드포인트별 요청 슬라이스 생성
+ *
+ * @param {string} endpoint - 'encounter' | 'month-end' | 'month-start' | 'month-conclusion'
+ * @param {Object} gameData - 전체 게임 데이터
+ * @param {Object} params - { targetDate } (encounter) 또는 { month } (month-conclusion)
+ */
+function sliceFor(endpoint, gameData, params = {}) {
+    const todayDate = gameData?.current_state?.today_date;
+    const year = gameData?.save_file_info?.campaign_year;
+    switch (endpoint) {
+        case 'encounter':
+            return sliceGameData(gameData, {
+                months: [monthNameOf(todayDate), monthNameOf(params.targetDate)],
+                recordMonth: yearMonthOf(todayDate)
+            });
+        case 'month-end':
+            return sliceGameData(gameData, { months: [monthNameOf(todayDate)] });
+        case 'month-conclusion': {
+            const monthIndex = MONTH_NAMES.indexOf(params.month);
+            const recordMonth = year && monthIndex >= 0 ? `${year}-${String(monthIndex + 1).padStart(2, '0')}` : null;
+            return sliceGameData(gameData, { months: [params.month], recordMonth });
+        }
+        case 'month-start':
+            return sliceGameData(gameData, {});
+        default:
+            return gameData;
+    }
+}
+
+/**
+ * JSON Pointer (RFC 6901) 파싱
+ */
+function parsePointer(path) {
+    if (path === '') return [];
+    return path.slice(1).split('/').map(token => token.replace(/~1/g, '/').replace(/~0/g, '~'));
+}
+
+/**
+ * JSON Patch (RFC 6902의 add/remove/replace) 적용 (doc을 직접 변경)
+ *
+ * @param {Object} doc - 대상 문서
+ * @param {Array} ops - 패치 연산 목록
+ * @returns {Object} 패치가 적용된 문서
+ */
+function applyPatch(doc, ops) {
+    for (const op of ops) {
+        const tokens = parsePointer(op.path);
+        if (tokens.length === 0) {
+            doc = op.value;
+            continue;
+        }
+        let parent = doc;
+        for (const token of tokens.slice(0, -1)) {
+            parent = parent[Array.isArray(parent) ? parseInt(token, 10) : token];
+            if (parent === undefined || parent === null) {
+                throw new Error(`패치 경로를 찾을 수 없습니다: ${op.path}`);
+            }
+        }
+        const last = tokens[tokens.length - 1];
+        if (Array.isArray(parent)) {
+            const index = last === '-' ? parent.length : parseInt(last, 10);
+            if (op.op === 'add') {
+                parent.splice(index, 0, op.value);
+            } else if (op.op === 'remove') {
+                parent.splice(index, 1);
+            } else if (op.op === 'replace') {
+                parent[index] = op.value;
+            }
+        } else if (op.op === 'remove') {
+            delete parent[last];
+        } else {
+            parent[last] = op.value;
+        }
+    }
+    return doc;
+}
+
+/**
+ * 요청 본문에 슬라이스와 base_revision 설정
+ *
+ * @param {Object} body - 요청 본문 (game_data 제외)
+ * @param {string} endpoint - 엔드포인트 이름 (sliceFor 참고)
+ * @param {Object} gameData - 전체 게임 데이터
+ * @param {Object} params - sliceFor 파라미터
+ */
+function buildRequest(body, endpoint, gameData, params = {}) {
+    return {
+        ...body,
+        game_data: sliceFor(endpoint, gameData, params),
+        base_revision: getRevision(gameData)
+    };
+}
+
+/**
+ * 응답으로부터 갱신된 전체 게임 데이터 계산
+ * (전체 game_data가 오면 그대로, patch가 오면 로컬 데이터 사본에 적용)
+ *
+ * @param {Object} gameData - 요청 시점의 전체 게임 데이터
+ * @param {Object} response - 서버 응답
+ * @returns {Object|null} 갱신된 게임 데이터
+ */
+function resolveGameData(gameData, response) {
+    if (response.game_data) {
+        return response.game_data;
+    }
+    if (!response.patch) {
+        return null;
+    }
+    if (response.base_revision !== getRevision(gameData)) {
+        throw new Error(`revision 불일치: 로컬 ${getRevision(gameData)}, 서버 ${response.base_revision}`);
+    }
+    return applyPatch(JSON.parse(JSON.stringify(gameData)), response.patch);
+}
+
+if (typeof window !== 'undefined') {
+    window.DeltaSync = {
+        sliceFor,
+        applyPatch,
+        buildRequest,
+        resolveGameData,
+        getRevision
+    };
+}
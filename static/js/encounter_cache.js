@@ -2,7 +2,7 @@
 // 정적 데이터를 클라이언트에 캐싱하여 오프라인 지원 및 성능 향상
 
 const ENCOUNTER_CACHE_KEY = 'CalendarAI_EncounterData';
-const ENCOUNTER_CACHE_VERSION = '1.0.0'; // 데이터 업데이트 시 버전 변경
+// 캐시 버전은 서버 응답의 ETag를 사용 (데이터가 바뀌면 서버 ETag가 바뀜)
 const CACHE_DB_NAME = 'CalendarAICacheDB';
 const CACHE_DB_VERSION = 1;
 const CACHE_STORE_NAME = 'static_data';
@@ -96,7 +96,8 @@ class EncounterDataCache {
     }
 
     /**
-     * 캐시에서 조우 데이터 로드
+     * 캐시에서 조우 데이터 레코드 로드
+     * @returns {Promise<Object|null>} { version(ETag), content, cachedAt } 또는 null
      */
     async _loadFromCache() {
         if (window.DebugLogger) {
@@ -109,10 +110,10 @@ class EncounterDataCache {
                 try {
                     const db = await this._openIndexedDB();
                     const cached = await this._getFromIndexedDB(db, ENCOUNTER_CACHE_KEY);
-                    if (cached && cached.version === ENCOUNTER_CACHE_VERSION) {
+                    if (cached && cached.version && cached.content) {
                         if (window.DebugLogger) window.DebugLogger.info('IndexedDB에서 조우 데이터 캐시 로드', { version: cached.version });
                         console.log('✅ IndexedDB에서 조우 데이터 캐시 로드');
-                        return cached.content;
+                        return cached;
                     }
                 } catch (error) {
                     if (window.DebugLogger) window.DebugLogger.warn('IndexedDB 캐시 로드 실패, localStorage로 폴백', error);
@@ -124,15 +125,12 @@ class EncounterDataCache {
             const cached = localStorage.getItem(ENCOUNTER_CACHE_KEY);
             if (cached) {
                 const parsed = JSON.parse(cached);
-                if (parsed.version === ENCOUNTER_CACHE_VERSION) {
+                if (parsed.version && parsed.content) {
                     if (window.DebugLogger) window.DebugLogger.info('localStorage에서 조우 데이터 캐시 로드', { version: parsed.version });
                     console.log('✅ localStorage에서 조우 데이터 캐시 로드');
-                    return parsed.content;
-                } else {
-                    // 버전이 다르면 캐시 무효화
-                    if (window.DebugLogger) window.DebugLogger.warn('캐시 버전 불일치, 캐시 무효화', { cached: parsed.version, expected: ENCOUNTER_CACHE_VERSION });
-                    localStorage.removeItem(ENCOUNTER_CACHE_KEY);
+                    return parsed;
                 }
+                localStorage.removeItem(ENCOUNTER_CACHE_KEY);
             }
         } catch (error) {
             if (window.DebugLogger) window.DebugLogger.error('캐시 로드 실패', error);
@@ -146,9 +144,11 @@ class EncounterDataCache {
     }
 
     /**
-     * 서버에서 조우 데이터 가져오기
+     * 서버에서 조우 데이터 가져오기 (ETag 조건부 요청)
+     * @param {string|null} etag - 캐시된 데이터의 ETag
+     * @returns {Promise<Object>} { notModified: true } 또는 { data, etag }
      */
-    async _loadFromServer() {
+    async _loadFromServer(etag = null) {
         if (window.DebugLogger) {
             window.DebugLogger.logFunctionEntry('_loadFromServer');
             window.DebugLogger.logAPIRequest('GET', '/api/game/encounter-data');
@@ -156,7 +156,12 @@ class EncounterDataCache {
         
         try {
             const requestStartTime = Date.now();
-            const response = await fetch('/api/game/encounter-data');
+            const headers = etag ? { 'If-None-Match': etag } : {};
+            const response = await fetch('/api/game/encounter-data', { headers });
+            if (response.status === 304) {
+                if (window.DebugLogger) window.DebugLogger.info('조우 데이터 변경 없음 (304)', { etag });
+                return { notModified: true };
+            }
             if (!response.ok) {
                 throw new Error(`서버 응답 오류: ${response.status}`);
             }
@@ -171,7 +176,7 @@ class EncounterDataCache {
                 const encounterCount = result.data?.encounters ? Object.keys(result.data.encounters).length : 0;
                 if (window.DebugLogger) window.DebugLogger.info('서버에서 조우 데이터 로드', { encounterCount });
                 console.log('✅ 서버에서 조우 데이터 로드');
-                return result.data;
+                return { data: result.data, etag: response.headers.get('ETag') };
             }
             throw new Error('서버에서 유효한 데이터를 받지 못했습니다.');
         } catch (error) {
@@ -188,13 +193,17 @@ class EncounterDataCache {
     /**
      * 캐시에 조우 데이터 저장
      */
-    async _saveToCache(data) {
+    async _saveToCache(data, etag) {
         if (window.DebugLogger) {
             window.DebugLogger.logFunctionEntry('_saveToCache');
         }
         
+        if (!etag) {
+            // ETag가 없으면 다음 로드 시 재검증할 수 없으므로 캐시하지 않음
+            return;
+        }
         const cacheData = {
-            version: ENCOUNTER_CACHE_VERSION,
+            version: etag,
             content: data,
             cachedAt: new Date().toISOString()
         };
@@ -205,7 +214,7 @@ class EncounterDataCache {
                 try {
                     const db = await this._openIndexedDB();
                     await this._saveToIndexedDB(db, ENCOUNTER_CACHE_KEY, cacheData);
-                    if (window.DebugLogger) window.DebugLogger.info('IndexedDB에 조우 데이터 캐시 저장', { version: ENCOUNTER_CACHE_VERSION });
+                    if (window.DebugLogger) window.DebugLogger.info('IndexedDB에 조우 데이터 캐시 저장', { version: etag });
                     console.log('✅ IndexedDB에 조우 데이터 캐시 저장');
                     return;
                 } catch (error) {
@@ -216,7 +225,7 @@ class EncounterDataCache {
 
             // localStorage 폴백
             localStorage.setItem(ENCOUNTER_CACHE_KEY, JSON.stringify(cacheData));
-            if (window.DebugLogger) window.DebugLogger.info('localStorage에 조우 데이터 캐시 저장', { version: ENCOUNTER_CACHE_VERSION });
+            if (window.DebugLogger) window.DebugLogger.info('localStorage에 조우 데이터 캐시 저장', { version: etag });
             console.log('✅ localStorage에 조우 데이터 캐시 저장');
         } catch (error) {
             if (window.DebugLogger) window.DebugLogger.error('캐시 저장 실패', error);
@@ -229,7 +238,7 @@ class EncounterDataCache {
     }
 
     /**
-     * 조우 데이터 로드 (캐시 우선, 없으면 서버에서 가져와서 캐싱)
+     * 조우 데이터 로드 (캐시된 ETag로 서버에 재검증, 변경 없으면 캐시 사용)
      * @returns {Promise<Object>} 조우 데이터
      */
     async load() {
@@ -238,23 +247,35 @@ class EncounterDataCache {
             window.DebugLogger.logFunctionEntry('load');
         }
         
-        // 1. 캐시에서 확인
+        // 1. 캐시 확인
         const cached = await this._loadFromCache();
-        if (cached) {
+
+        // 2. 서버에 조건부 요청 (오프라인이면 캐시 사용)
+        let result;
+        try {
+            result = await this._loadFromServer(cached ? cached.version : null);
+        } catch (error) {
+            if (cached) {
+                if (window.DebugLogger) window.DebugLogger.warn('서버 요청 실패, 캐시된 조우 데이터 사용', error);
+                console.warn('서버 요청 실패, 캐시된 조우 데이터 사용');
+                return cached.content;
+            }
+            throw error;
+        }
+
+        if (result.notModified && cached) {
             if (window.DebugLogger) {
                 window.DebugLogger.info('조우 데이터 로드 완료 (캐시)', { 
-                    encounterCount: cached?.encounters ? Object.keys(cached.encounters).length : 0 
+                    encounterCount: cached.content?.encounters ? Object.keys(cached.content.encounters).length : 0 
                 });
                 window.DebugLogger.logFunctionExit('load', null, startTime);
             }
-            return cached;
+            return cached.content;
         }
 
-        // 2. 서버에서 가져오기
-        const data = await this._loadFromServer();
-
-        // 3. 캐시에 저장
-        await this._saveToCache(data);
+        // 3. 새 데이터를 ETag와 함께 캐시에 저장
+        const data = result.data;
+        await this._saveToCache(data, result.etag);
 
         if (window.DebugLogger) {
             window.DebugLogger.info('조우 데이터 로드 완료 (서버)', { 
@@ -308,7 +329,7 @@ class EncounterDataCache {
                 try {
                     const db = await this._openIndexedDB();
                     const cached = await this._getFromIndexedDB(db, ENCOUNTER_CACHE_KEY);
-                    if (cached && cached.version === ENCOUNTER_CACHE_VERSION) {
+                    if (cached && cached.version && cached.content) {
                         return {
                             exists: true,
                             version: cached.version,
@@ -324,7 +345,7 @@ class EncounterDataCache {
             const cached = localStorage.getItem(ENCOUNTER_CACHE_KEY);
             if (cached) {
                 const parsed = JSON.parse(cached);
-                if (parsed.version === ENCOUNTER_CACHE_VERSION) {
+                if (parsed.version && parsed.content) {
                     return {
                         exists: true,
                         version: parsed.version,
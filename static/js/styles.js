@@ -1,23 +0,0 @@
-// CSS 스타일을 동적으로 주입
-// 이 파일은 static/css/style.css에서 자동 생성되었습니다.
-(function() {
-    // 이미 주입되었는지 확인
-    if (document.getElementById('injected-styles')) {
-        return;
-    }
-    
-    // <style> 태그 생성 및 CSS 주입
-    const style = document.createElement('style');
-    style.id = 'injected-styles';
-    style.textContent = "* {\n    margin: 0;\n    padding: 0;\n    box-sizing: border-box;\n}\n\n:root {\n    --content-min-width: min(300px, 90vw);\n    --content-max-width: min(800px, 95vw);\n}\n\nbody {\n    font-family: 'Georgia', 'Times New Roman', serif;\n    background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);\n    color: #e0e0e0;\n    min-height: 100vh;\n    padding: 20px;\n}\n\n.container {\n    max-width: 1200px;\n    margin: 0 auto;\n}\n\nheader {\n    text-align: center;\n    margin-bottom: 30px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.5);\n    border-radius: 10px;\n    border: 2px solid #8b4513;\n    min-width: var(--content-min-width);\n    max-width: var(--content-max-width);\n    margin-left: auto;\n    margin-right: auto;\n}\n\nh1 {\n    color: #d4af37;\n    font-size: 2rem;\n    text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.8);\n    margin-bottom: 10px;\n}\n\n.subtitle {\n    color: #c0c0c0;\n    font-style: italic;\n    font-size: 1.2em;\n}\n\n.game-status {\n    display: flex;\n    justify-content: space-around;\n    margin-bottom: 30px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.4);\n    border-radius: 10px;\n    border: 1px solid #444;\n    min-width: var(--content-min-width);\n    max-width: var(--content-max-width);\n    margin-left: auto;\n    margin-right: auto;\n}\n\n.status-item {\n    text-align: center;\n}\n\n.status-item label {\n    display: block;\n    color: #d4af37;\n    margin-bottom: 5px;\n    font-weight: bold;\n}\n\n.status-item span {\n    font-size: 1.2em;\n    color: #fff;\n}\n\n.madness-bar {\n    width: 100px;\n    height: 20px;\n    background: #333;\n    border: 2px solid #8b4513;\n    border-radius: 10px;\n    overflow: hidden;\n    margin: 5px auto;\n    position: relative;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n}\n\n.madness-fill {\n    height: 100%;\n    background: linear-gradient(90deg, #8b0000 0%, #ff0000 100%);\n    width: 0%;\n    transition: width 0.3s;\n    position: absolute;\n    top: 0;\n    left: 0;\n    z-index: 1;\n}\n\n.madness-level {\n    position: absolute;\n    top: 50%;\n    left: 50%;\n    transform: translate(-50%, -50%);\n    font-size: 1em;\n    color: #fff;\n    font-weight: bold;\n    z-index: 2;\n    text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);\n    pointer-events: none;\n}\n\n.prologue-section {\n    background: rgba(0, 0, 0, 0.6);\n    padding: 30px;\n    border-radius: 10px;\n    border: 2px solid #8b4513;\n    margin-bottom: 30px;\n}\n\n.prologue-content {\n    max-width: 800px;\n    margin: 0 auto;\n}\n\n.prologue-content h2 {\n    color: #d4af37;\n    margin-bottom: 20px;\n}\n\n#prologue-text {\n    line-height: 1.8;\n    font-size: 1.1em;\n    margin-bottom: 20px;\n    white-space: pre-line;\n    color: #e0e0e0;\n}\n\n.game-section {\n    background: rgba(0, 0, 0, 0.4);\n    padding: 30px;\n    border-radius: 10px;\n    border: 1px solid #444;\n    margin-bottom: 30px;\n    min-width: var(--content-min-width);\n    max-width: var(--content-max-width);\n    margin-left: auto;\n    margin-right: auto;\n    width: 100%;\n    box-sizing: border-box;\n}\n\n.calendar-month {\n    margin-bottom: 30px;\n}\n\n.calendar-month {\n    width: 100%;\n    overflow: hidden;\n}\n\n.calendar-week {\n    margin-bottom: 30px;\n}\n\n.calendar-week {\n    width: 100%;\n    overflow: hidden;\n}\n\n.week-grid {\n    display: grid;\n    grid-template-columns: repeat(7, minmax(0, 1fr));\n    gap: 3px;\n    margin-top: 15px;\n    width: 100%;\n    box-sizing: border-box;\n}\n\n.day-cell {\n    background: rgba(139, 69, 19, 0.3);\n    border: 2px solid #8b4513;\n    border-radius: 5px;\n    padding: 8px 4px;\n    text-align: center;\n    cursor: pointer;\n    transition: background-color 0.2s, border-color 0.2s;\n    min-width: 0;\n    max-width: 100%;\n    box-sizing: border-box;\n    overflow: hidden;\n    word-wrap: break-word;\n}\n\n.day-cell:hover:not(.other-month) {\n    background: rgba(139, 69, 19, 0.5);\n}\n\n.day-cell.selected {\n    background: rgba(212, 175, 55, 0.5);\n    border-color: #d4af37;\n    border-width: 2px;\n    font-weight: bold;\n    /* transform \uc81c\uac70\ud558\uc5ec \ud06c\uae30 \ubcc0\ud654 \uc5c6\uc74c */\n}\n\n.day-cell.other-month {\n    opacity: 0.4;\n    cursor: not-allowed;\n    background: rgba(139, 69, 19, 0.1);\n}\n\n.day-label {\n    font-size: 1.2em;\n    color: #d4af37;\n    margin-bottom: 4px;\n    font-weight: bold;\n    white-space: nowrap;\n}\n\n.day-date {\n    font-size: 1.2em;\n    color: #e0e0e0;\n    white-space: nowrap;\n    overflow: hidden;\n    text-overflow: ellipsis;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    gap: 0px;\n}\n\n.day-cell.selected .day-label {\n    color: #ffd700;\n}\n\n.day-cell.selected .day-date {\n    color: #ffd700;\n    font-weight: bold;\n}\n\n.day-cell.completed {\n    opacity: 0.5;\n    background: rgba(139, 69, 19, 0.2);\n    border-color: #666;\n    cursor: not-allowed;\n    position: relative;\n}\n\n.day-cell.completed::after {\n    content: '\u2713';\n    position: absolute;\n    top: 2px;\n    right: 4px;\n    color: #90ee90;\n    font-size: 0.9em;\n    font-weight: bold;\n}\n\n/* \uc77c\uc694\uc77c \uc2a4\ud0c0\uc77c */\n.day-cell.sunday {\n    background: rgba(139, 0, 0, 0.4) !important;\n    border-color: #8b0000 !important;\n}\n\n.day-cell.sunday .day-label {\n    color: #ff6b6b !important;\n}\n\n.day-cell.sunday .day-date {\n    color: #ff6b6b !important;\n}\n\n.day-cell.sunday:hover:not(.other-month) {\n    background: rgba(139, 0, 0, 0.6) !important;\n}\n\n.day-cell.sunday.selected {\n    background: rgba(255, 107, 107, 0.5) !important;\n    border-color: #ff6b6b !important;\n}\n\n.day-cell.disabled-by-dice {\n    opacity: 0.4;\n    filter: grayscale(0.5);\n    cursor: not-allowed !important;\n}\n\n.day-cell.disabled-by-dice:hover {\n    background: rgba(0, 0, 0, 0.3) !important;\n    border-color: #444 !important;\n}\n\n.day-cell.disabled-by-outcome {\n    opacity: 0.4;\n    filter: grayscale(0.5);\n    cursor: not-allowed !important;\n}\n\n.day-cell.disabled-by-outcome:hover {\n    background: rgba(0, 0, 0, 0.3) !important;\n    border-color: #444 !important;\n}\n\n/* \uc6d4\uac04 \ub2ec\ub825 \uc2a4\ud0c0\uc77c */\n.month-grid {\n    display: grid;\n    grid-template-columns: repeat(7, minmax(0, 1fr));\n    gap: 4px;\n    margin-top: 15px;\n    width: 100%;\n    box-sizing: border-box;\n    position: relative;\n}\n\n.month-header-cell {\n    background: transparent;\n    border: none;\n    padding: 8px 4px;\n    text-align: center;\n    font-weight: bold;\n    color: #d4af37;\n    font-size: 1.4em;\n}\n\n.month-header-cell.sunday-header {\n    background: transparent;\n    border: none;\n    color: #ff6b6b;\n}\n\n/* \uc77c\uc694\uc77c \ub09c\uc774\ub3c4 \uac10\uc18c \uc2dc \ucd08\ub85d\uc0c9 \ud45c\uc2dc */\n.difficulty-value.sunday-reduced-difficulty {\n    color: #4ade80 !important;\n    font-weight: bold;\n}\n\n.month-day-cell {\n    background: rgba(139, 69, 19, 0.3);\n    border: 2px solid #8b4513;\n    border-radius: 5px;\n    padding: 6px 4px;\n    text-align: center;\n    cursor: pointer;\n    transition: background-color 0.2s, border-color 0.2s;\n    min-height: 45px;\n    display: flex;\n    flex-direction: column;\n    justify-content: center;\n    align-items: center;\n    box-sizing: border-box;\n}\n\n/* \ud604\uc7ac \ub0a0\uc9dc \uc624\ubc84\ub808\uc774 */\n.today-date-overlay {\n    position: absolute;\n    top: 0;\n    left: 0;\n    right: 0;\n    bottom: 0;\n    border: 3px solid #4ade80;\n    border-radius: 5px;\n    pointer-events: none;\n    z-index: 10;\n    box-sizing: border-box;\n}\n\n.month-day-cell.empty {\n    background: transparent;\n    border: none;\n    cursor: default;\n}\n\n.month-day-cell:hover:not(.empty):not(.completed) {\n    background: rgba(139, 69, 19, 0.5);\n}\n\n.month-day-cell.sunday {\n    background: rgba(139, 0, 0, 0.4) !important;\n    border-color: #8b0000 !important;\n}\n\n.month-day-cell.sunday:hover:not(.empty):not(.completed) {\n    background: rgba(139, 0, 0, 0.6) !important;\n}\n\n.month-day-cell.completed {\n    opacity: 0.5;\n    background: rgba(139, 69, 19, 0.2);\n    border-color: #666;\n    cursor: not-allowed;\n    position: relative;\n}\n\n.month-day-cell.completed::after {\n    content: '\u2713';\n    position: absolute;\n    top: 2px;\n    right: 4px;\n    color: #90ee90;\n    font-size: 0.9em;\n    font-weight: bold;\n}\n\n.day-number {\n    font-size: 1.3em;\n    color: #e0e0e0;\n    font-weight: bold;\n    margin-top: -1px;\n    margin-bottom: 4px;\n}\n\n.month-day-cell.sunday .day-number {\n    color: #ff6b6b !important;\n}\n\n.day-date-label {\n    font-size: 1em;\n    color: #d4af37;\n    white-space: nowrap;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    gap: 1px;\n}\n\n.month-day-cell.sunday .day-date-label {\n    color: #ff6b6b !important;\n}\n\n.action-icon {\n    display: inline-flex;\n    align-items: center;\n    justify-content: center;\n}\n\n.action-icon i,\n.action-icon svg {\n    width: 18px;\n    height: 18px;\n    color: inherit;\n}\n\n.difficulty-value {\n    font-weight: bold;\n    color: inherit;\n}\n\n.month-day-cell.selected {\n    background: rgba(212, 175, 55, 0.5) !important;\n    border-color: #d4af37 !important;\n    border-width: 2px;\n    font-weight: bold;\n}\n\n.month-day-cell.sunday.selected {\n    background: rgba(255, 107, 107, 0.5) !important;\n    border-color: #ff6b6b !important;\n}\n\n.encounter-selection,\n.dice-section {\n    margin-bottom: 30px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.3);\n    border-radius: 5px;\n    text-align: center;\n}\n\n.dice-section h2 {\n    margin-bottom: 20px; /* \uc6d0\ud558\ub294 \uac04\uaca9\uc73c\ub85c \uc870\uc815 */\n    text-align: left;\n}\n\n.form-group {\n    margin-bottom: 15px;\n}\n\n.form-group label {\n    display: block;\n    color: #d4af37;\n    margin-bottom: 5px;\n    font-weight: bold;\n}\n\n.form-group input,\n.form-group select {\n    width: 100%;\n    padding: 10px;\n    background: #2d2d2d;\n    border: 1px solid #8b4513;\n    border-radius: 5px;\n    color: #e0e0e0;\n    font-size: 1em;\n}\n\n.dice-controls {\n    display: grid;\n    grid-template-columns: 1fr 1fr 2fr;\n    gap: 20px;\n    margin-top: 10px;\n    margin-bottom: 20px;\n}\n\n@media (max-width: 768px) {\n    .dice-controls {\n        grid-template-columns: 1fr 1fr 2fr;\n        gap: 10px;\n    }\n}\n\n@media (max-width: 480px) {\n    .dice-controls {\n        grid-template-columns: 1fr 1fr 1.5fr;\n        gap: 8px;\n    }\n}\n\n.dice-group {\n    padding: 0px;\n    background: rgba(0, 0, 0, 0);\n    border-radius: 5px;\n    min-width: 0;\n}\n\n.dice-group label {\n    display: block;\n    margin-bottom: 10px;\n    text-align: center;  \n}\n\n.slider-container {\n    margin: 0px 0;\n}\n\n.wheel-picker {\n    display: flex;\n    flex-direction: column;\n    align-items: center;\n    justify-content: center; \n    gap: 0px;\n    margin: 10px 0;\n}\n\n.wheel-picker-wrapper {\n    position: relative;\n    width: 50%;\n    height: 70px;\n    overflow: hidden;\n    background: transparent;\n    border: none;\n    border-radius: 8px;\n    cursor: grab;\n    user-select: none;\n    -webkit-user-select: none;\n    -moz-user-select: none;\n}\n\n.wheel-picker-wrapper:active {\n    cursor: grabbing;\n}\n\n.wheel-picker-items {\n    position: relative;\n    padding: 15px 10px;\n    transition: transform 0.2s ease-out;\n}\n\n.wheel-picker-item {\n    height: 35px;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    font-size: 1.5em;\n    font-weight: bold;\n    color: rgba(102, 187, 106, 0.4);\n    transition: color 0.2s, font-size 0.2s;\n    pointer-events: none;\n}\n\n.wheel-picker-item.selected {\n    color: #66bb6a;\n    font-size: 1.8em;\n}\n\n.wheel-picker-selection {\n    position: absolute;\n    top: 50%;\n    left: 0;\n    right: 0;\n    height: 35px;\n    transform: translateY(-50%);\n    border: none;\n    pointer-events: none;\n    background: transparent;\n}\n\n.wheel-picker input[type=\"number\"] {\n    width: 80px;\n    height: 35px;\n    text-align: center;\n    font-size: 1.2em;\n    font-weight: bold;\n    color: #66bb6a;\n    background: rgba(76, 175, 80, 0.2);\n    border: 2px solid #66bb6a;\n    border-radius: 8px;\n    outline: none;\n    -moz-appearance: textfield;\n    appearance: textfield;\n    cursor: default;\n}\n\n.wheel-picker input[type=\"number\"]::-webkit-outer-spin-button,\n.wheel-picker input[type=\"number\"]::-webkit-inner-spin-button {\n    -webkit-appearance: none;\n    margin: 0;\n}\n\n.wheel-picker input[type=\"number\"]:focus {\n    border-color: #4caf50;\n    box-shadow: 0 0 10px rgba(76, 175, 80, 0.5);\n}\n\n.green-dice-icons {\n    display: grid;\n    grid-template-columns: 1fr 1fr 1fr; \n    gap: 10px;\n    justify-items: center;\n    align-items: center;\n}\n\n@media (max-width: 768px) {\n    .green-dice-icons {\n        gap: 6px;\n    }\n}\n\n@media (max-width: 480px) {\n    .green-dice-icons {\n        gap: 4px;\n    }\n}\n\n.icon-button {\n    background: rgba(0,0,0,0);\n    border: 0px;\n    border-radius: 8px;\n    padding: 5px;\n    cursor: pointer;\n    transition: all 0.3s;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    min-width: 50px;\n    min-height: 50px;\n}\n\n.icon-button:hover {\n    background: rgba(76, 175, 80, 0.2);\n    border-color: #66bb6a;\n    transform: translateY(-2px);\n}\n\n.icon-button.selected {\n    background: rgba(76, 175, 80, 0.4);\n    border-color: #4caf50;\n    border-width: 3px;\n    box-shadow: 0 0 10px rgba(76, 175, 80, 0.5);\n}\n\n.icon-container {\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    width: 50px;\n    height: 50px;\n    color: #66bb6a;\n}\n\n.icon-button.selected .icon-container {\n    color: #4caf50;\n}\n\n.icon-container svg {\n    width: 45px;\n    height: 45px;\n}\n\n.icon-container.cthulhu-icon {\n    width: 45px;\n    height: 45px;\n}\n\n.icon-container.cthulhu-icon svg {\n    width: 45px;\n    height: 45px;\n}\n\n.cthulhu-button-container {\n    display: flex;\n    justify-content: center;\n    align-items: center;\n}\n\n.cthulhu-button {\n    background: rgba(0, 0, 0, 0);\n    border: 0px;\n    border-radius: 8px;\n    padding: 7px;\n    cursor: pointer;\n    transition: all 0.3s;\n    display: flex;\n    flex-direction: column;\n    align-items: center;\n    justify-content: center;\n    min-width: 45px;\n    min-height: 45px;\n    position: relative;\n}\n\n.cthulhu-button:hover {\n    background: rgba(76, 175, 80, 0.2);\n}\n\n.cthulhu-icon {\n    width: 45px;\n    height: 45px;\n    color: #66bb6a;\n}\n\n.cthulhu-count-display {\n    position: absolute;\n    top: 50%;\n    left: 50%;\n    transform: translate(-48%, -85%);\n    font-weight: bold;    \n    font-size: calc(2em);\n    color: #182C19;\n    font-family: 'Georgia', 'Times New Roman', serif;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n    pointer-events: none;\n    z-index: 1;\n}\n\n.btn {\n    padding: 12px 30px;\n    background: #8b4513;\n    color: #fff;\n    border: none;\n    border-radius: 5px;\n    font-size: 1.1em;\n    cursor: pointer;\n    transition: all 0.3s;\n    font-family: inherit;\n}\n\n.btn:hover {\n    background: #a0522d;\n    transform: translateY(-2px);\n}\n\n.btn-primary {\n    background: #d4af37;\n    color: #1a1a1a;\n    display: flex;\n    align-items: center;\n    justify-content: center;\n}\n\n.btn-primary:hover {\n    background: #f4d03f;\n}\n\n.btn-danger {\n    background: #8b0000;\n    color: #fff;\n    border: 2px solid #8b0000;\n}\n\n.btn-danger:hover {\n    background: #a00000;\n    border-color: #a00000;\n}\n\n#roll-dice-btn {\n    display: inline-block;\n    margin: 0 auto;\n}\n\n.story-section {\n    margin-top: 30px;\n    padding: 30px;\n    background: rgba(0, 0, 0, 0.5);\n    border-radius: 10px;\n    border: 2px solid #8b4513;\n}\n\n/* \uc77c\ubc18 \ud0dc\uadf8 \uc2a4\ud0c0\uc77c */\n.entry-tags {\n    display: flex;\n    gap: 10px;\n    flex-wrap: wrap;\n    align-items: center;\n}\n\n.tag {\n    display: flex;\n    align-items: center;\n    border-radius: 3px;\n    padding: 0px 0px;\n    font-size: 1.5em;\n}\n\n.tag.success {\n    background: #2f3458;\n    color: #9290ee;\n    padding: 5px 10px;\n    font-size: 1rem;\n    order: 2; /* \uc131\uacf5/\uc2e4\ud328 \ud0dc\uadf8 \uc704\uce58 */\n}\n\n.tag.failure {\n    background: rgba(0, 128, 0, 0.3);\n    color: #66ff66;\n    padding: 5px 10px;\n    font-size: 0.9rem;\n    order: 2; /* \uc131\uacf5/\uc2e4\ud328 \ud0dc\uadf8 \uc704\uce58 */\n}\n\n.tag.cthulhu-tag {\n    order: 3; /* \uc131\uacf5/\uc2e4\ud328 \ud0dc\uadf8 \uc624\ub978\ucabd\uc5d0 \ubc30\uce58 */\n}\n\n.tag-icon {\n    display: inline-flex;\n    align-items: center;\n    width: 20px;\n    height: 20px;\n}\n\n.tag-icon svg {\n    width: 20px;\n    height: 20px;\n}\n\n.cthulhu-icon-small {\n    display: inline-flex;\n    align-items: center;\n    width: 20px;\n    height: 20px;\n    color: #66bb6a;\n}\n\n.cthulhu-icon-small svg {\n    width: 20px;\n    height: 20px;\n}\n\n/* \uc2a4\ud1a0\ub9ac \uc139\uc158 \uc804\uc6a9 \ud0dc\uadf8 \uc2a4\ud0c0\uc77c */\n.story-section .entry-tags {\n    display: flex;\n    gap: 5px;\n    margin-bottom: 15px;\n    padding-bottom: 10px;\n    border-bottom: 1px solid #444;\n    flex-wrap: wrap;\n    align-items: center;\n}\n\n.story-section .entry-tags .tag {\n    font-size: 1.2em;\n}\n\n.story-section .entry-tags .tag-icon {\n    display: inline-flex;\n    align-items: center;\n    width: 20px;\n    height: 20px;\n}\n\n.story-section .entry-tags .tag-icon svg {\n    width: 20px;\n    height: 20px;\n}\n\n.story-section .entry-tags .cthulhu-icon-small {\n    display: inline-flex;\n    align-items: center;\n    width: 20px;\n    height: 20px;\n    color: #66bb6a;\n}\n\n.story-section .entry-tags .cthulhu-icon-small svg {\n    width: 20px;\n    height: 20px;\n}\n\n.story-content {\n    line-height: 1.8;\n    font-size: 1.1em;\n    margin-bottom: 20px;\n    white-space: pre-line;\n    color: #e0e0e0;\n    min-height: 100px;\n}\n\n\n.story-summary p {\n    margin-bottom: 1em;\n}\n\n.story-summary strong {\n    color: #fff;\n    font-weight: bold;\n    font-style: normal;\n}\n\n.story-summary em {\n    font-style: italic;\n    color: #d4af37;\n}\n\n.story-summary h1,\n.story-summary h2,\n.story-summary h3 {\n    color: #d4af37;\n    margin-top: 1em;\n    margin-bottom: 0.5em;\n    font-style: normal;\n}\n\n.main-nav {\n    display: flex;\n    justify-content: center;\n    gap: 30px;\n    margin-top: 30px;\n    padding: 0px;\n    background: rgba(0, 0, 0, 0.4);\n    border-radius: 10px;\n}\n\n.nav-link {\n    padding: 5px 10px;\n    color: #d4af37;\n    text-decoration: none;\n    border: 0px;\n    border-radius: 5px;\n    transition: all 0.3s;\n}\n\n.nav-link:hover,\n.nav-link.active {\n    background: #8b4513;\n    color: #fff;\n}\n\n.loading {\n    display: none;\n    text-align: center;\n    padding: 20px;\n    color: #d4af37;\n    font-style: italic;\n}\n\n.loading.active {\n    display: block;\n}\n\n.error {\n    background: rgba(139, 0, 0, 0.3);\n    border: 2px solid #8b0000;\n    padding: 15px;\n    border-radius: 5px;\n    color: #ff6b6b;\n    margin: 20px 0;\n}\n\n.landing-options {\n    max-width: 1200px;\n    display: flex;\n    flex-direction: column;\n    gap: 1.5rem;\n    margin-top: 2rem;\n}\n\n.option-card {\n    background: rgba(0, 0, 0, 0.4);\n    border: 2px solid #8b4513;\n    border-radius: 10px;\n    padding: 2rem;\n    cursor: pointer;\n    transition: all 0.3s ease;\n}\n\n.option-card:hover {\n    border-color: #d4af37;\n    box-shadow: 0 4px 12px rgba(212, 175, 55, 0.3);\n    transform: translateY(-2px);\n    background: rgba(0, 0, 0, 0.6);\n}\n\n.option-card h2 {\n    margin-top: 0;\n    color: #d4af37;\n    text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);\n}\n\n.option-card p {\n    color: #e0e0e0;\n    margin-bottom: 0;\n}\n\n.year-selection {\n    display: none;\n    margin-top: 2rem;\n}\n\n.year-selection.active {\n    display: block;\n}\n\n.year-selection h2 {\n    color: #d4af37;\n    margin-bottom: 1.5rem;\n    text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);\n}\n\n.year-options {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));\n    gap: 1.5rem;\n    margin-top: 1.5rem;\n}\n\n.year-card {\n    background: rgba(0, 0, 0, 0.4);\n    border: 2px solid #8b4513;\n    border-radius: 10px;\n    padding: 1.5rem;\n    cursor: pointer;\n    transition: all 0.3s ease;\n}\n\n.year-card:hover {\n    border-color: #d4af37;\n    box-shadow: 0 4px 12px rgba(212, 175, 55, 0.3);\n    transform: translateY(-2px);\n    background: rgba(0, 0, 0, 0.6);\n}\n\n.year-card h3 {\n    margin-top: 0;\n    color: #d4af37;\n    text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);\n}\n\n.year-card .year-description {\n    color: #c0c0c0;\n    font-style: italic;\n    margin-bottom: 1rem;\n}\n\n.year-card .year-details {\n    color: #e0e0e0;\n    text-align: left;\n    line-height: 1.6;\n}\n\n.btn-back {\n    margin-top: 2rem;\n    padding: 10px 20px;\n    background: rgba(139, 69, 19, 0.5);\n    border: 2px solid #8b4513;\n    border-radius: 5px;\n    color: #d4af37;\n    cursor: pointer;\n    transition: all 0.3s ease;\n}\n\n.btn-back:hover {\n    background: rgba(139, 69, 19, 0.7);\n    border-color: #d4af37;\n}\n\n/* Diary \ud398\uc774\uc9c0 \uc2a4\ud0c0\uc77c */\n.diary-container {\n    max-width: 1200px;\n    margin: 0 auto;\n    padding: 20px;\n}\n\n.month-tabs {\n    display: flex;\n    flex-wrap: wrap;\n    gap: 10px;\n    margin-bottom: 20px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.4);\n    border-radius: 10px;\n    border: 1px solid #444;\n}\n\n.month-tab {\n    padding: 10px 20px;\n    background: rgba(139, 69, 19, 0.3);\n    border: 2px solid #8b4513;\n    border-radius: 5px;\n    color: #d4af37;\n    cursor: pointer;\n    transition: all 0.3s ease;\n}\n\n.month-tab:hover {\n    background: rgba(139, 69, 19, 0.5);\n    border-color: #d4af37;\n}\n\n.month-tab.active {\n    background: rgba(139, 69, 19, 0.7);\n    border-color: #d4af37;\n    color: #fff;\n}\n\n.chapter-summary {\n    margin-bottom: 20px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.4);\n    border-radius: 10px;\n    border: 1px solid #444;\n}\n\n.month-conclusion-section {\n    margin-bottom: 20px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.4);\n    border-radius: 10px;\n    border: 1px solid #444;\n    text-align: center;\n}\n\n.conclusion-button {\n    padding: 10px 20px;\n    background: rgba(139, 69, 19, 0.5);\n    border: 2px solid #8b4513;\n    border-radius: 5px;\n    color: #d4af37;\n    cursor: pointer;\n    transition: all 0.3s ease;\n    font-size: 1.1em;\n}\n\n.conclusion-button:hover {\n    background: rgba(139, 69, 19, 0.7);\n    border-color: #d4af37;\n}\n\n.conclusion-result {\n    margin-top: 20px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.6);\n    border-radius: 5px;\n    border: 1px solid #8b4513;\n}\n\n.diary-entries {\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.4);\n    border-radius: 10px;\n    border: 1px solid #444;\n}\n\n.diary-entry {\n    margin-bottom: 30px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.3);\n    border-radius: 5px;\n}\n\n.diary-entry h3 {\n    color: #d4af37;\n    margin-bottom: 10px;\n}\n\n.diary-entry .entry-header {\n    display: flex;\n    justify-content: space-between;\n    align-items: flex-start;\n    margin-bottom: 15px;\n    padding-bottom: 10px;\n    border-bottom: 1px solid rgba(139, 69, 19, 0.3);\n    flex-wrap: wrap;\n    gap: 10px;\n}\n\n.diary-entry .entry-date {\n    color: #d4af37;\n    font-size: 1.1em;\n    font-weight: bold;\n    font-style: normal;\n    margin-bottom: 0;\n}\n\n.diary-entry .entry-tags {\n    display: flex;\n    gap: 8px;\n    flex-wrap: wrap;\n    align-items: center;\n}\n\n.diary-entry .entry-content {\n    color: #e0e0e0;\n    line-height: 1.8;\n    white-space: pre-wrap;\n    margin-top: 15px;\n}\n\n.diary-entry .entry-content p {\n    margin-bottom: 1em;\n}\n\n.diary-entry .entry-content strong {\n    color: #fff;\n    font-weight: bold;\n    font-style: normal;\n}\n\n.diary-entry .entry-content em {\n    font-style: italic;\n    color: #d4af37;\n}\n\n.diary-entry .entry-content h1,\n.diary-entry .entry-content h2,\n.diary-entry .entry-content h3 {\n    color: #d4af37;\n    margin-top: 1em;\n    margin-bottom: 0.5em;\n    font-style: normal;\n}\n\n/* \uc2ac\ub86f \uc120\ud0dd \ubaa8\ub2ec \uc2a4\ud0c0\uc77c */\n.modal {\n    position: fixed;\n    z-index: 1000;\n    left: 0;\n    top: 0;\n    width: 100%;\n    height: 100%;\n    background-color: rgba(0, 0, 0, 0.7);\n    display: flex;\n    justify-content: center;\n    align-items: center;\n}\n\n.modal-content {\n    background-color: #1a1a1a;\n    border: 2px solid #8b4513;\n    border-radius: 10px;\n    padding: 30px;\n    max-width: 600px;\n    width: 90%;\n    max-height: 80vh;\n    overflow-y: auto;\n    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.8);\n}\n\n.modal-header {\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    margin-bottom: 20px;\n    padding-bottom: 15px;\n    border-bottom: 2px solid #8b4513;\n}\n\n.modal-header h2 {\n    color: #d4af37;\n    margin: 0;\n    font-size: 1.8em;\n}\n\n.modal-close {\n    background: none;\n    border: none;\n    color: #fff;\n    font-size: 32px;\n    cursor: pointer;\n    padding: 0;\n    width: 35px;\n    height: 35px;\n    line-height: 35px;\n    text-align: center;\n    transition: color 0.3s ease;\n}\n\n.modal-close:hover {\n    color: #d4af37;\n}\n\n.modal-body {\n    padding: 10px 0;\n}\n\n.slot-list {\n    display: flex;\n    flex-direction: column;\n    gap: 15px;\n}\n\n.slot-card {\n    background-color: rgba(0, 0, 0, 0.4);\n    border: 1px solid #444;\n    border-radius: 8px;\n    padding: 20px;\n    display: flex;\n    justify-content: space-between;\n    align-items: center;\n    transition: all 0.3s ease;\n}\n\n.slot-card:hover {\n    border-color: #8b4513;\n    background-color: rgba(0, 0, 0, 0.6);\n}\n\n.slot-info {\n    flex: 1;\n}\n\n.slot-info h3 {\n    margin: 0 0 8px 0;\n    color: #d4af37;\n    font-size: 1.3em;\n}\n\n.slot-date {\n    margin: 0;\n    color: #aaa;\n    font-size: 0.9em;\n    font-style: italic;\n}\n\n.slot-actions {\n    display: flex;\n    gap: 10px;\n    margin-left: 20px;\n}\n\n.slot-actions .btn {\n    padding: 8px 16px;\n    font-size: 0.9em;\n    white-space: nowrap;\n}\n\n.no-slots {\n    text-align: center;\n    padding: 40px 20px;\n    color: #aaa;\n}\n\n.no-slots p {\n    font-size: 1.1em;\n    margin: 0;\n}\n\n/* Report \ud398\uc774\uc9c0 \ud1b5\uacc4 \uc2a4\ud0c0\uc77c */\n.statistics-section {\n    margin-bottom: 30px;\n    padding: 20px;\n    background: rgba(0, 0, 0, 0.4);\n    border-radius: 10px;\n    border: 1px solid #444;\n    min-width: var(--content-min-width);\n    max-width: var(--content-max-width);\n    margin-left: auto;\n    margin-right: auto;\n}\n\n.statistics-section h2 {\n    color: #d4af37;\n    margin-bottom: 20px;\n    text-align: center;\n    font-size: 1.8em;\n    text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);\n}\n\n.stat-grid {\n    display: grid;\n    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));\n    gap: 15px;\n    margin-top: 20px;\n}\n\n.stat-item {\n    background: rgba(0, 0, 0, 0.3);\n    border: 1px solid #8b4513;\n    border-radius: 8px;\n    padding: 15px;\n    text-align: center;\n    transition: all 0.3s ease;\n}\n\n.stat-item:hover {\n    background: rgba(0, 0, 0, 0.5);\n    border-color: #d4af37;\n    transform: translateY(-2px);\n    box-shadow: 0 4px 8px rgba(212, 175, 55, 0.2);\n}\n\n.stat-label {\n    display: block;\n    color: #d4af37;\n    font-size: 0.9em;\n    font-weight: bold;\n    margin-bottom: 8px;\n    text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);\n}\n\n.stat-value {\n    display: block;\n    color: #fff;\n    font-size: 1.4em;\n    font-weight: bold;\n    text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);\n}\n\n/* game-section \ubc18\uc751\ud615 \uc2a4\ud0c0\uc77c */\n@media (max-width: 1024px) {\n    .game-section {\n        padding: 20px;\n    }\n    \n    .day-label {\n        font-size: 1em;\n    }\n    \n    .day-date {\n        font-size: 1em;\n    }\n    \n    .month-header-cell {\n        font-size: 1.2em;\n        padding: 6px 2px;\n    }\n    \n    .day-number {\n        font-size: 1.1em;\n    }\n    \n    .day-date-label {\n        font-size: 0.9em;\n    }\n}\n\n@media (max-width: 768px) {\n    .game-section {\n        padding: 15px;\n    }\n    \n    .calendar-month,\n    .calendar-week {\n        margin-bottom: 20px;\n    }\n    \n    .week-grid,\n    .month-grid {\n        gap: 2px;\n    }\n    \n    .day-cell {\n        padding: 6px 2px;\n    }\n    \n    .month-day-cell {\n        padding: 4px 2px;\n        min-height: 40px;\n    }\n    \n    .day-label {\n        font-size: 0.9em;\n    }\n    \n    .day-date {\n        font-size: 0.9em;\n    }\n    \n    .month-header-cell {\n        font-size: 1em;\n        padding: 5px 2px;\n    }\n    \n    .day-number {\n        font-size: 1em;\n        margin-bottom: 2px;\n    }\n    \n    .day-date-label {\n        font-size: 0.8em;\n    }\n    \n    .encounter-selection,\n    .dice-section {\n        padding: 15px;\n        margin-bottom: 20px;\n    }\n    \n    .dice-section h2 {\n        font-size: 1.3em;\n        margin-bottom: 15px;\n    }\n    \n    .form-group {\n        margin-bottom: 12px;\n    }\n    \n    .form-group label {\n        font-size: 0.9em;\n    }\n    \n    .form-group input,\n    .form-group select {\n        padding: 8px;\n        font-size: 0.9em;\n    }\n    \n    .icon-button {\n        min-width: 40px;\n        min-height: 40px;\n        padding: 3px;\n    }\n    \n    .icon-container {\n        width: 40px;\n        height: 40px;\n    }\n    \n    .icon-container svg {\n        width: 35px;\n        height: 35px;\n    }\n    \n    .icon-container.cthulhu-icon,\n    .icon-container.cthulhu-icon svg {\n        width: 35px;\n        height: 35px;\n    }\n    \n    .cthulhu-button {\n        min-width: 40px;\n        min-height: 40px;\n    }\n    \n    .cthulhu-icon {\n        width: 40px;\n        height: 40px;\n    }\n    \n    .cthulhu-count-display {\n        font-size: calc(1.8em);\n    }\n    \n    .btn {\n        padding: 10px 20px;\n        font-size: 1em;\n    }\n}\n\n@media (max-width: 480px) {\n    .game-section {\n        padding: 10px;\n    }\n    \n    body {\n        padding: 10px;\n    }\n    \n    .week-grid,\n    .month-grid {\n        gap: 1px;\n    }\n    \n    .day-cell {\n        padding: 4px 1px;\n    }\n    \n    .month-day-cell {\n        padding: 3px 1px;\n        min-height: 35px;\n    }\n    \n    .day-label {\n        font-size: 0.8em;\n        margin-bottom: 2px;\n    }\n    \n    .day-date {\n        font-size: 0.8em;\n    }\n    \n    .month-header-cell {\n        font-size: 0.9em;\n        padding: 4px 1px;\n    }\n    \n    .day-number {\n        font-size: 0.9em;\n        margin-bottom: 1px;\n    }\n    \n    .day-date-label {\n        font-size: 0.75em;\n    }\n    \n    .action-icon i,\n    .action-icon svg {\n        width: 14px;\n        height: 14px;\n    }\n    \n    .encounter-selection,\n    .dice-section {\n        padding: 10px;\n        margin-bottom: 15px;\n    }\n    \n    .dice-section h2 {\n        font-size: 1.1em;\n        margin-bottom: 12px;\n    }\n    \n    .form-group {\n        margin-bottom: 10px;\n    }\n    \n    .form-group label {\n        font-size: 0.85em;\n        margin-bottom: 4px;\n    }\n    \n    .form-group input,\n    .form-group select {\n        padding: 6px;\n        font-size: 0.85em;\n    }\n    \n    .icon-button {\n        min-width: 35px;\n        min-height: 35px;\n        padding: 2px;\n    }\n    \n    .icon-container {\n        width: 35px;\n        height: 35px;\n    }\n    \n    .icon-container svg {\n        width: 30px;\n        height: 30px;\n    }\n    \n    .icon-container.cthulhu-icon,\n    .icon-container.cthulhu-icon svg {\n        width: 30px;\n        height: 30px;\n    }\n    \n    .cthulhu-button {\n        min-width: 35px;\n        min-height: 35px;\n        padding: 5px;\n    }\n    \n    .cthulhu-icon {\n        width: 35px;\n        height: 35px;\n    }\n    \n    .cthulhu-count-display {\n        font-size: calc(1.5em);\n    }\n    \n    .btn {\n        padding: 8px 16px;\n        font-size: 0.9em;\n    }\n    \n    .story-section {\n        padding: 15px;\n        margin-top: 20px;\n    }\n    \n    .story-content {\n        font-size: 1em;\n        line-height: 1.6;\n    }\n}\n\n/* \ucd08\uace0\ud574\uc0c1\ub3c4 \ubc0f \ub9e4\uc6b0 \uc791\uc740 \ud654\uba74 \ub300\uc751 */\n@media (max-width: 360px) {\n    .game-section {\n        padding: 8px;\n    }\n    \n    .day-cell,\n    .month-day-cell {\n        padding: 2px;\n    }\n    \n    .month-day-cell {\n        min-height: 30px;\n    }\n    \n    .day-label,\n    .day-date {\n        font-size: 0.75em;\n    }\n    \n    .month-header-cell {\n        font-size: 0.8em;\n    }\n    \n    .day-number {\n        font-size: 0.85em;\n    }\n    \n    .day-date-label {\n        font-size: 0.7em;\n    }\n}\n\n/* \uac00\ub85c \ubaa8\ub4dc (landscape) \ub300\uc751 */\n@media (max-height: 500px) and (orientation: landscape) {\n    .game-section {\n        padding: 15px;\n    }\n    \n    .calendar-month,\n    .calendar-week {\n        margin-bottom: 15px;\n    }\n    \n    .month-day-cell {\n        min-height: 30px;\n        padding: 2px;\n    }\n    \n    .day-number {\n        font-size: 0.9em;\n        margin-bottom: 1px;\n    }\n    \n    .day-date-label {\n        font-size: 0.75em;\n    }\n}\n\n/* \ubaa8\ub2ec \ubc18\uc751\ud615 \uc2a4\ud0c0\uc77c */\n@media (max-width: 768px) {\n    .modal-content {\n        padding: 20px;\n        width: 95%;\n    }\n    \n    .modal-header h2 {\n        font-size: 1.5em;\n    }\n    \n    .modal-close {\n        font-size: 28px;\n        width: 30px;\n        height: 30px;\n        line-height: 30px;\n    }\n    \n    .slot-card {\n        flex-direction: column;\n        align-items: flex-start;\n        padding: 15px;\n    }\n    \n    .slot-info {\n        width: 100%;\n        margin-bottom: 15px;\n    }\n    \n    .slot-info h3 {\n        font-size: 1.1em;\n    }\n    \n    .slot-date {\n        font-size: 0.85em;\n    }\n    \n    .slot-actions {\n        flex-direction: column;\n        width: 100%;\n        margin-left: 0;\n        gap: 8px;\n    }\n    \n    .slot-actions .btn {\n        width: 100%;\n        padding: 10px;\n        font-size: 0.9em;\n    }\n    \n    .no-slots {\n        padding: 30px 15px;\n    }\n    \n    .no-slots p {\n        font-size: 1em;\n    }\n}\n\n@media (max-width: 480px) {\n    .modal-content {\n        padding: 15px;\n        width: 98%;\n    }\n    \n    .modal-header {\n        margin-bottom: 15px;\n        padding-bottom: 10px;\n    }\n    \n    .modal-header h2 {\n        font-size: 1.3em;\n    }\n    \n    .modal-close {\n        font-size: 24px;\n        width: 28px;\n        height: 28px;\n        line-height: 28px;\n    }\n    \n    .modal-body {\n        padding: 5px 0;\n    }\n    \n    .slot-list {\n        gap: 12px;\n    }\n    \n    .slot-card {\n        padding: 12px;\n    }\n    \n    .slot-info h3 {\n        font-size: 1em;\n        margin-bottom: 6px;\n    }\n    \n    .slot-date {\n        font-size: 0.8em;\n    }\n    \n    .slot-actions {\n        gap: 6px;\n    }\n    \n    .slot-actions .btn {\n        padding: 8px;\n        font-size: 0.85em;\n    }\n    \n    .no-slots {\n        padding: 20px 10px;\n    }\n    \n    .no-slots p {\n        font-size: 0.9em;\n    }\n}\n\n";
-    
-    // <head>에 추가 (가능한 한 빨리)
-    if (document.head) {
-        document.head.appendChild(style);
-    } else {
-        // head가 아직 없으면 DOMContentLoaded 대기
-        document.addEventListener('DOMContentLoaded', function() {
-            document.head.appendChild(style);
-        });
-    }
-})();
@@ -259,6 +259,67 @@ function formatDate(date) {
     return `${year}-${month}-${day}`;
 }
 
+/**
+ * Server-Sent Events 스트림을 POST로 요청하고 이벤트별 핸들러 호출
+ * 'done' 이벤트의 데이터로 resolve, 'error' 이벤트 또는 HTTP 오류 시 reject
+ * @param {string} url - 요청 URL
+ * @param {Object} body - JSON 요청 본문
+ * @param {Object} handlers - { 이벤트명: (data) => void }
+ * @returns {Promise<Object>} 'done' 이벤트 데이터
+ */
+async function postEventStream(url, body, handlers = {}) {
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream'
+        },
+        body: JSON.stringify(body)
+    });
+    if (!response.ok || !response.body) {
+        throw new Error(`서버 응답 오류: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder('utf-8');
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        // 이벤트는 빈 줄(\n\n)로 구분됨
+        let separatorIndex;
+        while ((separatorIndex = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, separatorIndex);
+            buffer = buffer.slice(separatorIndex + 2);
+
+            let eventName = 'message';
+            const dataLines = [];
+            for (const line of rawEvent.split('\n')) {
+                if (line.startsWith('event:')) {
+                    eventName = line.slice(6).trim();
+                } else if (line.startsWith('data:')) {
+                    dataLines.push(line.slice(5).trim());
+                }
+            }
+            const data = dataLines.length ? JSON.parse(dataLines.join('\n')) : null;
+
+            if (handlers[eventName]) {
+                handlers[eventName](data);
+            }
+            if (eventName === 'done') {
+                return data;
+            }
+            if (eventName === 'error') {
+                throw new Error(data?.detail || '스트리밍 처리 실패');
+            }
+        }
+    }
+    throw new Error('스트림이 완료 이벤트 없이 종료되었습니다.');
+}
+
 // 전역 유틸리티 객체
 window.Utils = {
     renderMarkdown,
@@ -269,6 +330,7 @@ window.Utils = {
     loadCthulhuIconSmall,
     loadActionIconSmall,
     getMonthName,
-    formatDate
+    formatDate,
+    postEventStream
 };
 
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가 (tools/ 스크립트와 같은 방식)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services import session_store  # noqa: E402
+
+
+@pytest.fixture
+def campaign_store(tmp_path):
+    """임시 디렉토리의 파일 저장소를 사용하는 프로세스 전역 캠페인 저장소"""
+    store = session_store.CampaignStore(session_store.FileSystemBackend(tmp_path / "campaigns"))
+    session_store.set_campaign_store(store)
+    yield store
+    session_store.set_campaign_store(None)
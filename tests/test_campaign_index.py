@@ -0,0 +1,88 @@
+"""캠페인 기록 인덱스 테스트"""
+
+import asyncio
+from datetime import date
+
+from app.services import campaign_index, storage_service
+from app.services.campaign_index import CampaignIndex
+
+
+def add_entry(data, day, is_success=True):
+    date_str = day.isoformat()
+    storage_service.add_daily_entry(
+        data, date_str, day.strftime("%A"),
+        {"visual_desc": f"조우 {date_str}", "action_type": "SEARCH", "symbols": [], "target_date": date_str},
+        {"is_success": is_success, "black_dice_sum": 9},
+        f"{date_str}의 일기"
+    )
+
+
+def campaign():
+    data = storage_service.initialize_new_game(campaign_year=1925)
+    for day in (1, 2, 5, 6, 31):
+        add_entry(data, date(1925, 1, day), is_success=day != 2)
+    add_entry(data, date(1925, 2, 1))
+    key_encounters = [
+        {"target_name": "검은 고양이", "outcome": "실패"},
+        {"target_name": campaign_index.UNSELECTED_TARGET_NAME, "outcome": "실패"},
+        {"target_name": "등대지기", "outcome": "성공"},
+    ]
+    storage_service.add_weekly_summary(data, 1, date(1924, 12, 29), date(1925, 1, 4), {"is_success": True}, key_encounters)
+    storage_service.add_weekly_summary(data, 5, date(1925, 1, 26), date(1925, 2, 1), {"is_success": False}, [])
+    return data
+
+
+def dates(items):
+    return [day.isoformat() for day, _ in items]
+
+
+def test_lookups():
+    index = CampaignIndex.build(campaign())
+
+    assert dates(index.entries_in_week(date(1925, 1, 7))) == ["1925-01-05", "1925-01-06"]
+    assert dates(index.entries_in_week(date(1925, 1, 3))) == ["1925-01-01", "1925-01-02"]
+    assert dates(index.entries_in_month(1925, 1)) == ["1925-01-01", "1925-01-02", "1925-01-05", "1925-01-06", "1925-01-31"]
+    assert index.entries_in_week(date(1925, 3, 2)) == []
+    assert [record["week_number"] for record in index.weekly_records_ending_in(1925, 2)] == [5]
+    assert index.failed_target_names == ["검은 고양이"]
+
+
+def test_incremental_updates_match_rebuild():
+    data = campaign()
+    index = CampaignIndex.build(data)
+
+    add_entry(data, date(1925, 2, 2))
+    index.add_daily_entry(data["campaign_history"]["monthly_chapters"][-1]["daily_entries"][-1])
+    storage_service.add_weekly_summary(
+        data, 6, date(1925, 2, 2), date(1925, 2, 8), {"is_success": True}, [{"target_name": "안개", "outcome": "실패"}]
+    )
+    index.add_weekly_record(data["legacy_inventory"]["weekly_records"][-1])
+
+    rebuilt = CampaignIndex.build(data)
+    assert dates(index.entries_in_month(1925, 2)) == dates(rebuilt.entries_in_month(1925, 2))
+    assert dates(index.entries_in_week(date(1925, 2, 2))) == ["1925-02-02"]
+    assert index.weekly_records_ending_in(1925, 2) == rebuilt.weekly_records_ending_in(1925, 2)
+    assert index.failed_target_names == rebuilt.failed_target_names == ["검은 고양이", "안개"]
+
+
+def test_malformed_dates_are_skipped():
+    index = CampaignIndex()
+    index.add_daily_entry({"diary_write_date": "not-a-date"})
+    index.add_weekly_record({"week_end_date": None, "key_encounters": []})
+    assert index.entries_in_month(1925, 1) == [] and index.failed_target_names == []
+
+
+def test_store_reuses_index_until_revision_changes(campaign_store):
+    async def scenario():
+        campaign_id = await campaign_store.create(campaign())
+        data = await campaign_store.get(campaign_id)
+        index = campaign_store.index(campaign_id, data)
+        assert index.is_current(data)
+        assert campaign_store.index(campaign_id, data) is index
+
+        # 인덱스를 갱신하지 않고 revision만 바뀌면 다시 생성
+        data["save_file_info"]["revision"] = 7
+        rebuilt = campaign_store.index(campaign_id, data)
+        assert rebuilt is not index and rebuilt.revision == 7
+
+    asyncio.run(scenario())
@@ -0,0 +1,84 @@
+"""세이브에 저장되는 월별 통계 블록 테스트"""
+
+from datetime import date
+
+import pytest
+
+from app.services import campaign_statistics as stats
+from app.services import storage_service
+from app.services.delta_protocol import DeltaSliceError
+
+
+def add_entry(data, day, is_success, action_type="SEARCH", cthulhu=0, madness=False, target=None):
+    date_str = day.isoformat()
+    storage_service.add_daily_entry(
+        data, date_str, day.strftime("%A"),
+        {"visual_desc": target or f"조우 {date_str}", "action_type": action_type, "symbols": [], "target_date": date_str},
+        {"is_success": is_success, "black_dice_sum": 9, "cthulhu_symbol_count": cthulhu, "madness_triggered": madness},
+        f"{date_str}의 일기"
+    )
+
+
+def campaign():
+    data = storage_service.initialize_new_game(campaign_year=1925)
+    add_entry(data, date(1925, 1, 1), True, "COMBAT", cthulhu=2, madness=True)
+    add_entry(data, date(1925, 1, 2), False)
+    # 1월 4일(일요일): 일일 엔트리는 실패, 주간 기록은 성공 -> 한 번만 집계하고 성공으로 처리
+    add_entry(data, date(1925, 1, 4), False, "COMBAT", target="심해의 사제")
+    storage_service.add_weekly_summary(
+        data, 1, date(1924, 12, 29), date(1925, 1, 4), {"target_name": "심해의 사제", "is_success": True}, []
+    )
+    add_entry(data, date(1925, 2, 1), True)
+    return data
+
+
+def test_incremental_statistics_match_backfill():
+    data = campaign()
+    assert stats.build_statistics(data) == data["statistics"]
+
+
+def test_month_aggregates():
+    january = stats.get_month(campaign(), stats.month_key(1925, 1))
+
+    assert january["total_entries"] == 3
+    assert january["success_count"] == 1
+    assert january["total_madness"] == 2 and january["madness_triggered_count"] == 1
+    assert january["action_type_counts"] == {"COMBAT": 2, "SEARCH": 1}
+    assert stats.written_days(january) == [1, 2, 4]
+    assert january["sunday_total_count"] == 1 and january["sunday_success_count"] == 1
+    assert january["weekly_sunday_total_count"] == 1
+    assert stats.bosses_defeated(january) == ["심해의 사제"]
+
+
+def test_empty_month_and_keys():
+    data = campaign()
+    assert stats.get_month(data, stats.month_key(1925, 3))["total_entries"] == 0
+    assert stats.get_month(data, None)["total_entries"] == 0
+    assert stats.month_key_for_name(1925, "February") == "1925-02"
+    assert stats.month_key_for_name(1925, "Smarch") is None
+    assert stats.success_rate(1, 3) == 33.3 and stats.success_rate(0, 0) == 0.0
+
+
+def test_backfill_once_and_version_upgrade():
+    data = campaign()
+    expected = data.pop("statistics")
+
+    # 백필 전 세이브에 추가된 기록은 통계 블록 없이 그대로 두고 백필에 포함
+    add_entry(data, date(1925, 2, 2), False)
+    assert "statistics" not in data
+    assert stats.ensure_statistics(data)
+    assert not stats.ensure_statistics(data)
+    assert data["statistics"]["months"]["1925-02"]["total_entries"] == 2
+    assert data["statistics"]["months"]["1925-01"] == expected["months"]["1925-01"]
+
+    data["statistics"]["version"] = stats.STATISTICS_VERSION - 1
+    assert not stats.has_current_statistics(data)
+    assert stats.ensure_statistics(data)
+
+
+def test_backfill_rejects_stubbed_slice():
+    data = campaign()
+    del data["statistics"]
+    data["campaign_history"]["monthly_chapters"][0] = {"month": "January", "is_stub": True}
+    with pytest.raises(DeltaSliceError):
+        stats.ensure_statistics(data)
@@ -0,0 +1,150 @@
+"""서버 캠페인 저장소 테스트"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.api.game import _game_data_session
+from app.services import session_store, storage_service
+
+
+class BlockingBackend(session_store.FileSystemBackend):
+    """첫 번째 기록을 release 될 때까지 붙잡는 파일 저장소"""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.release = threading.Event()
+        self.written = []
+
+    def save_encoded(self, campaign_id, raw):
+        if not self.written:
+            self.release.wait(5)
+        self.written.append(storage_service.decode_save(raw)["turn"])
+        super().save_encoded(campaign_id, raw)
+
+
+def test_concurrent_saves_are_coalesced(tmp_path):
+    backend = BlockingBackend(tmp_path)
+    store = session_store.CampaignStore(backend)
+    session_store.set_campaign_store(store)
+
+    async def update(campaign_id, turn):
+        async with _game_data_session(campaign_id, None) as data:
+            data["turn"] = turn
+
+    async def scenario():
+        data = storage_service.initialize_new_game(campaign_year=1925)
+        data["turn"] = 0
+        backend.release.set()
+        campaign_id = await store.create(data)
+        backend.written.clear()
+        backend.release.clear()
+
+        # 첫 번째 기록이 진행되는 동안 다음 요청들이 lock을 얻어 저장
+        tasks = [asyncio.create_task(update(campaign_id, turn)) for turn in (1, 2, 3)]
+        async def wait_for_coalesced():
+            while store.stats()["coalesced"] < 1:
+                await asyncio.sleep(0.01)
+
+        try:
+            await asyncio.wait_for(wait_for_coalesced(), timeout=2)
+        finally:
+            backend.release.set()
+        await asyncio.gather(*tasks)
+        return campaign_id
+
+    try:
+        campaign_id = asyncio.run(scenario())
+    finally:
+        session_store.set_campaign_store(None)
+
+    # 1은 그대로 기록되고 2와 3은 하나의 쓰기(마지막 데이터)로 병합
+    assert backend.written == [1, 3]
+    assert store.stats()["coalesced"] == 1
+    assert backend.load(campaign_id)["turn"] == 3
+
+
+def new_game():
+    return storage_service.initialize_new_game(campaign_year=1925)
+
+
+def test_get_uses_cache_until_discarded(campaign_store):
+    async def scenario():
+        campaign_id = await campaign_store.create(new_game())
+        first = await campaign_store.get(campaign_id)
+        assert await campaign_store.get(campaign_id) is first
+        assert campaign_store.stats()["hits"] == 2 and campaign_store.stats()["misses"] == 0
+
+        # 실패한 요청의 변경 내용은 discard()로 버리고 영구 저장소에서 다시 읽음
+        first["current_state"]["today_date"] = "1999-01-01"
+        campaign_store.discard(campaign_id)
+        reloaded = await campaign_store.get(campaign_id)
+        assert reloaded is not first
+        assert reloaded["current_state"]["today_date"] == "1925-01-01"
+        assert reloaded["save_file_info"]["campaign_id"] == campaign_id
+        assert campaign_store.stats()["misses"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_missing_and_invalid_campaign_ids(campaign_store):
+    async def scenario():
+        with pytest.raises(session_store.CampaignNotFoundError):
+            await campaign_store.get("0" * 32)
+        # 경로로 쓰일 수 있는 ID는 저장소를 읽지 않고 없는 캠페인으로 처리
+        with pytest.raises(session_store.CampaignNotFoundError):
+            await campaign_store.get("../secrets")
+        with pytest.raises(ValueError):
+            await campaign_store.save("../secrets", new_game())
+        assert not await campaign_store.delete("../secrets")
+
+    asyncio.run(scenario())
+
+
+def test_lru_eviction_drops_index_and_memo(tmp_path):
+    store = session_store.CampaignStore(session_store.FileSystemBackend(tmp_path), cache_size=2)
+
+    async def scenario():
+        ids = [await store.create(new_game()) for _ in range(2)]
+        data = await store.get(ids[0])
+        index = store.index(ids[0], data)
+        store.memo(ids[0])["key"] = "value"
+        assert store.index(ids[0], data) is index
+
+        await store.get(ids[1])
+        await store.create(new_game())
+        assert store.stats()["cached"] == 2
+        # 가장 오래 사용하지 않은 캠페인이 캐시에서 빠지면 인덱스와 메모도 함께 버려짐
+        assert store.memo(ids[0]) == {}
+        data = await store.get(ids[0])
+        assert store.index(ids[0], data) is not index
+        assert "key" not in store.memo(ids[0])
+
+    asyncio.run(scenario())
+
+
+def test_memo_for_uncached_campaign_is_not_kept(campaign_store):
+    memo = campaign_store.memo("not-cached")
+    memo["key"] = "value"
+    assert campaign_store.memo("not-cached") == {}
+
+
+def test_delete_and_list_ids(campaign_store):
+    async def scenario():
+        kept = await campaign_store.create(new_game())
+        deleted = await campaign_store.create(new_game())
+        assert sorted(campaign_store.backend.list_ids()) == sorted([kept, deleted])
+
+        assert await campaign_store.delete(deleted)
+        assert not await campaign_store.delete(deleted)
+        assert campaign_store.backend.list_ids() == [kept]
+        with pytest.raises(session_store.CampaignNotFoundError):
+            await campaign_store.get(deleted)
+
+    asyncio.run(scenario())
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        session_store.CampaignBackend()
@@ -0,0 +1,130 @@
+"""서킷 브레이커 half_open probe 회귀 테스트 (429 응답, 취소된 probe)"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import llm_service
+from app.services import resilience
+
+
+SUCCESS_BODY = {"choices": [{"message": {"content": "ok"}}]}
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """threshold=1, recovery=0.05초 브레이커와 재시도 없는 정책, 캐시 비활성화"""
+    breaker = resilience.CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    monkeypatch.setattr(llm_service, "_circuit_breaker", breaker)
+    monkeypatch.setattr(llm_service, "_retry_policy", resilience.RetryPolicy(max_retries=0))
+    monkeypatch.setattr(llm_service, "_llm_cache", None)
+    monkeypatch.setattr(llm_service, "MISTRAL_API_KEY", "test-key")
+    return breaker
+
+
+def use_transport(monkeypatch, handler):
+    """llm_service의 공유 HTTP 클라이언트를 MockTransport 클라이언트로 교체"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm_service, "get_http_client", lambda: client)
+
+
+def open_breaker(breaker):
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+    time.sleep(breaker.recovery_timeout + 0.01)
+
+
+def test_rate_limited_probe_reopens_and_recovers(monkeypatch, breaker):
+    statuses = iter([429, 200])
+    use_transport(monkeypatch, lambda request: httpx.Response(next(statuses), json=SUCCESS_BODY))
+
+    async def scenario():
+        open_breaker(breaker)
+        # half_open probe가 429를 받으면 probe 실패로 다시 open
+        assert await llm_service.call_mistral_api("system", "user") is None
+        assert breaker.state == breaker.OPEN
+        assert not breaker.probing
+
+        # 복구 시간이 지나면 다음 probe가 허용되고 성공 시 closed
+        await asyncio.sleep(breaker.recovery_timeout + 0.01)
+        assert await llm_service.call_mistral_api("system", "user") == "ok"
+        assert breaker.state == breaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_is_released(monkeypatch, breaker):
+    slow = {"enabled": True}
+
+    async def slow_handler(request):
+        if slow["enabled"]:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json=SUCCESS_BODY)
+
+    use_transport(monkeypatch, slow_handler)
+
+    async def scenario():
+        open_breaker(breaker)
+        probe = asyncio.create_task(llm_service.call_mistral_api("system", "user"))
+        while not breaker.probing:
+            await asyncio.sleep(0.001)
+        # 호출자의 마감 시간이나 클라이언트 연결 종료로 probe가 취소됨
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        assert breaker.state == breaker.HALF_OPEN
+        assert not breaker.probing
+
+        # 다음 호출이 새 probe가 되어 upstream 복구를 확인
+        slow["enabled"] = False
+        assert await llm_service.call_mistral_api("system", "user") == "ok"
+        assert breaker.state == breaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_stream_probe_released_when_client_disconnects(monkeypatch, breaker):
+    async def slow_handler(request):
+        await asyncio.sleep(10)
+        return httpx.Response(200, text="data: [DONE]\n\n")
+
+    use_transport(monkeypatch, slow_handler)
+
+    async def consume():
+        async for _ in llm_service.stream_mistral_api("system", "user"):
+            pass
+
+    async def scenario():
+        open_breaker(breaker)
+        stream = asyncio.create_task(consume())
+        while not breaker.probing:
+            await asyncio.sleep(0.001)
+        stream.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stream
+        assert breaker.state == breaker.HALF_OPEN
+        assert not breaker.probing
+        assert breaker.allow_request()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_client_error_probe_does_not_close_breaker(monkeypatch, breaker, streaming):
+    use_transport(monkeypatch, lambda request: httpx.Response(400, json={"message": "bad request"}))
+
+    async def call():
+        if streaming:
+            return [delta async for delta in llm_service.stream_mistral_api("system", "user")]
+        return await llm_service.call_mistral_api("system", "user")
+
+    async def scenario():
+        open_breaker(breaker)
+        # 4xx 응답은 upstream 복구를 확인한 것이 아니므로 closed로 바꾸지 않고 probe만 해제
+        assert not await call()
+        assert breaker.state == breaker.HALF_OPEN
+        assert not breaker.probing
+
+    asyncio.run(scenario())
@@ -0,0 +1,77 @@
+"""JSON 응답 압축 미들웨어의 ETag/Vary 처리 테스트"""
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, accepts_encoding
+
+
+ETAG = '"abc123"'
+BODY = b'{"items": [' + b",".join(b'"entry"' for _ in range(500)) + b"]}"
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+@app.get("/memo")
+async def memo(request: Request):
+    # narrative의 메모 응답처럼 원본 본문 기준 강한 ETag, W/ 접두어는 무시하고 비교
+    if_none_match = request.headers.get("if-none-match", "").replace("W/", "")
+    if ETAG in if_none_match:
+        return Response(status_code=304, headers={"ETag": ETAG})
+    return Response(BODY, media_type="application/json", headers={"ETag": ETAG})
+
+
+@app.get("/small")
+async def small():
+    return Response(b'{"ok": true}', media_type="application/json", headers={"ETag": ETAG})
+
+
+client = TestClient(app)
+
+
+def test_compressed_response_gets_weak_etag():
+    response = client.get("/memo", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == "W/" + ETAG
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == BODY
+
+
+def test_uncompressed_responses_keep_strong_etag_and_vary():
+    identity = client.get("/memo", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] == ETAG
+    assert identity.headers["vary"] == "Accept-Encoding"
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.headers["etag"] == ETAG
+    assert small.headers["vary"] == "Accept-Encoding"
+
+
+def test_not_modified_echoes_weak_etag():
+    weak = client.get("/memo", headers={"Accept-Encoding": "gzip", "If-None-Match": "W/" + ETAG})
+    assert weak.status_code == 304
+    assert weak.headers["etag"] == "W/" + ETAG
+
+    strong = client.get("/memo", headers={"Accept-Encoding": "identity", "If-None-Match": ETAG})
+    assert strong.status_code == 304
+    assert strong.headers["etag"] == ETAG
+
+
+def test_not_modified_sends_vary():
+    response = client.get("/memo", headers={"Accept-Encoding": "gzip", "If-None-Match": ETAG})
+    assert response.status_code == 304
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_explicit_refusal_overrides_wildcard():
+    assert not accepts_encoding("gzip;q=0, *", "gzip")
+    assert accepts_encoding("br;q=0, *;q=0.5", "gzip")
+    assert accepts_encoding("GZIP; q=0.8", "gzip")
+    assert not accepts_encoding("gzip;q=0.000", "gzip")
+    assert not accepts_encoding(None, "gzip")
+
+    response = client.get("/memo", headers={"Accept-Encoding": "gzip;q=0, *"})
+    assert response.headers.get("content-encoding") != "gzip"
@@ -0,0 +1,86 @@
+"""game_data 변경 패치 (delta 모드) 테스트"""
+
+import copy
+from datetime import date
+
+import pytest
+
+from app.services import delta_protocol, storage_service
+
+
+def new_game():
+    data = storage_service.initialize_new_game(campaign_year=1925)
+    storage_service.add_daily_entry(
+        data, "1925-01-01", "Thursday",
+        {"visual_desc": "검은 고양이", "action_type": "SEARCH", "symbols": [], "target_date": "1925-01-01"},
+        {"is_success": True, "black_dice_sum": 9},
+        "첫 번째 일기"
+    )
+    return data
+
+
+def add_entry(data, date_str):
+    storage_service.add_daily_entry(
+        data, date_str, "Friday",
+        {"visual_desc": "안개 낀 부두", "action_type": "COMBAT", "symbols": [], "target_date": date_str},
+        {"is_success": False, "black_dice_sum": 4},
+        "다음 일기"
+    )
+
+
+def test_patch_applied_to_client_copy_matches_server():
+    data = new_game()
+    client_copy = copy.deepcopy(data)
+    tracker = delta_protocol.DeltaTracker(data, base_revision=0)
+
+    add_entry(data, "1925-01-02")
+    storage_service.add_weekly_summary(data, 1, date(1925, 1, 5), date(1925, 1, 11), {}, [], "주간 요약")
+    data["current_state"]["today_date"] = "1925-01-03"
+    response = tracker.finish({"game_data": data})
+
+    assert "game_data" not in response
+    assert response["base_revision"] == 0 and response["revision"] == 1
+    assert delta_protocol.apply_patch(client_copy, response["patch"]) == data
+
+
+def test_history_is_not_compared_entry_by_entry():
+    data = new_game()
+    old_entry = data["campaign_history"]["monthly_chapters"][0]["daily_entries"][0]
+    tracker = delta_protocol.DeltaTracker(data, base_revision=0)
+    add_entry(data, "1925-01-02")
+    # 스냅샷은 기존 기록을 복사하지 않으므로 (append-only 가정) 기존 항목의 변경은 패치에 나타나지 않음
+    old_entry["day_of_week"] = "Sunday"
+
+    patch = tracker.finish({"game_data": data})["patch"]
+
+    entry_ops = [op for op in patch if "/daily_entries/" in op["path"]]
+    assert entry_ops == [{
+        "op": "add",
+        "path": "/campaign_history/monthly_chapters/0/daily_entries/1",
+        "value": data["campaign_history"]["monthly_chapters"][0]["daily_entries"][1]
+    }]
+    assert {"op": "replace", "path": "/campaign_history/monthly_chapters/0/revision", "value": 2} in patch
+
+
+def test_new_chapter_is_added_whole():
+    data = new_game()
+    client_copy = copy.deepcopy(data)
+    tracker = delta_protocol.DeltaTracker(data, base_revision=0)
+    add_entry(data, "1925-02-02")
+
+    patch = tracker.finish({"game_data": data})["patch"]
+
+    assert any(op["path"] == "/campaign_history/monthly_chapters/1" and op["op"] == "add" for op in patch)
+    assert delta_protocol.apply_patch(client_copy, patch) == data
+
+
+def test_full_mode_returns_game_data_and_bumps_revision():
+    data = new_game()
+    response = delta_protocol.DeltaTracker(data).finish({"game_data": data})
+    assert response["game_data"] is data
+    assert data["save_file_info"]["revision"] == 1 and "patch" not in response
+
+
+def test_revision_conflict():
+    with pytest.raises(delta_protocol.DeltaConflictError):
+        delta_protocol.DeltaTracker(new_game(), base_revision=3)
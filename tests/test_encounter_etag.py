@@ -0,0 +1,35 @@
+"""조우 데이터 응답의 인코딩별 ETag 테스트"""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+client = TestClient(app)
+URL = "/api/game/encounter-data"
+
+
+def test_gzip_and_identity_have_distinct_strong_etags():
+    gzipped = client.get(URL, headers={"Accept-Encoding": "gzip"})
+    identity = client.get(URL, headers={"Accept-Encoding": "identity"})
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert gzipped.headers["etag"] == identity.headers["etag"][:-1] + '-gzip"'
+    assert gzipped.json() == identity.json()
+
+
+def test_revalidation_returns_client_etag():
+    for encoding in ("gzip", "identity"):
+        etag = client.get(URL, headers={"Accept-Encoding": encoding}).headers["etag"]
+        # 클라이언트가 가진 표현의 ETag로 재검증하면 Accept-Encoding과 관계없이 같은 ETag로 304
+        for accept in ("gzip", "identity"):
+            response = client.get(URL, headers={"Accept-Encoding": accept, "If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag
+
+
+def test_refused_gzip_gets_identity_body():
+    response = client.get(URL, headers={"Accept-Encoding": "gzip;q=0, *"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
@@ -0,0 +1,72 @@
+"""스트리밍 조우 처리의 캠페인 lock 해제 테스트"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.main import app
+from app.services import storage_service
+
+
+ENCOUNTER = {
+    "target_date": "1925-01-01",
+    "visual_description": "안개 낀 부두",
+    "required_symbol": "COMBAT",
+    "base_difficulty": 8,
+    "black_dice_sum": 10,
+    "green_dice_symbols": ["COMBAT"],
+}
+
+
+class ClientGone(Exception):
+    """응답 헤더를 보내기 전에 클라이언트 연결이 끊김"""
+
+
+async def post_stream_and_drop(body: dict) -> None:
+    """응답 시작 메시지 전송이 실패하는 (본문 생성기가 시작되지 않는) 요청"""
+    payload = json.dumps(body).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/game/encounter/stream",
+        "raw_path": b"/api/game/encounter/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            raise ClientGone()
+
+    await app(scope, receive, send)
+
+
+def test_lock_released_when_stream_never_starts(campaign_store):
+    async def scenario():
+        campaign_id = await campaign_store.create(storage_service.initialize_new_game(campaign_year=1925))
+
+        with pytest.raises(ClientGone):
+            await post_stream_and_drop({**ENCOUNTER, "campaign_id": campaign_id})
+
+        # lock이 풀려 있어야 다음 요청이 진행됨
+        await asyncio.wait_for(campaign_store.lock(campaign_id).acquire(), timeout=1)
+        campaign_store.lock(campaign_id).release()
+        # 완료되지 않은 조우의 변경 내용은 저장되지 않음
+        data = await campaign_store.get(campaign_id)
+        assert data["current_state"]["today_date"] == "1925-01-01"
+        assert not data["current_state"]["weekly_progress"]["completed_days_in_week"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,42 @@
+"""주간 조우 데이터 조회 테스트"""
+
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import encounter_data
+
+
+client = TestClient(app)
+
+
+def test_out_of_range_years_are_rejected():
+    for day in ("0001-01-01", "9999-12-31", "1799-12-31"):
+        response = client.get(f"/api/game/encounter-data/week/{day}")
+        assert response.status_code == 400
+
+
+def test_weeks_outside_index_years_are_bounded(monkeypatch):
+    monkeypatch.setattr(encounter_data, "ENCOUNTER_WEEK_CACHE_SIZE", 2)
+    dataset = encounter_data.EncounterDataset({"encounters": {"01-05": {"visual_description": "등대"}}})
+    dataset.index_years([1925])
+    indexed = dataset.get_week_body(date(1925, 1, 5))
+
+    bodies = [dataset.get_week_body(date(2000, 1, 3 + 7 * week)) for week in range(5)]
+
+    assert len(dataset._recent_weeks) == 2
+    # 최근 주는 캐시에서 재사용하고, 밀려난 주는 다시 조립
+    assert dataset.get_week_body(date(2000, 1, 31)) is bodies[-1]
+    assert dataset.get_week_body(date(2000, 1, 3)) is not bodies[0]
+    assert dataset.get_week_body(date(2000, 1, 3)).body == bodies[0].body
+    # 인덱스 연도의 주는 캐시 크기와 관계없이 유지
+    assert dataset.get_week_body(date(1925, 1, 5)) is indexed
+
+
+def test_week_includes_sunday_boss():
+    response = client.get("/api/game/encounter-data/week/1925-01-07")
+    assert response.status_code == 200
+    week = response.json()["week"]
+    assert week["week_start"] == "1925-01-05"
+    assert [day["day_of_week"] for day in week["days"]][-1] == "Sunday"
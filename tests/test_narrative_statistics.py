@@ -0,0 +1,90 @@
+"""조회 API의 통계 블록 백필 및 결과 메모 테스트"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import campaign_statistics, storage_service
+
+
+client = TestClient(app)
+
+
+def legacy_campaign(store):
+    """통계 블록이 없는 (백필 전) 캠페인"""
+    data = storage_service.initialize_new_game(campaign_year=1925)
+    storage_service.add_daily_entry(
+        data, "1925-01-01", "Thursday",
+        {"visual_desc": "검은 고양이", "action_type": "SEARCH", "symbols": [], "target_date": "1925-01-01"},
+        {"is_success": True, "black_dice_sum": 9},
+        "첫 번째 일기"
+    )
+    del data["statistics"]
+    return asyncio.run(store.create(data))
+
+
+def test_backfill_is_persisted_once(campaign_store, monkeypatch):
+    campaign_id = legacy_campaign(campaign_store)
+    builds = []
+    original = campaign_statistics.build_statistics
+    monkeypatch.setattr(campaign_statistics, "build_statistics", lambda data: builds.append(1) or original(data))
+
+    report = client.post("/api/narrative/report/January", json={"campaign_id": campaign_id})
+    status = client.post("/api/narrative/month/January/completion-status", json={"campaign_id": campaign_id})
+
+    assert report.status_code == 200 and status.status_code == 200
+    assert status.json()["written_dates"] == [1]
+    assert len(builds) == 1
+    # 영구 저장소에도 백필된 통계 블록이 저장됨
+    assert campaign_statistics.has_current_statistics(campaign_store.backend.load(campaign_id))
+
+
+def test_report_memo_and_etag(campaign_store, monkeypatch):
+    campaign_id = legacy_campaign(campaign_store)
+    url = "/api/narrative/report/January"
+    first = client.post(url, json={"campaign_id": campaign_id})
+    etag = first.headers["etag"]
+
+    # 챕터 revision이 같으면 메모된 본문을 재사용
+    monkeypatch.setattr(campaign_statistics, "get_month", lambda *args: (_ for _ in ()).throw(AssertionError()))
+    again = client.post(url, json={"campaign_id": campaign_id})
+    assert again.headers["etag"] == etag and again.content == first.content
+
+    revalidated = client.post(url, json={"campaign_id": campaign_id}, headers={"If-None-Match": f"W/{etag}"})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"].removeprefix("W/") == etag
+
+
+def test_memo_invalidated_by_chapter_revision(campaign_store):
+    campaign_id = legacy_campaign(campaign_store)
+    url = "/api/narrative/month/January/completion-status"
+    first = client.post(url, json={"campaign_id": campaign_id})
+    assert first.json()["written_dates"] == [1]
+
+    async def write_entry():
+        data = await campaign_store.get(campaign_id)
+        storage_service.add_daily_entry(
+            data, "1925-01-02", "Friday",
+            {"visual_desc": "안개 낀 부두", "action_type": "COMBAT", "symbols": [], "target_date": "1925-01-02"},
+            {"is_success": False, "black_dice_sum": 4},
+            "두 번째 일기"
+        )
+
+    # 챕터 revision이 바뀌면 메모를 버리고 다시 계산하며, 이전 ETag로 재검증하면 새 본문을 받음
+    asyncio.run(write_entry())
+    second = client.post(url, json={"campaign_id": campaign_id}, headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.json()["written_dates"] == [1, 2]
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_client_game_data_gets_etag_without_memo(campaign_store):
+    game_data = storage_service.initialize_new_game(campaign_year=1925)
+    url = "/api/narrative/month/January/completion-status"
+    first = client.post(url, json={"game_data": game_data})
+    assert first.status_code == 200 and first.json()["written_days"] == 0
+
+    revalidated = client.post(url, json={"game_data": game_data}, headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert campaign_store.stats()["cached"] == 0
@@ -0,0 +1,60 @@
+"""스냅샷 + 저널 세이브의 저장 시 컴팩션 테스트 (백그라운드 컴팩터 없이)"""
+
+from app.services import json_codec, save_journal
+
+
+def test_append_compacts_inline_when_threshold_reached(tmp_path, monkeypatch):
+    monkeypatch.setattr(save_journal, "JOURNAL_COMPACT_RECORDS", 3)
+    journal = save_journal.SaveJournal(tmp_path, "save")
+
+    for day in range(1, 8):
+        journal.append({"day": day, "entries": list(range(day))})
+
+    # 3개마다 스냅샷으로 교체되므로 저널에는 마지막 1개만 남음
+    stats = journal.stats()
+    assert stats["journal_records"] == 1
+    assert stats["snapshot_seq"] == 6
+    assert journal.journal_path.read_bytes().count(b"\n") == 1
+
+    reloaded = save_journal.SaveJournal(tmp_path, "save")
+    assert reloaded.load() == {"day": 7, "entries": list(range(7))}
+
+
+def test_byte_threshold_uses_journal_file_size(tmp_path, monkeypatch):
+    journal = save_journal.SaveJournal(tmp_path, "save")
+    journal.append({"day": 1})
+    first_size = journal.journal_path.stat().st_size
+
+    # 다음 저장으로 파일 크기가 기준을 넘으면 저장 직후 컴팩션
+    monkeypatch.setattr(save_journal, "JOURNAL_COMPACT_BYTES", first_size + 1)
+    journal.append({"day": 2})
+
+    assert journal.stats()["journal_records"] == 0
+    assert journal.journal_path.stat().st_size == 0
+    assert save_journal.SaveJournal(tmp_path, "save").load() == {"day": 2}
+
+
+def test_append_records_only_new_history_entries(tmp_path):
+    journal = save_journal.SaveJournal(tmp_path, "save")
+    chapter = {"month": "January", "revision": 1, "daily_entries": [{"day": day} for day in range(30)]}
+    data = {"current_state": {"today_date": "1925-01-31"}, "campaign_history": {"monthly_chapters": [chapter]}}
+    journal.append(data)
+
+    chapter["daily_entries"].append({"day": 30})
+    chapter["revision"] = 2
+    data["current_state"]["today_date"] = "1925-02-01"
+
+    assert journal.append(data) == 3
+    last = json_codec.loads(journal.journal_path.read_bytes().splitlines()[-1])
+    assert {"op": "add", "path": "/campaign_history/monthly_chapters/0/daily_entries/30", "value": {"day": 30}} in last["patch"]
+    assert save_journal.SaveJournal(tmp_path, "save").load() == data
+
+
+def test_background_compaction_reads_full_document(tmp_path):
+    journal = save_journal.SaveJournal(tmp_path, "save")
+    for day in range(1, 4):
+        journal.append({"day": day, "weekly_records": list(range(day))})
+
+    assert journal.compact()
+    assert journal.journal_path.stat().st_size == 0
+    assert save_journal.SaveJournal(tmp_path, "save").load() == {"day": 3, "weekly_records": [0, 1, 2]}
@@ -0,0 +1,63 @@
+"""SingleFlight leader 취소 시 대기 중인 호출 처리 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.services.llm_cache import SingleFlight
+
+
+def test_waiters_rerun_when_leader_cancelled():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+        release = asyncio.Event()
+
+        async def work(name):
+            calls.append(name)
+            await release.wait()
+            return name
+
+        leader = asyncio.create_task(flight.do("key", lambda: work("leader")))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do("key", lambda i=i: work(f"waiter{i}"))) for i in range(2)]
+        await asyncio.sleep(0)
+
+        # 클라이언트 연결 종료 등으로 leader만 취소
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters)
+        # 먼저 깨어난 대기자가 새 leader가 되고 나머지는 그 결과를 공유
+        assert results == ["waiter0", "waiter0"]
+        assert calls == ["leader", "waiter0"]
+        assert flight.stats()["leader_cancellations"] == 1
+        assert flight.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_leader():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+
+        assert await leader == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(scenario())
@@ -0,0 +1,113 @@
+"""정규화된 SQLite 저장소 테스트"""
+
+import asyncio
+from datetime import date
+
+from app.services import session_store, storage_service
+from app.services.sqlite_storage import SQLiteStorage
+
+
+def campaign_with_history():
+    data = storage_service.initialize_new_game(campaign_year=1925)
+    for day in range(1, 8):
+        date_str = f"1925-01-{day:02d}"
+        storage_service.add_daily_entry(
+            data, date_str, date(1925, 1, day).strftime("%A"),
+            {"visual_desc": f"조우 {day}", "action_type": "SEARCH", "symbols": [], "target_date": date_str},
+            {"is_success": day % 2 == 0, "black_dice_sum": 9},
+            f"{day}일의 일기"
+        )
+    storage_service.add_weekly_summary(data, 1, date(1924, 12, 29), date(1925, 1, 4), {"is_success": True}, [], "요약")
+    return data
+
+
+def test_round_trip(tmp_path):
+    storage = SQLiteStorage(tmp_path / "campaigns.sqlite3")
+    data = campaign_with_history()
+    storage.save("c1", data)
+
+    assert storage.load("c1") == data
+    # 새 연결(다른 프로세스)에서도 같은 문서로 조립
+    assert SQLiteStorage(tmp_path / "campaigns.sqlite3").load("c1") == data
+    assert storage.load("missing") is None
+
+
+def test_save_writes_only_changed_rows(tmp_path):
+    storage = SQLiteStorage(tmp_path / "campaigns.sqlite3")
+    data = campaign_with_history()
+    storage.save("c1", data)
+    assert storage.save("c1", data) == 0
+
+    storage_service.add_daily_entry(
+        data, "1925-01-08", "Thursday",
+        {"visual_desc": "조우 8", "action_type": "COMBAT", "symbols": [], "target_date": "1925-01-08"},
+        {"is_success": True, "black_dice_sum": 12},
+        "8일의 일기"
+    )
+    # 새 엔트리 행, 챕터 헤더(revision), 캠페인 행(통계 블록)만 기록
+    assert storage.save("c1", data) == 3
+    assert storage.load("c1") == data
+
+
+def test_removed_rows_are_deleted(tmp_path):
+    storage = SQLiteStorage(tmp_path / "campaigns.sqlite3")
+    data = campaign_with_history()
+    storage.save("c1", data)
+
+    del data["campaign_history"]["monthly_chapters"][0]["daily_entries"][-2:]
+    data["legacy_inventory"]["weekly_records"].clear()
+    # 엔트리 2행과 주간 기록 1행만 삭제 (챕터 헤더와 캠페인 행은 바뀌지 않음)
+    assert storage.save("c1", data) == 3
+    assert storage.rows_deleted == 3
+    assert storage.load("c1") == data
+
+
+def test_save_rereads_rows_written_by_another_connection(tmp_path):
+    path = tmp_path / "campaigns.sqlite3"
+    first, second = SQLiteStorage(path), SQLiteStorage(path)
+    data = campaign_with_history()
+    first.save("c1", data)
+    second.load("c1")
+
+    data["current_state"]["today_date"] = "1925-01-09"
+    first.save("c1", data)
+    data["current_state"]["today_date"] = "1925-01-10"
+    second.save("c1", data)
+
+    assert first.load("c1")["current_state"]["today_date"] == "1925-01-10"
+
+
+def test_entries_between_uses_dates(tmp_path):
+    storage = SQLiteStorage(tmp_path / "campaigns.sqlite3")
+    storage.save("c1", campaign_with_history())
+    entries = storage.entries_between("c1", "1925-01-03", "1925-01-05")
+    assert [entry["diary_write_date"] for entry in entries] == ["1925-01-03", "1925-01-04", "1925-01-05"]
+
+
+def test_delete_and_list_ids(tmp_path):
+    storage = SQLiteStorage(tmp_path / "campaigns.sqlite3")
+    storage.save("b", campaign_with_history())
+    storage.save("a", campaign_with_history())
+    assert storage.list_ids() == ["a", "b"]
+    assert storage.delete("a")
+    assert not storage.delete("a")
+    assert storage.list_ids() == ["b"]
+    assert storage.entries_between("a", "1925-01-01", "1925-12-31") == []
+
+
+def test_campaign_store_with_sqlite_backend(tmp_path):
+    backend = session_store.SQLiteBackend(tmp_path / "campaigns.sqlite3")
+    store = session_store.CampaignStore(backend)
+
+    async def scenario():
+        campaign_id = await store.create(campaign_with_history())
+        data = await store.get(campaign_id)
+        data["current_state"]["today_date"] = "1925-01-09"
+        async with store.lock(campaign_id):
+            await store.save(campaign_id, data)
+        store.discard(campaign_id)
+        return campaign_id, data, await store.get(campaign_id)
+
+    campaign_id, saved, reloaded = asyncio.run(scenario())
+    assert reloaded == saved
+    assert backend.list_ids() == [campaign_id]
@@ -0,0 +1,50 @@
+"""빌드된 정적 번들 응답 테스트 (tools/build_assets.py 출력 사용)"""
+
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import static_assets
+from tools import build_assets
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    dist_dir = tmp_path_factory.mktemp("dist")
+    build_assets.build(dist_dir, minify=True)
+    original = static_assets.assets
+    static_assets.assets = static_assets.StaticAssets(dist_dir)
+    yield TestClient(app)
+    static_assets.assets = original
+
+
+def bundle_url(client, suffix):
+    return re.search(r'/static/dist/app\.[0-9a-f]+\.' + suffix, client.get("/").text).group(0)
+
+
+def test_encodings_have_distinct_etags(client):
+    url = bundle_url(client, "js")
+    gzipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+    identity = client.get(url, headers={"Accept-Encoding": "identity"})
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert gzipped.headers["etag"] != identity.headers["etag"]
+    assert gzipped.content == identity.content
+    assert identity.headers["cache-control"] == static_assets.BUNDLE_CACHE_CONTROL
+    assert identity.headers["vary"] == "Accept-Encoding"
+
+
+def test_revalidation_returns_client_etag(client):
+    url = bundle_url(client, "css")
+    for encoding in ("gzip", "identity"):
+        etag = client.get(url, headers={"Accept-Encoding": encoding}).headers["etag"]
+        response = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+
+def test_unknown_bundle_is_404(client):
+    assert client.get("/static/dist/app.0000000000.js").status_code == 404
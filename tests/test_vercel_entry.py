@@ -0,0 +1,83 @@
+"""Vercel 진입점(api/index.py)의 Mangum handler 테스트 (API Gateway v2 이벤트)"""
+
+import asyncio
+import base64
+import gzip
+import json
+
+import pytest
+
+from api.index import handler
+
+
+@pytest.fixture(autouse=True)
+def current_event_loop():
+    """
+    Mangum은 asyncio.get_event_loop()를 사용하므로 현재 이벤트 루프 설정
+
+    서버리스 프로세스에서는 항상 루프가 있지만, 같은 프로세스의 다른 테스트가 asyncio.run()으로
+    루프를 해제했을 수 있습니다.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+class Context:
+    function_name = "test"
+
+
+def http_api_event(path, headers=None, method="GET"):
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {"host": "localhost", **(headers or {})},
+        "requestContext": {
+            "accountId": "test",
+            "apiId": "test",
+            "domainName": "localhost",
+            "http": {"method": method, "path": path, "protocol": "HTTP/1.1", "sourceIp": "127.0.0.1", "userAgent": "pytest"},
+            "requestId": "test",
+            "routeKey": "$default",
+            "stage": "$default",
+            "time": "01/Jan/2026:00:00:00 +0000",
+            "timeEpoch": 0,
+        },
+        "isBase64Encoded": False,
+    }
+
+
+def response_header(response, name):
+    headers = {key.lower(): value for key, value in response.get("headers", {}).items()}
+    return headers.get(name)
+
+
+def test_gzip_accepted_returns_base64_compressed_body():
+    response = handler(http_api_event("/api/game/encounter-data", {"accept-encoding": "gzip"}), Context())
+
+    assert response["statusCode"] == 200
+    assert response_header(response, "content-encoding") == "gzip"
+    assert response["isBase64Encoded"] is True
+    payload = json.loads(gzip.decompress(base64.b64decode(response["body"])))
+    assert payload["success"] is True
+    assert payload["data"]["encounters"]
+
+
+def test_identity_returns_plain_json_body():
+    response = handler(http_api_event("/api/game/encounter-data", {"accept-encoding": "identity"}), Context())
+
+    assert response["statusCode"] == 200
+    assert response_header(response, "content-encoding") is None
+    assert response["isBase64Encoded"] is False
+    assert json.loads(response["body"])["success"] is True
+
+
+def test_index_page_is_served():
+    response = handler(http_api_event("/", {"accept-encoding": "identity"}), Context())
+
+    assert response["statusCode"] == 200
+    assert "<html" in response["body"]
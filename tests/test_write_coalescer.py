@@ -0,0 +1,100 @@
+"""키별 쓰기 직렬화/병합 테스트"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.write_coalescer import WriteCoalescer
+
+
+class GatedWriter:
+    """release 될 때까지 첫 번째 쓰기를 붙잡는 동기 쓰기 함수"""
+
+    def __init__(self, fail_on=None):
+        self.release = threading.Event()
+        self.written = []
+        self.fail_on = fail_on
+
+    def __call__(self, key, data):
+        if not self.written:
+            self.release.wait(5)
+        self.written.append((key, data))
+        if data == self.fail_on:
+            raise OSError("disk full")
+        return f"{key}:{data}"
+
+
+async def wait_until(predicate):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+    await asyncio.wait_for(poll(), timeout=2)
+
+
+def test_writes_during_a_flush_merge_into_one():
+    writer = GatedWriter()
+    coalescer = WriteCoalescer(writer)
+
+    async def scenario():
+        first = asyncio.create_task(coalescer.write("a", 1))
+        await wait_until(lambda: "a" in coalescer._states and coalescer._states["a"].lock.locked())
+        rest = [asyncio.create_task(coalescer.write("a", value)) for value in (2, 3, 4)]
+        await wait_until(lambda: coalescer.coalesced == 2)
+        writer.release.set()
+        return await first, await asyncio.gather(*rest)
+
+    first, rest = asyncio.run(scenario())
+    assert writer.written == [("a", 1), ("a", 4)]
+    # 병합된 쓰기는 실제로 기록한 마지막 쓰기의 결과를 받음
+    assert first == "a:1" and rest == ["a:4"] * 3
+    assert coalescer.stats() == {"writes": 2, "coalesced": 2}
+    assert coalescer._states == {}
+
+
+def test_different_keys_are_not_merged():
+    writer = GatedWriter()
+    writer.release.set()
+    coalescer = WriteCoalescer(writer)
+
+    async def scenario():
+        return await asyncio.gather(coalescer.write("a", 1), coalescer.write("b", 1))
+
+    assert asyncio.run(scenario()) == ["a:1", "b:1"]
+    assert coalescer.stats() == {"writes": 2, "coalesced": 0}
+
+
+def test_submit_registers_in_call_order():
+    writer = GatedWriter()
+    writer.release.set()
+    coalescer = WriteCoalescer(writer)
+
+    async def scenario():
+        # 등록은 즉시 수행되므로 기다리기 전에 다음 쓰기가 들어와도 순서와 병합이 유지됨
+        first = coalescer.submit("a", 1)
+        second = coalescer.submit("a", 2)
+        return await first, await second
+
+    assert asyncio.run(scenario()) == ("a:2", "a:2")
+    assert writer.written == [("a", 2)]
+
+
+def test_failure_is_raised_to_merged_waiters():
+    writer = GatedWriter(fail_on=3)
+    coalescer = WriteCoalescer(writer)
+
+    async def scenario():
+        first = asyncio.create_task(coalescer.write("a", 1))
+        await wait_until(lambda: "a" in coalescer._states and coalescer._states["a"].lock.locked())
+        merged = [asyncio.create_task(coalescer.write("a", value)) for value in (2, 3)]
+        await wait_until(lambda: coalescer.coalesced == 1)
+        writer.release.set()
+        await first
+        for task in merged:
+            with pytest.raises(OSError):
+                await task
+        # 실패 후에도 다음 쓰기는 정상 처리
+        return await coalescer.write("a", 5)
+
+    assert asyncio.run(scenario()) == "a:5"
+    assert coalescer.stats()["writes"] == 2
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기존 세이브에 통계 블록(statistics) 백필
+
+통계 블록이 생기기 전에 만든 세이브는 첫 변경 요청에서 자동으로 백필되지만,
+이 스크립트로 저장된 세이브를 한 번에 미리 변환할 수 있습니다.
+
+사용 예:
+    python tools/backfill_statistics.py data/save_game.json backup.json
+    python tools/backfill_statistics.py --storage --campaign default
+    python tools/backfill_statistics.py --campaign-store
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services import campaign_statistics  # noqa: E402
+from app.services import session_store  # noqa: E402
+from app.services import storage_service  # noqa: E402
+
+
+def backfill(data: Dict[str, Any], force: bool) -> bool:
+    """통계 블록 백필 (force이면 이미 있어도 다시 생성)"""
+    if force:
+        data.pop("statistics", None)
+    return campaign_statistics.ensure_statistics(data)
+
+
+def backfill_file(path: Path, force: bool) -> bool:
+    """JSON 세이브 파일 백필 (gzip 압축 여부는 SAVE_COMPRESSION 설정을 따름)"""
+    data = storage_service.decode_save(path.read_bytes())
+    if not backfill(data, force):
+        return False
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(storage_service.encode_save(data))
+    tmp_path.replace(path)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기존 세이브에 통계 블록 백필")
+    parser.add_argument("paths", nargs="*", help="JSON 세이브 파일 경로")
+    parser.add_argument("--storage", action="store_true", help="STORAGE_BACKEND 설정의 세이브 백필")
+    parser.add_argument("--campaign", default=storage_service.DEFAULT_CAMPAIGN_ID, help="--storage에서 사용할 캠페인 ID")
+    parser.add_argument("--campaign-store", action="store_true", help="서버 캠페인 저장소의 모든 캠페인 백필")
+    parser.add_argument("--force", action="store_true", help="통계 블록이 이미 있어도 다시 생성")
+    args = parser.parse_args()
+
+    if not (args.paths or args.storage or args.campaign_store):
+        parser.error("세이브 파일 경로, --storage, --campaign-store 중 하나 이상을 지정하세요.")
+
+    for path in args.paths:
+        updated = backfill_file(Path(path), args.force)
+        print(f"{path}: {'백필 완료' if updated else '이미 최신'}")
+
+    if args.storage:
+        data = storage_service.load_game_data(args.campaign)
+        if backfill(data, args.force):
+            storage_service.save_game_data(data, args.campaign)
+            print(f"{storage_service.STORAGE_BACKEND} ({args.campaign}): 백필 완료")
+        else:
+            print(f"{storage_service.STORAGE_BACKEND} ({args.campaign}): 이미 최신")
+
+    if args.campaign_store:
+        backend = session_store.create_backend()
+        updated = 0
+        campaign_ids = backend.list_ids()
+        for campaign_id in campaign_ids:
+            data = backend.load(campaign_id)
+            if data is not None and backfill(data, args.force):
+                backend.save(campaign_id, data)
+                updated += 1
+        print(f"캠페인 저장소 ({session_store.CAMPAIGN_STORE_BACKEND}): {len(campaign_ids)}개 중 {updated}개 백필")
+
+
+if __name__ == "__main__":
+    main()
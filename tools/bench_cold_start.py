@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vercel/Mangum 서버리스 진입점 콜드 스타트 벤치마크
+
+매 회 새 Python 프로세스에서 api/index.py를 import하고 (모듈 import 시간),
+Mangum handler로 API Gateway 형식의 요청을 보내 첫 요청과 두 번째 요청 시간을 측정합니다.
+LLM을 호출하지 않는 요청을 기본으로 사용합니다.
+
+사용 예:
+    python tools/bench_cold_start.py --runs 10
+    python tools/bench_cold_start.py --path /api/narrative/all-chapters --method POST --body '{"game_data": {}}'
+    python tools/bench_cold_start.py --entry app.main --modules
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 자식 프로세스에서 실행하는 측정 코드 (결과는 JSON 한 줄로 stdout에 출력)
+CHILD_SCRIPT = r"""
+import json, sys, time
+started = time.perf_counter()
+import importlib
+module = importlib.import_module(sys.argv[1])
+import_ms = (time.perf_counter() - started) * 1000
+
+handler = getattr(module, "handler", None)
+if handler is None:
+    from mangum import Mangum
+    handler = Mangum(module.app, lifespan="off")
+
+method, path, body = sys.argv[2], sys.argv[3], sys.argv[4] or None
+event = {
+    "resource": "/{proxy+}",
+    "path": path,
+    "httpMethod": method,
+    "headers": {"content-type": "application/json", "accept-encoding": "identity", "host": "localhost"},
+    "multiValueHeaders": {},
+    "queryStringParameters": None,
+    "multiValueQueryStringParameters": None,
+    "requestContext": {"resourcePath": "/{proxy+}", "httpMethod": method, "path": path, "stage": "bench", "identity": {"sourceIp": "127.0.0.1"}},
+    "body": body,
+    "isBase64Encoded": False,
+}
+
+class Context:
+    function_name = "bench"
+
+request_ms = []
+status = None
+for _ in range(2):
+    started = time.perf_counter()
+    response = handler(dict(event), Context())
+    request_ms.append((time.perf_counter() - started) * 1000)
+    status = response["statusCode"]
+
+loaded = sorted(name for name in ("httpx", "dotenv", "app.services.llm_service") if name in sys.modules)
+print(json.dumps({"import_ms": import_ms, "first_ms": request_ms[0], "second_ms": request_ms[1], "status": status, "loaded": loaded}))
+"""
+
+
+def run_once(entry: str, method: str, path: str, body: str) -> Dict:
+    """새 프로세스에서 한 번 측정"""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, entry, method, path, body],
+        cwd=str(PROJECT_ROOT),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(values: List[float]) -> str:
+    return f"{statistics.median(values):>9.1f} {min(values):>9.1f} {max(values):>9.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버리스 진입점 콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="새 프로세스 실행 횟수")
+    parser.add_argument("--entry", default="api.index", help="import할 진입점 모듈 (handler가 없으면 app을 Mangum으로 감쌈)")
+    parser.add_argument("--method", default="GET", help="요청 메서드")
+    parser.add_argument("--path", default="/api/game/encounter-data/week/1925-01-04", help="요청 경로")
+    parser.add_argument("--body", default="", help="요청 본문 (JSON 문자열)")
+    parser.add_argument("--modules", action="store_true", help="python -X importtime으로 import 시간이 긴 모듈 출력")
+    args = parser.parse_args()
+
+    samples = [run_once(args.entry, args.method, args.path, args.body) for _ in range(args.runs)]
+
+    print(f"{args.entry} / {args.method} {args.path} (status {samples[-1]['status']}, {args.runs}회)")
+    print(f"{'':<16} {'median':>9} {'min':>9} {'max':>9}  (ms)")
+    print(f"{'import':<16} {summarize([s['import_ms'] for s in samples])}")
+    print(f"{'first request':<16} {summarize([s['first_ms'] for s in samples])}")
+    print(f"{'second request':<16} {summarize([s['second_ms'] for s in samples])}")
+    cold = [s["import_ms"] + s["first_ms"] for s in samples]
+    print(f"{'cold total':<16} {summarize(cold)}")
+    print(f"첫 요청 후 로드된 지연 import 대상: {', '.join(samples[-1]['loaded']) or '없음'}")
+
+    if args.modules:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {args.entry}"],
+            cwd=str(PROJECT_ROOT),
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        rows = []
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[1].strip().isdigit():
+                rows.append((int(parts[1]), parts[2].strip()))
+        print("\n누적 import 시간 상위 15개 (ms)")
+        for cumulative, name in sorted(rows, reverse=True)[:15]:
+            print(f"{cumulative / 1000:>9.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
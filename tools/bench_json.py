@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+1년치 세이브 데이터 JSON 직렬화/역직렬화 벤치마크
+
+365일 일일 엔트리와 52주 주간 기록이 있는 세이브 데이터를 만들어
+표준 json (기존 indent=2 형식, 공백 없는 형식)과 orjson (설치된 경우)을 비교합니다.
+
+사용 예:
+    python tools/bench_json.py --repeat 20
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services import storage_service  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STORY = (
+    "안개가 짙게 깔린 아컴의 부둣가에서 나는 검은 고양이를 쫓았다. 젖은 자갈 위로 울리는 발소리는 "
+    "내 것이 아닌 것처럼 느껴졌고, 창고 벽에 새겨진 기묘한 문양은 달빛 아래에서 꿈틀거리는 듯했다. "
+)
+
+
+def build_full_year_save(campaign_year: int = 1925, story_repeat: int = 8) -> Dict[str, Any]:
+    """1년치 플레이 기록이 있는 세이브 데이터 생성"""
+    data = storage_service.initialize_new_game(campaign_year)
+    data["campaign_history"]["prologue"]["content"] = STORY * story_repeat
+    day = date(campaign_year, 1, 1)
+    week_number = 1
+    while day.year == campaign_year:
+        is_success = day.toordinal() % 3 != 0
+        storage_service.add_daily_entry(
+            data,
+            day.strftime("%Y-%m-%d"),
+            day.strftime("%A"),
+            {"target_date": day.strftime("%Y-%m-%d"), "visual_desc": "검은 고양이", "action_type": "COMBAT", "symbols": ["COMBAT", "SEARCH"]},
+            {"black_dice_sum": 12 if is_success else 3, "is_success": is_success, "madness_triggered": not is_success, "cthulhu_symbol_count": 1},
+            STORY * story_repeat,
+            summary_line=STORY[:60]
+        )
+        if day.weekday() == 6:
+            storage_service.add_weekly_summary(
+                data, week_number, day - timedelta(days=6), day,
+                {"date": day.strftime("%Y-%m-%d"), "visual_description": "등대지기", "is_success": is_success, "main_text": STORY * story_repeat},
+                [{"date": day.strftime("%Y-%m-%d"), "target": "검은 고양이", "result": "성공" if is_success else "실패"}],
+                STORY * 2
+            )
+            week_number += 1
+        day += timedelta(days=1)
+    return data
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """repeat회 실행한 평균 시간 (ms)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세이브 데이터 JSON 코덱 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="코덱별 반복 횟수")
+    parser.add_argument("--story-repeat", type=int, default=8, help="일일 스토리 길이 배수")
+    args = parser.parse_args()
+
+    data = build_full_year_save(story_repeat=args.story_repeat)
+
+    codecs: List[tuple] = [
+        ("stdlib (indent=2)", lambda: json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"), json.loads),
+        ("stdlib (compact)", lambda: json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), json.loads),
+    ]
+    if orjson is not None:
+        codecs.append(("orjson", lambda: orjson.dumps(data), orjson.loads))
+    else:
+        print("orjson이 설치되어 있지 않아 표준 json만 측정합니다.")
+
+    print(f"{'codec':<20} {'size (KB)':>10} {'dumps (ms)':>12} {'loads (ms)':>12}")
+    for name, dumps, loads in codecs:
+        payload = dumps()
+        assert loads(payload) == data
+        dumps_ms = measure(dumps, args.repeat)
+        loads_ms = measure(lambda: loads(payload), args.repeat)
+        print(f"{name:<20} {len(payload) / 1024:>10.1f} {dumps_ms:>12.2f} {loads_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정적 자산 빌드 (번들, 압축, 매니페스트)
+
+index.html의 자산 블록(<!-- assets:css --> ... <!-- /assets:css -->,
+<!-- assets:js --> ... <!-- /assets:js -->)에 나열된 로컬 CSS/JS 파일을 순서대로 합쳐
+공백과 주석을 제거한 번들을 만들고, 내용 해시를 파일 이름에 넣어 static/dist/에 기록합니다.
+
+- static/dist/app.<hash>.css, app.<hash>.js: 번들 (+ .gz, brotli 설치 시 .br 사전 압축본)
+- static/dist/manifest.json: 번들 이름 -> 해시된 파일, 원본 목록, 크기
+- static/dist/index.html: 자산 블록을 번들 태그로 바꾼 index.html
+
+서버는 static/dist/index.html이 있으면 그 파일을 제공하고, /static/dist/의 번들은
+파일 이름이 내용에 따라 바뀌므로 immutable 캐시로 제공합니다. 빌드하지 않으면 원본 파일을 그대로 사용합니다.
+
+사용 예:
+    python tools/build_assets.py
+    python tools/build_assets.py --no-minify
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 .gz만 생성
+    brotli = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services import static_assets  # noqa: E402
+
+PROJECT_ROOT = static_assets.PROJECT_ROOT
+INDEX_HTML_PATH = PROJECT_ROOT / "index.html"
+HASH_LENGTH = 10
+
+_BLOCK_PATTERN = r"([ \t]*)<!-- assets:{kind}[^>]*-->.*?<!-- /assets:{kind} -->"
+_SCRIPT_SRC = re.compile(r"<script\s+[^>]*src=\"([^\"]+)\"[^>]*>\s*</script>")
+_STYLESHEET_HREF = re.compile(r"<link\s+[^>]*rel=\"stylesheet\"[^>]*href=\"([^\"]+)\"[^>]*>")
+
+# 이 문자 앞뒤의 공백은 의미가 없으므로 제거 (+, -, /, . 은 a - -b, 1 .toFixed 등 때문에 제외)
+_JS_PUNCTUATION = set("{}()[];,:=<>!&|?*%^~")
+# 이 문자 뒤에 오는 "/"는 나눗셈이 아니라 정규식 리터럴
+_JS_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_KEYWORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void", "throw", "instanceof", "yield", "await"}
+_CSS_PUNCTUATION = set("{};,>")
+
+
+def minify_js(source: str) -> str:
+    """
+    보수적인 JS 축소 (주석 제거, 공백 축소)
+
+    문자열, 템플릿 리터럴, 정규식 리터럴 안은 그대로 두고,
+    줄바꿈은 자동 세미콜론 삽입(ASI)에 영향을 주므로 하나로 합칠 뿐 제거하지 않습니다.
+    """
+    out: List[str] = []
+    i = 0
+    n = len(source)
+    pending_space = ""  # 코드 사이의 공백 ("", " ", "\n")
+    # 템플릿 리터럴의 ${ } 안에서 열린 중괄호 수 (중첩 템플릿마다 하나)
+    template_braces: List[int] = []
+
+    def last_significant() -> str:
+        return out[-1][-1] if out and out[-1] else ""
+
+    def last_word() -> str:
+        text = "".join(out[-3:])
+        match = re.search(r"([A-Za-z_$][\w$]*)$", text)
+        return match.group(1) if match else ""
+
+    def emit(token: str) -> None:
+        nonlocal pending_space
+        if pending_space and out:
+            previous = last_significant()
+            if pending_space == "\n":
+                out.append("\n")
+            elif previous not in _JS_PUNCTUATION and token[0] not in _JS_PUNCTUATION:
+                out.append(" ")
+        pending_space = ""
+        out.append(token)
+
+    def read_template(start: int) -> int:
+        """` 또는 }부터 다음 ` 또는 ${까지 그대로 복사하고 다음 위치 반환"""
+        j = start
+        while j < n:
+            ch = source[j]
+            if ch == "\\":
+                j += 2
+                continue
+            if ch == "`":
+                return j + 1
+            if ch == "$" and j + 1 < n and source[j + 1] == "{":
+                template_braces.append(0)
+                return j + 2
+            j += 1
+        raise ValueError("닫히지 않은 템플릿 리터럴")
+
+    while i < n:
+        ch = source[i]
+        if ch in " \t\r\n":
+            j = i
+            while j < n and source[j] in " \t\r\n":
+                j += 1
+            if out:
+                pending_space = "\n" if "\n" in source[i:j] or pending_space == "\n" else " "
+            i = j
+            continue
+        if ch == "/" and i + 1 < n and source[i + 1] == "/":
+            while i < n and source[i] != "\n":
+                i += 1
+            continue
+        if ch == "/" and i + 1 < n and source[i + 1] == "*":
+            end = source.find("*/", i + 2)
+            if end < 0:
+                raise ValueError("닫히지 않은 블록 주석")
+            if out:
+                pending_space = "\n" if "\n" in source[i:end] or pending_space == "\n" else (pending_space or " ")
+            i = end + 2
+            continue
+        if ch in "'\"":
+            j = i + 1
+            while j < n and source[j] != ch:
+                if source[j] == "\\":
+                    j += 1
+                elif source[j] == "\n":
+                    raise ValueError("닫히지 않은 문자열")
+                j += 1
+            emit(source[i:j + 1])
+            i = j + 1
+            continue
+        if ch == "`":
+            j = read_template(i + 1)
+            emit(source[i:j])
+            i = j
+            continue
+        if template_braces and ch == "{":
+            template_braces[-1] += 1
+        elif template_braces and ch == "}":
+            if template_braces[-1] == 0:
+                # 템플릿 리터럴의 ${ } 종료
+                template_braces.pop()
+                j = read_template(i + 1)
+                emit(source[i:j])
+                i = j
+                continue
+            template_braces[-1] -= 1
+        if ch == "/" and (last_significant() in _JS_REGEX_PRECEDERS or not out or last_word() in _JS_REGEX_KEYWORDS):
+            j = i + 1
+            in_class = False
+            while j < n:
+                if source[j] == "\\":
+                    j += 2
+                    continue
+                if source[j] == "[":
+                    in_class = True
+                elif source[j] == "]":
+                    in_class = False
+                elif source[j] == "/" and not in_class:
+                    break
+                elif source[j] == "\n":
+                    raise ValueError("닫히지 않은 정규식 리터럴")
+                j += 1
+            j += 1
+            while j < n and (source[j].isalpha()):
+                j += 1  # 플래그
+            emit(source[i:j])
+            i = j
+            continue
+        j = i + 1
+        if ch.isalnum() or ch in "_$":
+            while j < n and (source[j].isalnum() or source[j] in "_$"):
+                j += 1
+        emit(source[i:j])
+        i = j
+    return "".join(out).strip() + "\n"
+
+
+def minify_css(source: str) -> str:
+    """보수적인 CSS 축소 (주석 제거, 공백 축소, 블록 앞뒤 공백과 마지막 세미콜론 제거)"""
+    out: List[str] = []
+    i = 0
+    n = len(source)
+    pending_space = False
+    while i < n:
+        ch = source[i]
+        if ch in " \t\r\n":
+            pending_space = bool(out)
+            i += 1
+            continue
+        if source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            if end < 0:
+                raise ValueError("닫히지 않은 CSS 주석")
+            pending_space = pending_space or bool(out)
+            i = end + 2
+            continue
+        if ch in "'\"":
+            j = i + 1
+            while j < n and source[j] != ch:
+                if source[j] == "\\":
+                    j += 1
+                j += 1
+            token = source[i:j + 1]
+            i = j + 1
+        else:
+            token = ch
+            i += 1
+        previous = out[-1][-1] if out else ""
+        if pending_space and previous not in _CSS_PUNCTUATION and previous != ":" and token[0] not in _CSS_PUNCTUATION:
+            out.append(" ")
+        pending_space = False
+        if token == "}" and previous == ";":
+            out.pop()
+        out.append(token)
+    return "".join(out) + "\n"
+
+
+def _local_path(url: str) -> Path:
+    """/static/... URL을 프로젝트 경로로 변환"""
+    if not url.startswith("/static/"):
+        raise ValueError(f"로컬 정적 파일이 아닙니다: {url}")
+    return PROJECT_ROOT / url.lstrip("/")
+
+
+def _find_block(html: str, kind: str) -> re.Match:
+    match = re.search(_BLOCK_PATTERN.format(kind=kind), html, re.DOTALL)
+    if match is None:
+        raise SystemExit(f"index.html에 <!-- assets:{kind} --> ... <!-- /assets:{kind} --> 블록이 없습니다.")
+    return match
+
+
+def _write_bundle(name: str, content: str, sources: List[str], dist_dir: Path) -> Dict:
+    """내용 해시를 붙인 번들과 사전 압축본 기록"""
+    stem, suffix = name.rsplit(".", 1)
+    data = content.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    filename = f"{stem}.{digest}.{suffix}"
+    (dist_dir / filename).write_bytes(data)
+
+    entry = {"file": filename, "sources": sources, "size": len(data), "encodings": {}}
+    gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+    (dist_dir / f"{filename}.gz").write_bytes(gzipped)
+    entry["encodings"]["gzip"] = len(gzipped)
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        (dist_dir / f"{filename}.br").write_bytes(compressed)
+        entry["encodings"]["br"] = len(compressed)
+    return entry
+
+
+def build(dist_dir: Path, minify: bool) -> Dict:
+    """번들, 매니페스트, index.html 생성"""
+    html = INDEX_HTML_PATH.read_text(encoding="utf-8")
+    css_block = _find_block(html, "css")
+    js_block = _find_block(html, "js")
+
+    css_urls = _STYLESHEET_HREF.findall(css_block.group(0))
+    js_tags: List[Tuple[str, bool]] = [(url, url.startswith("/static/")) for url in _SCRIPT_SRC.findall(js_block.group(0))]
+    external_scripts = [url for url, is_local in js_tags if not is_local]
+    js_urls = [url for url, is_local in js_tags if is_local]
+    # 외부 스크립트(CDN)는 번들 앞에 그대로 두므로 로컬 스크립트보다 뒤에 있으면 실행 순서가 바뀜
+    first_local = next((index for index, (_, is_local) in enumerate(js_tags) if is_local), len(js_tags))
+    if any(not is_local for _, is_local in js_tags[first_local:]):
+        raise SystemExit("assets:js 블록에서 외부 스크립트는 로컬 스크립트보다 앞에 있어야 합니다.")
+
+    css_parts = [_local_path(url).read_text(encoding="utf-8") for url in css_urls]
+    js_parts = [_local_path(url).read_text(encoding="utf-8") for url in js_urls]
+    if minify:
+        css_content = "".join(minify_css(part) for part in css_parts)
+        js_content = "".join(f";{minify_js(part)}" for part in js_parts)
+    else:
+        css_content = "\n".join(css_parts)
+        # 파일 경계에서 앞 파일의 마지막 문장이 다음 파일과 이어지지 않도록 세미콜론 추가
+        js_content = "".join(f"/* {url} */\n;{part}\n" for url, part in zip(js_urls, js_parts))
+
+    dist_dir.mkdir(parents=True, exist_ok=True)
+    bundles = {
+        "app.css": _write_bundle("app.css", css_content, css_urls, dist_dir),
+        "app.js": _write_bundle("app.js", js_content, js_urls, dist_dir),
+    }
+
+    indent = css_block.group(1)
+    css_tag = f'{indent}<link rel="stylesheet" href="{static_assets.DIST_URL_PREFIX}{bundles["app.css"]["file"]}">'
+    indent = js_block.group(1)
+    js_tags_html = [f'{indent}<script src="{url}"></script>' for url in external_scripts]
+    js_tags_html.append(f'{indent}<script src="{static_assets.DIST_URL_PREFIX}{bundles["app.js"]["file"]}"></script>')
+    rendered = html[:css_block.start()] + css_tag + html[css_block.end():js_block.start()] + "\n".join(js_tags_html) + html[js_block.end():]
+    (dist_dir / "index.html").write_text(rendered, encoding="utf-8")
+
+    manifest = {"version": static_assets.MANIFEST_VERSION, "minified": minify, "bundles": bundles}
+    (dist_dir / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    # 이전 빌드의 번들 정리
+    keep = {"index.html", "manifest.json"}
+    for entry in bundles.values():
+        keep.add(entry["file"])
+        keep.update(f"{entry['file']}.{static_assets.ENCODING_SUFFIXES[encoding]}" for encoding in entry["encodings"])
+    for path in dist_dir.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정적 자산 번들 빌드")
+    parser.add_argument("--out", default=str(static_assets.DIST_DIR), help="출력 디렉토리")
+    parser.add_argument("--no-minify", action="store_true", help="축소하지 않고 합치기만 함")
+    args = parser.parse_args()
+
+    manifest = build(Path(args.out), minify=not args.no_minify)
+    if brotli is None:
+        print("brotli가 설치되어 있지 않아 .br 사전 압축본은 만들지 않습니다. (pip install brotli)")
+    for name, entry in manifest["bundles"].items():
+        sizes = ", ".join(f"{encoding} {size / 1024:.1f}KB" for encoding, size in entry["encodings"].items())
+        print(f"{name} -> {entry['file']}: {len(entry['sources'])}개 파일, {entry['size'] / 1024:.1f}KB ({sizes})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+엔드투엔드 부하 테스트 (1년치 캠페인 재생)
+
+캠페인마다 /api/game/start로 시작해 하루씩 /api/game/encounter를 호출하고,
+달이 바뀔 때마다 /api/game/month-conclusion과 /api/game/month-end를 호출합니다.
+엔드포인트별 p50/p95/p99 지연 시간과 초당 요청 수를 출력합니다.
+
+사용 예 (tools/mock_mistral.py와 함께 오프라인으로 실행):
+    python tools/mock_mistral.py --port 8100 &
+    MISTRAL_API_KEY=mock MISTRAL_API_URL=http://127.0.0.1:8100/v1/chat/completions \\
+        uvicorn app.main:app --port 8000 &
+    python tools/load_test.py --base-url http://127.0.0.1:8000 --campaigns 8 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+
+import httpx
+
+
+SYMBOLS = ["COMBAT", "INVESTIGATION", "SEARCH"]
+VISUAL_DESCRIPTIONS = ["검은 고양이", "총을 든 노파", "젖은 발자국", "낡은 등대", "속삭이는 우물"]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값에서 nearest-rank 방식의 백분위수 계산"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LoadStats:
+    """엔드포인트별 지연 시간 및 실패 수 수집"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, elapsed_ms: float, ok: bool) -> None:
+        self.latencies[endpoint].append(elapsed_ms)
+        if not ok:
+            self.failures[endpoint] += 1
+
+    def total_requests(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+    def report(self, wall_seconds: float) -> Dict[str, Any]:
+        """엔드포인트별 요약 통계"""
+        endpoints = {}
+        all_values = []
+        for endpoint, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            all_values.extend(values)
+            endpoints[endpoint] = {
+                "count": len(ordered),
+                "failures": self.failures.get(endpoint, 0),
+                "p50_ms": round(percentile(ordered, 50), 1),
+                "p95_ms": round(percentile(ordered, 95), 1),
+                "p99_ms": round(percentile(ordered, 99), 1),
+                "max_ms": round(ordered[-1], 1) if ordered else 0.0
+            }
+        all_values.sort()
+        total = len(all_values)
+        return {
+            "wall_seconds": round(wall_seconds, 2),
+            "requests": total,
+            "failures": sum(self.failures.values()),
+            "requests_per_sec": round(total / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+            "p50_ms": round(percentile(all_values, 50), 1),
+            "p95_ms": round(percentile(all_values, 95), 1),
+            "p99_ms": round(percentile(all_values, 99), 1),
+            "endpoints": endpoints
+        }
+
+
+async def _post(
+    client: httpx.AsyncClient,
+    stats: LoadStats,
+    endpoint: str,
+    body: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """POST 요청 후 지연 시간 기록 (실패 시 None)"""
+    started = time.perf_counter()
+    try:
+        response = await client.post(endpoint, json=body)
+        ok = response.status_code == 200
+    except httpx.HTTPError as e:
+        print(f"요청 실패 {endpoint}: {e}")
+        response = None
+        ok = False
+    stats.record(endpoint, (time.perf_counter() - started) * 1000, ok)
+    if not ok:
+        if response is not None:
+            print(f"요청 실패 {endpoint}: {response.status_code} {response.text[:200]}")
+        return None
+    return response.json()
+
+
+def _make_encounter_body(today: str, game_data: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    """무작위 주사위 결과로 조우 요청 본문 생성"""
+    required_symbol = rng.choice(SYMBOLS)
+    return {
+        "target_date": today,
+        "visual_description": rng.choice(VISUAL_DESCRIPTIONS),
+        "required_symbol": required_symbol,
+        "base_difficulty": rng.randint(6, 14),
+        "black_dice_sum": rng.randint(3, 18),
+        "green_dice_symbols": [rng.choice(SYMBOLS), rng.choice(SYMBOLS)],
+        "cthulhu_symbol_count": rng.choice([0, 0, 0, 1, 1, 2]),
+        "game_data": game_data
+    }
+
+
+async def run_campaign(
+    client: httpx.AsyncClient,
+    stats: LoadStats,
+    days: int,
+    seed: int
+) -> None:
+    """캠페인 하나를 days일 동안 진행"""
+    rng = random.Random(seed)
+    result = await _post(client, stats, "/api/game/start", {"player_name": f"load-{seed}"})
+    if result is None:
+        return
+    game_data = result["game_data"]
+
+    for _ in range(days):
+        today = game_data["current_state"]["today_date"]
+        result = await _post(client, stats, "/api/game/encounter", _make_encounter_body(today, game_data, rng))
+        if result is None:
+            return
+        game_data = result["game_data"]
+
+        # 달이 바뀌면 지난달 결산
+        previous = datetime.strptime(today, "%Y-%m-%d").date()
+        current = datetime.strptime(game_data["current_state"]["today_date"], "%Y-%m-%d").date()
+        if current.month != previous.month:
+            result = await _post(client, stats, "/api/game/month-conclusion", {
+                "month": previous.strftime("%B"),
+                "game_data": game_data
+            })
+            if result is None:
+                return
+            game_data = result["game_data"]
+
+            result = await _post(client, stats, "/api/game/month-end", {"game_data": game_data})
+            if result is None:
+                return
+            game_data = result["game_data"]
+        if current.year != previous.year:
+            break
+
+
+async def run_load_test(
+    base_url: str,
+    campaigns: int,
+    concurrency: int,
+    days: int,
+    timeout: float,
+    seed: int
+) -> Dict[str, Any]:
+    """campaigns개의 캠페인을 최대 concurrency개씩 동시에 진행"""
+    stats = LoadStats()
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def worker(index: int):
+            async with semaphore:
+                await run_campaign(client, stats, days, seed + index)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(campaigns)))
+        wall_seconds = time.perf_counter() - started
+
+    return stats.report(wall_seconds)
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """부하 테스트 결과 표 출력"""
+    print(f"\n총 {report['requests']}건 / {report['wall_seconds']}초 "
+          f"({report['requests_per_sec']} req/s, 실패 {report['failures']}건)")
+    print(f"전체 p50={report['p50_ms']}ms p95={report['p95_ms']}ms p99={report['p99_ms']}ms\n")
+    print(f"{'endpoint':<32}{'count':>7}{'fail':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for endpoint, row in report["endpoints"].items():
+        print(f"{endpoint:<32}{row['count']:>7}{row['failures']:>6}"
+              f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캠페인 재생 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--campaigns", type=int, default=4, help="진행할 캠페인 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 진행할 캠페인 수")
+    parser.add_argument("--days", type=int, default=365, help="캠페인당 진행 일수")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=1926, help="주사위 난수 시드")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(
+        args.base_url, args.campaigns, args.concurrency, args.days, args.timeout, args.seed
+    ))
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
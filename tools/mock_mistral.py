@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 Mistral API 대역 서버 (부하 테스트용, 오프라인 동작)
+
+/v1/chat/completions 프로토콜(스트리밍 포함)을 흉내 내며 지연 시간, 토큰 생성 속도,
+오류 비율을 설정할 수 있습니다.
+
+사용 예:
+    python tools/mock_mistral.py --port 8100 --latency 0.3 --tokens-per-sec 80 --error-rate 0.02
+
+    # 게임 서버를 대역 서버로 연결
+    MISTRAL_API_KEY=mock MISTRAL_API_URL=http://127.0.0.1:8100/v1/chat/completions \\
+        uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+# 응답 본문 생성용 문장 (1926년 아컴 일기 분위기)
+FILLER_SENTENCES = [
+    "안개가 미스캐토닉 강 위로 낮게 깔려 있었다.",
+    "나는 낡은 수첩에 오늘 본 것을 적어 내려갔다.",
+    "골목 끝에서 누군가 나를 지켜보는 듯한 기척이 느껴졌다.",
+    "가스등 불빛이 젖은 돌바닥 위에서 흔들렸다.",
+    "그 문양은 어젯밤 꿈속에서 본 것과 똑같았다.",
+    "도서관의 서가 사이로 오래된 종이 냄새가 스며들었다.",
+    "멀리서 들려오는 종소리가 자정을 알렸다.",
+    "나는 권총의 무게를 확인하고 코트 깃을 세웠다.",
+]
+
+
+class MockSettings:
+    """대역 서버 동작 설정"""
+
+    def __init__(
+        self,
+        latency: float = 0.3,
+        jitter: float = 0.1,
+        tokens_per_sec: float = 80.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        max_reply_tokens: int = 400
+    ):
+        self.latency = latency  # 첫 바이트까지 지연 (초)
+        self.jitter = jitter  # 지연 시간 무작위 편차 (초)
+        self.tokens_per_sec = tokens_per_sec  # 토큰 생성 속도 (0이면 즉시)
+        self.error_rate = error_rate  # 503 응답 비율
+        self.rate_limit_rate = rate_limit_rate  # 429 응답 비율
+        self.max_reply_tokens = max_reply_tokens  # 응답 최대 토큰 수 (요청 max_tokens와 비교해 작은 값)
+
+
+def _make_tokens(count: int) -> list:
+    """count개의 토큰(어절 단위)으로 된 응답 텍스트 생성"""
+    words = []
+    while len(words) < count:
+        words.extend(random.choice(FILLER_SENTENCES).split(" "))
+    return [word + " " for word in words[:count]]
+
+
+def create_app(settings: MockSettings) -> FastAPI:
+    """대역 서버 FastAPI 앱 생성"""
+    app = FastAPI(title="Mock Mistral API")
+    counters = {"requests": 0, "streams": 0, "errors": 0, "rate_limited": 0}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        counters["requests"] += 1
+
+        roll = random.random()
+        if roll < settings.rate_limit_rate:
+            counters["rate_limited"] += 1
+            return JSONResponse(
+                status_code=429,
+                content={"message": "Requests rate limit exceeded"},
+                headers={"Retry-After": "1"}
+            )
+        if roll < settings.rate_limit_rate + settings.error_rate:
+            counters["errors"] += 1
+            return JSONResponse(status_code=503, content={"message": "Service unavailable"})
+
+        await asyncio.sleep(max(0.0, settings.latency + random.uniform(-settings.jitter, settings.jitter)))
+
+        token_count = max(1, min(int(payload.get("max_tokens", 256)), settings.max_reply_tokens))
+        tokens = _make_tokens(random.randint(max(1, token_count // 2), token_count))
+        completion_id = f"cmpl-{uuid.uuid4().hex}"
+        model = payload.get("model", "mock-model")
+        created = int(time.time())
+        token_delay = 1.0 / settings.tokens_per_sec if settings.tokens_per_sec > 0 else 0.0
+
+        if payload.get("stream"):
+            counters["streams"] += 1
+
+            async def event_stream():
+                for token in tokens:
+                    if token_delay:
+                        await asyncio.sleep(token_delay)
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]
+                    }
+                    yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+        # 비스트리밍 응답은 전체 토큰 생성 시간만큼 대기
+        if token_delay:
+            await asyncio.sleep(token_delay * len(tokens))
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(tokens).strip()},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)}
+        }
+
+    @app.get("/stats")
+    async def stats():
+        """대역 서버 요청 카운터"""
+        return counters
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Mistral API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", type=float, default=0.3, help="첫 바이트까지 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.1, help="지연 시간 무작위 편차 (초)")
+    parser.add_argument("--tokens-per-sec", type=float, default=80.0, help="토큰 생성 속도 (0이면 즉시)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--max-reply-tokens", type=int, default=400, help="응답 최대 토큰 수")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    settings = MockSettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        tokens_per_sec=args.tokens_per_sec,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        max_reply_tokens=args.max_reply_tokens
+    )
+    print(f"Mock Mistral API: http://{args.host}:{args.port}/v1/chat/completions")
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
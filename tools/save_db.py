@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON 세이브 파일 <-> SQLite 저장소 변환
+
+기존 data/save_game.json을 SQLite 저장소(STORAGE_BACKEND=sqlite)로 옮기거나,
+SQLite에 저장된 캠페인을 기존 JSON 세이브 형식으로 내보냅니다.
+
+사용 예:
+    python tools/save_db.py import data/save_game.json --campaign default
+    python tools/save_db.py export backup.json --campaign default
+    python tools/save_db.py list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.sqlite_storage import SQLiteStorage  # noqa: E402
+from app.services.storage_service import STORAGE_SQLITE_PATH, DEFAULT_CAMPAIGN_ID  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 세이브 파일과 SQLite 저장소 변환")
+    parser.add_argument("--db", default=str(STORAGE_SQLITE_PATH), help="SQLite 데이터베이스 경로")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="JSON 세이브 파일을 SQLite로 가져오기")
+    import_parser.add_argument("path", help="JSON 세이브 파일 경로")
+    import_parser.add_argument("--campaign", default=DEFAULT_CAMPAIGN_ID, help="캠페인 ID")
+
+    export_parser = subparsers.add_parser("export", help="SQLite 캠페인을 JSON 세이브 파일로 내보내기")
+    export_parser.add_argument("path", help="출력 JSON 파일 경로")
+    export_parser.add_argument("--campaign", default=DEFAULT_CAMPAIGN_ID, help="캠페인 ID")
+
+    subparsers.add_parser("list", help="저장된 캠페인 ID 목록")
+    args = parser.parse_args()
+
+    storage = SQLiteStorage(Path(args.db))
+    try:
+        if args.command == "import":
+            rows = storage.import_json(args.campaign, Path(args.path))
+            print(f"{args.path} -> {args.db} ({args.campaign}, {rows}행 기록)")
+        elif args.command == "export":
+            if not storage.export_json(args.campaign, Path(args.path)):
+                print(f"캠페인을 찾을 수 없습니다: {args.campaign}", file=sys.stderr)
+                sys.exit(1)
+            print(f"{args.db} ({args.campaign}) -> {args.path}")
+        else:
+            for campaign_id in storage.list_ids():
+                print(campaign_id)
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()